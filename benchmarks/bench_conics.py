@@ -0,0 +1,62 @@
+"""
+Масштабирование построения окружности и эллипса с ростом радиуса.
+
+Для каждого режима выводится время построения, время на пиксель и показатель
+степени k в зависимости time ~ radius^k (k ≈ 1 -- линейный рост). В режимах с
+отсечением видимое окно 100x100 не зависит от радиуса, и ожидается k ≈ 0.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_conics
+"""
+import time
+
+import numpy as np
+
+from src.drawing_algorithms.conic_sections.circle import draw_circle
+from src.drawing_algorithms.conic_sections.ellipse import draw_ellipse
+
+RADII = [10, 100, 1000, 10000, 100000]
+
+MODES = {
+    "circle": lambda r: draw_circle(0, 0, r),
+    "circle array": lambda r: draw_circle(0, 0, r, as_array=True),
+    "circle ordered": lambda r: draw_circle(0, 0, r, ordered=True, as_array=True),
+    "ellipse": lambda r: draw_ellipse((-r, -r // 2), (r, r // 2)),
+    "ellipse array": lambda r: draw_ellipse((-r, -r // 2), (r, r // 2), as_array=True),
+    "ellipse ordered": lambda r: draw_ellipse((-r, -r // 2), (r, r // 2), ordered=True, as_array=True),
+    "circle clipped": lambda r: draw_circle(0, 0, r, clip=(-50, -r - 50, 50, -r + 50)),
+    "ellipse clipped": lambda r: draw_ellipse((-r, -r // 2), (r, r // 2), clip=(r - 50, -50, r + 50, 50)),
+}
+
+
+def measure(function, *args, repeat=3):
+    """Возвращает наименьшее из repeat времён выполнения функции в секундах и её результат."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def scaling_exponent(sizes, times):
+    """Показатель степени k по методу наименьших квадратов в логарифмическом масштабе."""
+    return np.polyfit(np.log(sizes), np.log(times), 1)[0]
+
+
+def main(radii=RADII):
+    print(f"{'mode':<16} {'radius':>8} {'pixels':>9} {'time, ms':>10} {'ns/pixel':>9}")
+    for name, function in MODES.items():
+        times = []
+        for radius in radii:
+            elapsed, pixels = measure(function, radius)
+            times.append(elapsed)
+            print(f"{name:<16} {radius:>8} {len(pixels):>9} {elapsed * 1e3:>10.2f} {elapsed / len(pixels) * 1e9:>9.0f}")
+        # Малые радиусы не учитываются: их время определяется постоянными накладными расходами
+        exponent = scaling_exponent(radii[2:], times[2:])
+        print(f"{name:<16} time ~ radius^{exponent:.2f}\n")
+
+
+if __name__ == "__main__":
+    main()
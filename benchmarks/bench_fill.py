@@ -0,0 +1,69 @@
+"""
+Векторизованная заливка NumPy в сравнении с fill_active_edge.
+
+Для правильных и звёздчатых многоугольников разного радиуса замеряются:
+fill_active_edge (точки), active_edge_spans (спаны), polygon_spans по правилам
+even-odd и nonzero и fill_polygon прямо в RGBA-буфер холста. Выводится время
+и ускорение относительно fill_active_edge, а также совпадение спанов even-odd
+со спанами edge_list_spans (то же правило перевода пересечений в целые x;
+fill_active_edge их округляет, поэтому его пиксели по краям немного отличаются).
+Для спанов число пикселей считается с повторами на стыках касающихся спанов,
+fill_polygon возвращает число закрашенных пикселей без повторов.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_fill
+"""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmarks.bench_suite import measure, regular_polygon, star_polygon
+from polygon.fill_algorithms import EVEN_ODD, NONZERO, fill_active_edge, fill_polygon, polygon_spans, \
+    span_pixel_count
+from polygon.fill_algorithms.active_edge import active_edge_spans
+from polygon.fill_algorithms.edge_list import edge_list_spans
+from src.raster.surface import BACKGROUND
+
+RADII = [32, 128, 512, 2048]
+SHAPES = {
+    "regular 64": lambda radius: regular_polygon(64, radius),
+    "star 256": lambda radius: star_polygon(256, radius),
+}
+COLOR = (0, 0, 255, 255)
+
+
+def canvas_fill(vertices, rule):
+    """Заливка в RGBA-буфер размера охватывающего прямоугольника многоугольника."""
+    size = max(max(x, y) for x, y in vertices) + 1
+    canvas = np.full((size, size, 4), BACKGROUND, dtype=np.uint8)
+    return lambda: fill_polygon(canvas, vertices, COLOR, rule)
+
+
+def main():
+    print(f"{'shape':<11} {'radius':>6} {'method':<26} {'pixels':>9} {'time, ms':>10} {'speedup':>8}")
+    for shape, make in SHAPES.items():
+        for radius in RADII:
+            vertices = make(radius)
+            polygon = SimpleNamespace(vertices=vertices)
+            methods = [
+                ("fill_active_edge", lambda: fill_active_edge(polygon), len),
+                ("active_edge_spans", lambda: active_edge_spans(polygon), span_pixel_count),
+                ("polygon_spans evenodd", lambda: polygon_spans(vertices, EVEN_ODD), span_pixel_count),
+                ("polygon_spans nonzero", lambda: polygon_spans(vertices, NONZERO), span_pixel_count),
+                ("fill_polygon RGBA", canvas_fill(vertices, EVEN_ODD), int),
+            ]
+            reference = None
+            for name, function, count in methods:
+                seconds, result = measure(function)
+                reference = reference or seconds
+                print(f"{shape:<11} {radius:>6} {name:<26} {count(result):>9} {seconds * 1e3:>10.2f} "
+                      f"{reference / seconds:>8.1f}")
+            same = np.array_equal(polygon_spans(vertices, EVEN_ODD), edge_list_spans(polygon))
+            print(f"{shape:<11} {radius:>6} even-odd == edge_list_spans: {same}\n")
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    main()
+    print(f"Всего: {time.perf_counter() - start:.1f} с")
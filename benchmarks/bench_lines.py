@@ -0,0 +1,42 @@
+"""
+Сравнение пропускной способности скалярных и пакетных алгоритмов отрезков.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_lines
+"""
+import time
+
+import numpy as np
+
+from src.drawing_algorithms.lines.batch import bresenham_lines, dda_lines, wu_lines, reference_lines
+
+BATCH = {
+    "bresenham": bresenham_lines,
+    "dda": dda_lines,
+    "wu": wu_lines,
+}
+
+
+def measure(function, *args):
+    """Возвращает время выполнения функции в секундах и её результат."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(count=5000, length=500, seed=0):
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, 4000, (count, 2))
+    segments = np.stack([starts, starts + rng.integers(-length, length + 1, (count, 2))], axis=1)
+
+    print(f"{'algorithm':<10} {'pixels':>10} {'scalar px/s':>14} {'batch px/s':>14} {'speedup':>8}")
+    for name, batch in BATCH.items():
+        scalar_time, (_, offsets) = measure(reference_lines, name, segments)
+        batch_time, _ = measure(batch, segments)
+        pixels = offsets[-1]
+        print(f"{name:<10} {pixels:>10} {pixels / scalar_time:>14.0f} {pixels / batch_time:>14.0f} "
+              f"{scalar_time / batch_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
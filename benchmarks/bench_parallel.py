@@ -0,0 +1,57 @@
+"""
+Масштабирование параллельной растеризации с количеством процессов.
+
+Набор из 100 000 отрезков растеризуется и накладывается на холст через
+ParallelRasterizer с разным числом исполнителей (0 -- те же части в текущем процессе);
+для каждого варианта выводится время, ускорение относительно текущего процесса и
+совпадение холста с результатом rasterize_shapes для всех отрезков сразу.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_parallel
+"""
+import os
+import time
+
+import numpy as np
+
+from src.drawing_algorithms.parallel import ParallelRasterizer, rasterize_shapes
+from src.raster.compositing import composite_pixels
+from src.raster.surface import BACKGROUND
+
+LINE_COUNT = 100_000
+CANVAS_SIZE = 2048
+
+
+def make_lines(count=LINE_COUNT, size=CANVAS_SIZE, seed=0):
+    """Случайные отрезки длиной до 64 пикселей, по трети на каждый алгоритм."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, size, (count, 2))
+    ends = np.clip(starts + rng.integers(-64, 65, (count, 2)), 0, size - 1)
+    ends[(ends == starts).all(axis=1), 0] ^= 1
+    algorithms = ["bresenham", "dda", "wu"]
+    return [(algorithms[i * 3 // count], (tuple(start), tuple(end)))
+            for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist()))]
+
+
+def main(count=LINE_COUNT):
+    shapes = make_lines(count)
+    canvas = np.full((CANVAS_SIZE, CANVAS_SIZE, 4), BACKGROUND, dtype=np.uint8)
+
+    pixels, _ = rasterize_shapes(shapes)
+    composite_pixels(canvas, pixels)
+
+    print(f"{'workers':>8} {'time, s':>9} {'speedup':>8} {'Mpx/s':>7}  same")
+    serial = None
+    for workers in [0] + [2 ** k for k in range((os.cpu_count() or 1).bit_length())]:
+        target = np.full_like(canvas, BACKGROUND)
+        with ParallelRasterizer(workers) as rasterizer:
+            start = time.perf_counter()
+            rasterizer.render(target, shapes)
+            elapsed = time.perf_counter() - start
+        serial = serial or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {serial / elapsed:>8.2f} {len(pixels) / elapsed / 1e6:>7.1f}  "
+              f"{np.array_equal(target, canvas)}")
+
+
+if __name__ == "__main__":
+    main()
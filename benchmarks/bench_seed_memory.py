@@ -0,0 +1,78 @@
+"""
+Пиковая память заливок с затравкой.
+
+Для правильного многоугольника, вписанного в квадрат size x size, через
+tracemalloc (учитывает и массивы NumPy) замеряется пиковая память и время:
+simple_seed_mask и scanline_seed_spans (растр посещённых пикселей, результат --
+маска или спаны) и, для сравнения, fill_scanline_seed, разворачивающий спаны
+в список кортежей (x, y), как прежде возвращали все заливки с затравкой.
+Пиковая память выводится в байтах на пиксель охватывающего прямоугольника;
+для маски и спанов она не должна превышать MAX_BYTES_PER_PIXEL. Время замеряется
+отдельным запуском без tracemalloc: под ним каждое создание объекта int
+отслеживается, и попиксельный цикл simple_seed замедляется в десятки раз.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_seed_memory
+    python -m benchmarks.bench_seed_memory --size 4000
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks.bench_suite import regular_polygon
+from polygon.fill_algorithms import fill_scanline_seed, scanline_seed_spans, simple_seed_mask, span_pixel_count
+
+SIZES = [250, 500, 1000]
+
+# Граница пиковой памяти для растровых вариантов: растр границы и посещённых пикселей,
+# маска результата (по байту) и стек simple_seed (до 4 байт на пиксель) с запасом
+MAX_BYTES_PER_PIXEL = 12
+
+METHODS = [
+    ("simple_seed_mask", lambda polygon: simple_seed_mask(polygon)[0].sum(), True),
+    ("scanline_seed_spans", lambda polygon: span_pixel_count(scanline_seed_spans(polygon)), True),
+    ("fill_scanline_seed", lambda polygon: len(fill_scanline_seed(polygon)), False),
+]
+
+
+def measure_peak(function, *args):
+    """Время, пиковая память (в байтах) и результат вызова function(*args)."""
+    start = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пиковая память заливок с затравкой")
+    parser.add_argument("--size", type=int, action="append", help="размер многоугольника (можно несколько раз)")
+    args = parser.parse_args(argv)
+
+    exceeded = []
+    print(f"{'method':<22} {'size':>6} {'pixels':>10} {'time, s':>8} {'peak, MB':>9} {'B/px':>7}")
+    for size in args.size or SIZES:
+        radius = (size - 1) // 2
+        polygon = SimpleNamespace(vertices=regular_polygon(64, radius))
+        area = (2 * radius + 1) ** 2
+        for name, function, bounded in METHODS:
+            elapsed, peak, pixels = measure_peak(function, polygon)
+            ratio = peak / area
+            mark = ""
+            if bounded and ratio > MAX_BYTES_PER_PIXEL:
+                mark = "EXCEEDED"
+                exceeded.append(f"{name} size={size}: {ratio:.1f} B/px")
+            print(f"{name:<22} {size:>6} {int(pixels):>10} {elapsed:>8.2f} {peak / 2 ** 20:>9.1f} {ratio:>7.2f}  {mark}")
+        print()
+    for message in exceeded:
+        print(f"Превышена граница памяти: {message}", file=sys.stderr)
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Набор микробенчмарков всех алгоритмов растеризации и заливки.
+
+Каждый случай -- алгоритм и параметр, значения которого перебираются по ряду:
+длина отрезка, радиус, размер кривой, число вершин или радиус многоугольника.
+Для каждого значения выводится число пикселей, время и пропускная способность,
+для случая -- показатель степени k в зависимости time ~ parameter^k
+(k ≈ 1 -- рост по длине контура, k ≈ 2 -- по площади).
+
+Результаты можно сохранить как опорные (JSON) и сравнить с ними следующий запуск:
+отмечаются значения, где пропускная способность упала больше чем на threshold,
+и случаи, где показатель степени вырос больше чем на EXPONENT_TOLERANCE. При
+найденных регрессиях код возврата -- 1.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_suite --save baseline.json
+    python -m benchmarks.bench_suite --compare baseline.json --threshold 0.25
+    python -m benchmarks.bench_suite --filter fill --quick
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+
+from polygon.fill_algorithms import FILL_ALGORITHMS, SPAN_FILL_ALGORITHMS, span_pixel_count
+from src.drawing_algorithms.conic_sections.circle import draw_circle
+from src.drawing_algorithms.conic_sections.ellipse import draw_ellipse
+from src.drawing_algorithms.conic_sections.hyperbola import draw_hyperbola
+from src.drawing_algorithms.conic_sections.parabola import draw_parabola
+from src.drawing_algorithms.curves.b_spline import draw_b_spline
+from src.drawing_algorithms.curves.bezier import draw_bezier_curve
+from src.drawing_algorithms.curves.hermite import draw_hermite_curve
+from src.drawing_algorithms.lines.bresenham import bresenham_line
+from src.drawing_algorithms.lines.dda import dda_line
+from src.drawing_algorithms.lines.wu import wu_line
+
+# Ряды значений параметров
+LENGTHS = [64, 256, 1024, 4096, 16384]
+RADII = [16, 64, 256, 1024, 4096]
+CURVE_SIZES = [16, 64, 256, 1024, 4096]
+VERTEX_COUNTS = [4, 16, 64, 256]
+FILL_RADII = [8, 16, 32, 64, 128]
+
+# Радиус многоугольника при переборе числа вершин
+VERTEX_SWEEP_RADIUS = 48
+
+# Замер повторяется, пока суммарное время меньше MIN_TIME, но не больше MAX_REPEAT раз
+MIN_TIME = 0.2
+MAX_REPEAT = 5
+
+# Допустимый рост показателя степени относительно опорного
+EXPONENT_TOLERANCE = 0.25
+
+# Допустимое падение пропускной способности по умолчанию
+DEFAULT_THRESHOLD = 0.25
+
+# make(value) возвращает функцию без аргументов, строящую пиксели (подготовка данных не замеряется),
+# count(result) -- число пикселей в её результате
+Case = namedtuple("Case", ["name", "parameter", "values", "make", "count"], defaults=[len])
+
+
+def regular_polygon(count, radius):
+    """Правильный многоугольник с центром (radius + 1, radius + 1)."""
+    return [(round(radius + 1 + radius * math.cos(2 * math.pi * i / count)),
+             round(radius + 1 + radius * math.sin(2 * math.pi * i / count))) for i in range(count)]
+
+
+def star_polygon(count, radius):
+    """Невыпуклый звёздчатый многоугольник из count вершин (внутренний радиус -- 0.6 внешнего)."""
+    return [(round(radius + 1 + radius * (1 if i % 2 == 0 else 0.6) * math.cos(2 * math.pi * i / count)),
+             round(radius + 1 + radius * (1 if i % 2 == 0 else 0.6) * math.sin(2 * math.pi * i / count)))
+            for i in range(count)]
+
+
+def fill_case(algorithm, vertices, algorithms=FILL_ALGORITHMS):
+    polygon = SimpleNamespace(vertices=vertices)
+    return lambda: algorithms[algorithm](polygon)
+
+
+def build_cases():
+    """Все случаи набора в порядке вывода."""
+    cases = [
+        # Отрезок с наклоном около 20 градусов заданной длины
+        Case("bresenham_line", "length", LENGTHS,
+             lambda n: lambda: bresenham_line((0, 0), (round(n * 0.94), round(n * 0.34)))),
+        Case("dda_line", "length", LENGTHS,
+             lambda n: lambda: dda_line((0, 0), (round(n * 0.94), round(n * 0.34)))),
+        Case("wu_line", "length", LENGTHS,
+             lambda n: lambda: wu_line((0, 0), (round(n * 0.94), round(n * 0.34)))),
+        Case("draw_circle", "radius", RADII, lambda r: lambda: draw_circle(0, 0, r)),
+        Case("draw_ellipse", "radius", RADII, lambda r: lambda: draw_ellipse((-r, -r // 2), (r, r // 2))),
+        Case("draw_parabola", "radius", RADII, lambda r: lambda: draw_parabola((0, 0), (r, r))),
+        Case("draw_hyperbola", "radius", RADII, lambda r: lambda: draw_hyperbola((0, 0), (r, r // 2))),
+        Case("draw_bezier_curve", "size", CURVE_SIZES,
+             lambda s: lambda: draw_bezier_curve((0, 0), (s // 3, s), (2 * s // 3, 0), (s, s))),
+        Case("draw_b_spline", "size", CURVE_SIZES,
+             lambda s: lambda: draw_b_spline((0, 0), (s // 3, s), (2 * s // 3, 0), (s, s))),
+        Case("draw_hermite_curve", "size", CURVE_SIZES,
+             lambda s: lambda: draw_hermite_curve((0, 0), (s, 0), (s, s), (s, -s))),
+    ]
+    for algorithm in FILL_ALGORITHMS:
+        cases.append(Case(f"fill {algorithm} area", "radius", FILL_RADII,
+                          lambda r, algorithm=algorithm: fill_case(algorithm, regular_polygon(8, r))))
+        cases.append(Case(f"fill {algorithm} vertices", "vertices", VERTEX_COUNTS,
+                          lambda n, algorithm=algorithm: fill_case(algorithm,
+                                                                   star_polygon(n, VERTEX_SWEEP_RADIUS))))
+    # Те же алгоритмы без разворачивания спанов в точки
+    for algorithm in SPAN_FILL_ALGORITHMS:
+        cases.append(Case(f"fill {algorithm} spans", "radius", FILL_RADII,
+                          lambda r, algorithm=algorithm: fill_case(algorithm, regular_polygon(8, r),
+                                                                   SPAN_FILL_ALGORITHMS),
+                          span_pixel_count))
+    return cases
+
+
+def measure(function, min_time=MIN_TIME, max_repeat=MAX_REPEAT):
+    """Возвращает наименьшее время выполнения функции в секундах и её результат."""
+    best, total, repeat = None, 0.0, 0
+    while repeat < max_repeat and (repeat == 0 or total < min_time):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        total += elapsed
+        repeat += 1
+    return best, result
+
+
+def scaling_exponent(sizes, times):
+    """Показатель степени k по методу наименьших квадратов в логарифмическом масштабе."""
+    # Малые значения не учитываются: их время определяется постоянными накладными расходами
+    if len(sizes) >= 4:
+        sizes, times = list(sizes)[2:], list(times)[2:]
+    return float(np.polyfit(np.log(sizes), np.log(times), 1)[0])
+
+
+def run_case(case, values):
+    """
+    Замеряет случай на ряде значений параметра.
+
+    :return: Словарь {"parameter", "exponent", "results": [{"value", "pixels", "seconds"}, ...]}.
+    """
+    results = []
+    for value in values:
+        seconds, pixels = measure(case.make(value))
+        results.append({"value": value, "pixels": case.count(pixels), "seconds": seconds})
+        print(f"{case.name:<28} {case.parameter:>8}={value:<6} {results[-1]['pixels']:>9} {seconds * 1e3:>10.2f} "
+              f"{rate(results[-1]) / 1e6:>8.2f}")
+    exponent = scaling_exponent(values, [result["seconds"] for result in results])
+    print(f"{case.name:<28} time ~ {case.parameter}^{exponent:.2f}\n")
+    return {"parameter": case.parameter, "exponent": exponent, "results": results}
+
+
+def rate(result):
+    """Пропускная способность в пикселях в секунду."""
+    return result["pixels"] / result["seconds"] if result["seconds"] else math.inf
+
+
+def compare(report, baseline, threshold):
+    """
+    Сравнивает результаты с опорными.
+
+    :param report: Результаты текущего запуска (в формате файла --save);
+    :param baseline: Опорные результаты;
+    :param threshold: Допустимое относительное падение пропускной способности;
+    :return: Список описаний найденных регрессий.
+    """
+    regressions = []
+    print(f"{'case':<28} {'value':>15} {'base Mpx/s':>11} {'Mpx/s':>8} {'change':>8}")
+    for name, case in report["cases"].items():
+        base_case = baseline["cases"].get(name)
+        if base_case is None:
+            continue
+        base_results = {result["value"]: result for result in base_case["results"]}
+        common = []
+        for result in case["results"]:
+            base = base_results.get(result["value"])
+            if base is None:
+                continue
+            common.append((result["value"], result["seconds"], base["seconds"]))
+            change = rate(result) / rate(base) - 1
+            marks = []
+            if change < -threshold:
+                marks.append("REGRESSION")
+                regressions.append(f"{name} {case['parameter']}={result['value']}: {change:+.0%}")
+            if result["pixels"] != base["pixels"]:
+                marks.append(f"pixels {base['pixels']} -> {result['pixels']}")
+            print(f"{name:<28} {case['parameter']:>8}={result['value']:<6} {rate(base) / 1e6:>11.2f} "
+                  f"{rate(result) / 1e6:>8.2f} {change:>+8.0%}  {' '.join(marks)}")
+        if len(common) < 2:
+            continue
+        # Показатели степени сравниваются по общим значениям (например, при запуске с --quick)
+        values, seconds, base_seconds = zip(*common)
+        exponent, base_exponent = scaling_exponent(values, seconds), scaling_exponent(values, base_seconds)
+        if exponent - base_exponent > EXPONENT_TOLERANCE:
+            regressions.append(f"{name}: time ~ {case['parameter']}^{exponent:.2f}, было ^{base_exponent:.2f}")
+            print(f"{name:<28} REGRESSION: показатель степени {base_exponent:.2f} -> {exponent:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Микробенчмарки алгоритмов растеризации и заливки")
+    parser.add_argument("--filter", default="", help="запускать только случаи, в названии которых есть подстрока")
+    parser.add_argument("--quick", action="store_true", help="без наибольшего значения каждого ряда")
+    parser.add_argument("--save", help="сохранить результаты как опорные в JSON-файл")
+    parser.add_argument("--compare", help="сравнить с опорными результатами из JSON-файла")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое падение пропускной способности (доля, по умолчанию 0.25)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+        },
+        "cases": {},
+    }
+    print(f"{'case':<28} {'value':>15} {'pixels':>9} {'time, ms':>10} {'Mpx/s':>8}")
+    for case in build_cases():
+        if args.filter in case.name:
+            values = case.values[:-1] if args.quick else case.values
+            report["cases"][case.name] = run_case(case, values)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Результаты сохранены в {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.threshold)
+        for message in regressions:
+            print(f"Регрессия: {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QObject
 from PyQt6.QtGui import QColor
 import math
 
+from src.profiling import profiler
 from .delaunay_triangulation import DelaunayTriangulation, Point
 
 
@@ -33,7 +34,9 @@ class DelaunayEditor(QObject):
 
     def add_point(self, x, y):
         """Добавляет точку в триангуляцию"""
-        if self.delaunay.add_point(x, y):
+        with profiler.stage("delaunay.add_point", points=len(self.points) + 1):
+            added = self.delaunay.add_point(x, y)
+        if added:
             self.points.append((x, y))
             self.canvas.update()
 
@@ -55,6 +58,7 @@ class DelaunayEditor(QObject):
         """Очищает редактор"""
         self.reset()
 
+    @profiler.timed("delaunay.paint")
     def draw(self, painter):
         """Отрисовка всех элементов триангуляции"""
         # Рисуем треугольники
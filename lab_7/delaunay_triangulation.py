@@ -1,6 +1,8 @@
 import math
 import numpy as np
 
+from src.profiling import profiler
+
 class Point:
     def __init__(self, x, y):
         self.x = x
@@ -182,6 +184,7 @@ class DelaunayTriangulation:
         for i, point in enumerate(self.points):
             
             # Найдем все треугольники, чьи описанные окружности содержат эту точку
+            profiler.count("triangles tested", len(triangulation))
             bad_triangles = []
             for triangle in triangulation:
                 if triangle.in_circumcircle(point):
@@ -1,12 +1,38 @@
-from .active_edge import fill_active_edge
-from .edge_list import fill_edge_list
-from .scanline_seed import fill_scanline_seed
-from .simple_seed import fill_simple_seed
+from .active_edge import active_edge_spans, fill_active_edge
+from .boundary import BoundaryBitmap
+from .edge_list import edge_list_spans, fill_edge_list
+from .parallel import FILL_ALGORITHMS, SPAN_FILL_ALGORITHMS, fill_polygons
+from .scanline_seed import fill_scanline_seed, scanline_seed_spans
+from .simple_seed import fill_simple_seed, simple_seed_mask, simple_seed_spans
+from .spans import draw_spans, mask_to_spans, span_pixel_count, spans_mask, spans_to_points
+from .vectorized import EVEN_ODD, NONZERO, fill_numpy_even_odd, fill_numpy_nonzero, fill_polygon, polygon_mask, \
+    polygon_spans
 
 __all__ = \
     [
         "fill_edge_list",
         "fill_active_edge",
         "fill_scanline_seed",
-        "fill_simple_seed"
+        "fill_simple_seed",
+        "FILL_ALGORITHMS",
+        "fill_polygons",
+        "edge_list_spans",
+        "active_edge_spans",
+        "SPAN_FILL_ALGORITHMS",
+        "spans_to_points",
+        "span_pixel_count",
+        "draw_spans",
+        "spans_mask",
+        "EVEN_ODD",
+        "NONZERO",
+        "polygon_spans",
+        "fill_polygon",
+        "polygon_mask",
+        "fill_numpy_even_odd",
+        "fill_numpy_nonzero",
+        "BoundaryBitmap",
+        "simple_seed_mask",
+        "simple_seed_spans",
+        "scanline_seed_spans",
+        "mask_to_spans"
     ]
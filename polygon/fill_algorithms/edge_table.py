@@ -0,0 +1,106 @@
+"""
+Общий движок растровой развёртки с таблицей рёбер (ET) и списком активных рёбер (AET).
+
+Рёбра раскладываются по корзинам по начальной строке. На каждой строке в AET
+добавляются рёбра из корзины, закончившиеся удаляются, а x всех активных рёбер
+сдвигается на шаг. Шаг целочисленный: x хранится как q + r / dy (0 <= r < dy),
+поэтому ошибка не накапливается. После сдвига AET почти упорядочен, и порядок
+восстанавливается сортировкой вставками за время, близкое к линейному. Строки без
+активных рёбер пропускаются, так что время пропорционально числу рёбер и спанов,
+а не высоте многоугольника.
+"""
+from polygon.fill_algorithms.spans import make_spans
+
+# Поля ребра в AET (ребро -- список, изменяемый при шаге)
+KEY, Q, R, DQ, DR, DY, Y_END = range(7)
+
+
+def truncate_x(q, r, dy):
+    """Пересечение x = q + r / dy, отброшенное к нулю (как int())."""
+    return q + 1 if q < 0 and r else q
+
+
+def round_x(q, r, dy):
+    """Пересечение x = q + r / dy, округлённое до ближайшего целого (половины -- вверх)."""
+    return q + 1 if 2 * r >= dy else q
+
+
+def build_edge_table(vertices):
+    """
+    Таблица рёбер: начальная строка -> список рёбер, начинающихся на ней.
+
+    Горизонтальные рёбра пропускаются. Ребро активно на строках y_start <= y < y_end.
+    """
+    edge_table = {}
+    n = len(vertices)
+    for i in range(n):
+        x1, y1 = vertices[i]
+        x2, y2 = vertices[(i + 1) % n]
+        if y1 == y2:
+            continue
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        dy = y2 - y1
+        dq, dr = divmod(x2 - x1, dy)
+        edge_table.setdefault(y1, []).append([x1, x1, 0, dq, dr, dy, y2])
+    return edge_table
+
+
+def insertion_sort(aet):
+    """Упорядочивает AET по x; для почти упорядоченного списка -- за линейное время."""
+    for i in range(1, len(aet)):
+        edge = aet[i]
+        key = edge[KEY]
+        j = i - 1
+        while j >= 0 and aet[j][KEY] > key:
+            aet[j + 1] = aet[j]
+            j -= 1
+        aet[j + 1] = edge
+
+
+def scanline_spans(vertices, to_int=truncate_x):
+    """
+    Спаны заливки многоугольника по правилу чётности.
+
+    :param vertices: Вершины [(x, y), ...] с целыми координатами;
+    :param to_int: Перевод пересечения q + r / dy в целый x (truncate_x или round_x);
+    :return: Массив спанов (K, 3) [y, x_start, x_end] с включительным x_end.
+    """
+    if len(vertices) < 3:
+        return make_spans([])
+
+    edge_table = build_edge_table(vertices)
+    starts = sorted(edge_table)
+    spans = []
+    aet = []
+    next_start = 0  # Индекс следующей непустой корзины в starts
+    y = starts[0] if starts else 0
+
+    while next_start < len(starts) or aet:
+        if not aet:
+            # Пропускаем строки без активных рёбер
+            y = starts[next_start]
+        if next_start < len(starts) and starts[next_start] == y:
+            aet.extend(edge_table[y])
+            next_start += 1
+
+        # Удаляем закончившиеся рёбра и восстанавливаем порядок по x
+        aet = [edge for edge in aet if edge[Y_END] > y]
+        insertion_sort(aet)
+
+        # Заполняем между парами пересечений
+        for i in range(0, len(aet) - 1, 2):
+            left, right = aet[i], aet[i + 1]
+            spans.append((y, to_int(left[Q], left[R], left[DY]), to_int(right[Q], right[R], right[DY])))
+
+        # Целочисленный шаг x на следующую строку
+        for edge in aet:
+            edge[Q] += edge[DQ]
+            edge[R] += edge[DR]
+            if edge[R] >= edge[DY]:
+                edge[Q] += 1
+                edge[R] -= edge[DY]
+            edge[KEY] = edge[Q] + edge[R] / edge[DY]
+        y += 1
+
+    return make_spans(spans)
@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from polygon.fill_algorithms.active_edge import active_edge_spans, fill_active_edge
+from polygon.fill_algorithms.edge_list import edge_list_spans, fill_edge_list
+from polygon.fill_algorithms.scanline_seed import fill_scanline_seed, scanline_seed_spans
+from polygon.fill_algorithms.simple_seed import fill_simple_seed, simple_seed_spans
+from polygon.fill_algorithms.spans import spans_to_points
+from polygon.fill_algorithms.vectorized import (fill_numpy_even_odd, fill_numpy_nonzero, numpy_even_odd_spans,
+                                                numpy_nonzero_spans)
+
+# Название алгоритма заливки (как в списке панели инструментов) -> функция
+FILL_ALGORITHMS = {
+    "EdgeList": fill_edge_list,
+    "ActiveEdge": fill_active_edge,
+    "SimpleSeed": fill_simple_seed,
+    "ScanlineSeed": fill_scanline_seed,
+    "NumPyEvenOdd": fill_numpy_even_odd,
+    "NumPyNonZero": fill_numpy_nonzero,
+}
+
+# Алгоритмы, строящие заливку спанами (y, x_start, x_end)
+SPAN_FILL_ALGORITHMS = {
+    "EdgeList": edge_list_spans,
+    "ActiveEdge": active_edge_spans,
+    "SimpleSeed": simple_seed_spans,
+    "ScanlineSeed": scanline_seed_spans,
+    "NumPyEvenOdd": numpy_even_odd_spans,
+    "NumPyNonZero": numpy_nonzero_spans,
+}
+
+
+def fill_pixels(algorithm, vertices):
+    """Пиксели заливки массивом (M, 2); спаны разворачиваются векторно."""
+    polygon = SimpleNamespace(vertices=list(vertices))
+    if algorithm in SPAN_FILL_ALGORITHMS:
+        return spans_to_points(SPAN_FILL_ALGORITHMS[algorithm](polygon), as_array=True)
+    return np.asarray(FILL_ALGORITHMS[algorithm](polygon), dtype=np.int32).reshape(-1, 2)
+
+
+def fill_polygons(jobs):
+    """
+    Заливает несколько многоугольников; задача для ParallelRasterizer (src.drawing_algorithms.parallel).
+
+    :param jobs: Последовательность пар (название алгоритма, вершины [(x, y), ...]);
+    :return: Пара (pixels, counts) -- массив int32 формы (M, 3) пикселей [x, y, 255]
+             и количество пикселей каждой заливки.
+    """
+    parts = [fill_pixels(algorithm, vertices) for algorithm, vertices in jobs]
+    counts = np.array([len(part) for part in parts], dtype=np.int64)
+    pixels = np.concatenate(parts) if parts else np.empty((0, 2), dtype=np.int32)
+    return np.c_[pixels, np.full(len(pixels), 255, dtype=np.int32)], counts
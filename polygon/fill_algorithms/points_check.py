@@ -1,5 +1,19 @@
-def find_inner_point(vertices):
-    """Находит внутреннюю точку полигона"""
+import math
+
+import numpy as np
+
+from src.profiling import profiler
+
+
+def find_inner_point(vertices, boundary=None):
+    """
+    Находит внутреннюю точку полигона
+
+    :param vertices: Вершины полигона;
+    :param boundary: Растр границы (BoundaryBitmap); если задан, возвращается только
+                     точка не на границе -- годная затравка для заливки по этому растру;
+    :return: Точка (x, y) или None.
+    """
     if not vertices:
         return None
 
@@ -8,7 +22,8 @@ def find_inner_point(vertices):
     cy = sum(v[1] for v in vertices) / len(vertices)
 
     if point_in_polygon((cx, cy), vertices):
-        return (int(cx), int(cy))
+        if boundary is None or not boundary.is_boundary(int(cx), int(cy)):
+            return (int(cx), int(cy))
 
     # Если центр масс не подходит, ищем точку внутри методом пересечений
     y_min = min(v[1] for v in vertices)
@@ -35,14 +50,31 @@ def find_inner_point(vertices):
         for i in range(0, len(intersections) - 1, 2):
             if i + 1 < len(intersections):
                 mid_x = (intersections[i] + intersections[i + 1]) / 2
+                if boundary is not None:
+                    mid_x = free_pixel(boundary, y, intersections[i], intersections[i + 1], mid_x)
+                    if mid_x is None:
+                        continue
                 if point_in_polygon((mid_x, y), vertices):
                     return (int(mid_x), y)
 
     return None
 
 
+def free_pixel(boundary, y, x_start, x_end, x):
+    """Ближайший к x пиксель строки y между x_start и x_end, не лежащий на границе, или None."""
+    left, right = math.ceil(x_start), math.floor(x_end)
+    if left > right:
+        return None
+    starts, ends = boundary.free_runs(y, left, right)
+    if not len(starts):
+        return None
+    candidates = np.clip(int(x), starts, ends - 1)
+    return int(candidates[np.argmin(np.abs(candidates - x))])
+
+
 def point_in_polygon(point, vertices):
     """Проверяет, находится ли точка внутри полигона (метод лучевой развертки)"""
+    profiler.count("point_in_polygon")
     x, y = point
     n = len(vertices)
     inside = False
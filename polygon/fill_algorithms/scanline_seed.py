@@ -1,69 +1,72 @@
-from polygon.fill_algorithms.points_check import point_in_polygon, find_inner_point
+import numpy as np
 
+from polygon.fill_algorithms.boundary import FILLED, BoundaryBitmap
+from polygon.fill_algorithms.points_check import find_inner_point
+from polygon.fill_algorithms.spans import make_spans, spans_to_points
 
-def fill_scanline_seed(polygon):
-    """Построчный алгоритм заполнения с затравкой"""
+
+def scanline_seed_spans(polygon):
+    """
+    Построчный алгоритм заполнения с затравкой
+
+    Строки заполняются до пикселей растра границы (сами они не закрашиваются);
+    границы отрезков и затравки на соседних строках ищутся операциями NumPy над строкой растра.
+    Закрашенные отрезки отмечаются в том же растре, так что кроме него алгоритм хранит
+    только стек затравок и по одному спану на отрезок.
+
+    :return: Массив спанов (K, 3) [y, x_start, x_end] в порядке заполнения.
+    """
     vertices = polygon.vertices
     if len(vertices) < 3:
-        return []  # Возвращаем пустой список, если вершин недостаточно
+        return make_spans([])  # Пустой результат, если вершин недостаточно
+
+    # Растр границы вместо проверки point_in_polygon для каждого пикселя
+    boundary = BoundaryBitmap(vertices)
+    bitmap = boundary.bitmap
+    x_min, y_min = boundary.origin
 
-    # Находим внутреннюю затравочную точку
-    seed = find_inner_point(vertices)
+    # Находим внутреннюю затравочную точку не на границе
+    seed = find_inner_point(vertices, boundary)
     if not seed:
-        return []  # Не удалось найти точку внутри полигона
+        return make_spans([])  # Не удалось найти точку внутри полигона
 
     # Определяем границы полигона для оптимизации
-    x_min = min(v[0] for v in vertices)
-    x_max = max(v[0] for v in vertices)
-    y_min = min(v[1] for v in vertices)
-    y_max = max(v[1] for v in vertices)
+    x_max, y_max = boundary.x_max, boundary.y_max
 
-    # Создаем стек для затравочных точек и множество для заполненных точек
+    # Создаем стек для затравочных точек
     stack = [seed]
-    filled = set()
-    fill_points = []  # Список точек для заливки
+    spans = []  # Закрашенные отрезки строк
 
     while stack:
         x, y = stack.pop()
 
         # Пропускаем уже заполненные точки и точки вне области полигона
-        if (x, y) in filled or not (x_min <= x <= x_max and y_min <= y <= y_max):
+        if not (x_min <= x <= x_max and y_min <= y <= y_max) or bitmap[y - y_min, x - x_min]:
             continue
 
-        # Находим левую границу текущей строки
-        left = x
-        while left > x_min and point_in_polygon((left - 1, y), vertices):
-            left -= 1
-
-        # Находим правую границу текущей строки
-        right = x
-        while right < x_max and point_in_polygon((right + 1, y), vertices):
-            right += 1
+        # Находим левую и правую границы текущей строки -- ближайшие пиксели границы
+        row = bitmap[y - y_min]
+        column = x - x_min
+        blocked = np.flatnonzero(row[:column])
+        left = x_min + (int(blocked[-1]) + 1 if len(blocked) else 0)
+        blocked = np.flatnonzero(row[column + 1:])
+        right = x + int(blocked[0]) if len(blocked) else x_max
 
         # Заполняем строку от левой до правой границы
-        for px in range(left, right + 1):
-            if (px, y) not in filled:
-                fill_points.append((px, y))
-                filled.add((px, y))
+        row[left - x_min:right - x_min + 1] = FILLED
+        spans.append((y, left, right))
 
         # Проверяем строки выше и ниже для новых затравочных точек
         for ny in [y - 1, y + 1]:
             if y_min <= ny <= y_max:  # Проверяем, что мы в границах полигона
-                # Ищем затравочные точки на строке выше/ниже
-                px = left
-                while px <= right:
-                    # Находим начало непрерывного сегмента внутри полигона
-                    if point_in_polygon((px, ny), vertices) and (px, ny) not in filled:
-                        start = px
-                        # Находим конец сегмента
-                        while (px <= right and
-                               point_in_polygon((px, ny), vertices) and
-                               (px, ny) not in filled):
-                            px += 1
-                        # Добавляем среднюю точку сегмента как новую затравку
-                        mid = start + (px - start) // 2
-                        stack.append((mid, ny))
-                    else:
-                        px += 1
-
-    return fill_points
+                # Непрерывные отрезки без границы и заливки
+                for start, end in zip(*boundary.free_runs(ny, left, right)):
+                    # Добавляем среднюю точку сегмента как новую затравку
+                    stack.append((int(start + (end - start) // 2), ny))
+
+    return make_spans(spans)
+
+
+def fill_scanline_seed(polygon):
+    """Построчный алгоритм заполнения с затравкой: точки заливки [(x, y), ...] в порядке заполнения"""
+    return spans_to_points(scanline_seed_spans(polygon))
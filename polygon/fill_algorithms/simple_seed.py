@@ -1,57 +1,75 @@
-from polygon.fill_algorithms.points_check import point_in_polygon, find_inner_point
+from array import array
 
+import numpy as np
 
-def fill_simple_seed(polygon):
-    """Простой алгоритм заполнения с затравкой (4-связный)"""
+from polygon.fill_algorithms.boundary import FILLED, BoundaryBitmap
+from polygon.fill_algorithms.points_check import find_inner_point
+from polygon.fill_algorithms.spans import mask_to_spans, spans_to_points
+
+
+def simple_seed_mask(polygon):
+    """
+    Простой алгоритм заполнения с затравкой (4-связный)
+
+    Заливка растекается от затравки до пикселей растра границы (сами они не закрашиваются).
+    Посещённые пиксели отмечаются в байтовом растре охватывающего прямоугольника при
+    добавлении в стек, поэтому каждый пиксель попадает в стек не больше одного раза,
+    а стек хранит номера пикселей в компактном массиве array.
+
+    :return: Пара (mask, origin) -- булева маска охватывающего прямоугольника и
+             координаты холста (x, y) пикселя mask[0, 0].
+    """
     vertices = polygon.vertices
     if len(vertices) < 3:
-        return []  # Возвращаем пустой список, если вершин недостаточно
-    
-    # Пытаемся найти внутреннюю точку (центр масс или другую точку)
-    cx = sum(v[0] for v in vertices) / len(vertices)
-    cy = sum(v[1] for v in vertices) / len(vertices)
-    seed = (int(cx), int(cy))
-    
-    # Если центр масс не внутри полигона, ищем другую точку
-    if not point_in_polygon(seed, vertices):
-        seed = find_inner_point(vertices)
-        if not seed:
-            return []  # Не удалось найти точку внутри полигона
-    
-    # Определяем границы полигона для оптимизации
-    x_min = min(v[0] for v in vertices)
-    x_max = max(v[0] for v in vertices)
-    y_min = min(v[1] for v in vertices)
-    y_max = max(v[1] for v in vertices)
-    
-    # Инициализируем стек для затравочных точек и множество для хранения заполненных точек
-    stack = [seed]
-    filled = set()
-    fill_points = []  # Список точек для заливки
-    
-    # Направления для 4-связности (вправо, влево, вниз, вверх)
-    directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-    
+        return np.zeros((0, 0), dtype=bool), (0, 0)  # Пустая маска, если вершин недостаточно
+
+    # Растр границы вместо проверки point_in_polygon для каждого пикселя
+    boundary = BoundaryBitmap(vertices)
+    x_min, y_min = boundary.origin
+
+    # Ищем внутреннюю точку (центр масс или другую точку) не на границе
+    seed = find_inner_point(vertices, boundary)
+    if not seed:
+        return np.zeros_like(boundary.bitmap, dtype=bool), boundary.origin  # Не удалось найти точку внутри полигона
+
+    # Растр как плоский bytearray: обращение к байту быстрее, чем к элементу массива NumPy
+    height, width = boundary.bitmap.shape
+    size = height * width
+    state = bytearray(boundary.bitmap.tobytes())
+
+    # Стек номеров пикселей y * width + x (4 байта на номер, пока их хватает)
+    start = (seed[1] - y_min) * width + (seed[0] - x_min)
+    state[start] = FILLED
+    stack = array("i" if size < 2 ** 31 else "q", [start])
+
     while stack:
-        x, y = stack.pop()
-        
-        # Если точка уже заполнена или вне диапазона, пропускаем
-        if (x, y) in filled or not (x_min <= x <= x_max and y_min <= y <= y_max):
-            continue
-        
-        # Добавляем точку в заполнение
-        fill_points.append((x, y))
-        filled.add((x, y))
-        
-        # Проверяем соседей в четырех направлениях (4-связность)
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            # Если соседняя точка еще не заполнена и внутри полигона, добавляем в стек
-            if ((nx, ny) not in filled and 
-                    x_min <= nx <= x_max and 
-                    y_min <= ny <= y_max and 
-                    point_in_polygon((nx, ny), vertices)):
-                stack.append((nx, ny))
-    
-    return fill_points
\ No newline at end of file
+        i = stack.pop()
+        x = i % width
+
+        # Соседи в четырех направлениях (вправо, влево, вниз, вверх): свободные закрашиваются
+        # и добавляются в стек
+        if x + 1 < width and not state[i + 1]:
+            state[i + 1] = FILLED
+            stack.append(i + 1)
+        if x > 0 and not state[i - 1]:
+            state[i - 1] = FILLED
+            stack.append(i - 1)
+        if i + width < size and not state[i + width]:
+            state[i + width] = FILLED
+            stack.append(i + width)
+        if i >= width and not state[i - width]:
+            state[i - width] = FILLED
+            stack.append(i - width)
+
+    mask = np.frombuffer(state, dtype=np.uint8).reshape(height, width) == FILLED
+    return mask, boundary.origin
+
+
+def simple_seed_spans(polygon):
+    """Простой алгоритм заполнения с затравкой: спаны заливки (K, 3) [y, x_start, x_end] построчно"""
+    return mask_to_spans(*simple_seed_mask(polygon))
+
+
+def fill_simple_seed(polygon):
+    """Простой алгоритм заполнения с затравкой: точки заливки [(x, y), ...] построчно"""
+    return spans_to_points(simple_seed_spans(polygon))
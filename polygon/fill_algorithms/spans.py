@@ -0,0 +1,110 @@
+from itertools import repeat
+
+import numpy as np
+
+
+def make_spans(spans):
+    """
+    Приводит спаны к массиву, отбрасывая пустые.
+
+    :param spans: Последовательность (y, x_start, x_end) с включительным x_end;
+    :return: Массив int32 формы (K, 3).
+    """
+    spans = np.array(spans, dtype=np.int32).reshape(-1, 3)
+    return spans[spans[:, 2] >= spans[:, 1]]
+
+
+def mask_to_spans(mask, origin=(0, 0)):
+    """
+    Спаны непрерывных отрезков маски в строках.
+
+    :param mask: Булева маска (height, width);
+    :param origin: Координаты холста (x, y) пикселя mask[0, 0];
+    :return: Массив спанов (K, 3) [y, x_start, x_end] построчно слева направо.
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    rows, columns = np.nonzero(np.diff(padded, axis=1))
+    spans = np.empty((len(rows) // 2, 3), dtype=np.int32)
+    spans[:, 0] = rows[0::2] + origin[1]
+    spans[:, 1] = columns[0::2] + origin[0]
+    spans[:, 2] = columns[1::2] - 1 + origin[0]
+    return spans
+
+
+def span_pixel_count(spans):
+    """Количество пикселей в спанах."""
+    spans = np.asarray(spans).reshape(-1, 3)
+    return int((spans[:, 2] - spans[:, 1] + 1).sum())
+
+
+def spans_to_points(spans, as_array=False):
+    """
+    Разворачивает спаны в отдельные пиксели (нужно только для пошаговой отладки заливки).
+
+    :param spans: Массив (K, 3) [y, x_start, x_end];
+    :param as_array: Вернуть массив NumPy формы (M, 2) вместо списка;
+    :return: Пиксели [(x, y), ...] построчно слева направо, в порядке спанов.
+    """
+    spans = np.asarray(spans, dtype=np.int32).reshape(-1, 3)
+    if not as_array:
+        points = []
+        for y, x_start, x_end in spans.tolist():
+            points.extend(zip(range(x_start, x_end + 1), repeat(y)))
+        return points
+    lengths = spans[:, 2] - spans[:, 1] + 1
+    starts = np.cumsum(lengths) - lengths
+    points = np.empty((int(lengths.sum()), 2), dtype=np.int32)
+    points[:, 1] = np.repeat(spans[:, 0], lengths)
+    points[:, 0] = np.arange(len(points)) - np.repeat(starts - spans[:, 1], lengths)
+    return points
+
+
+def draw_spans(target, spans, value, origin=(0, 0)):
+    """
+    Закрашивает спаны в растре присваиванием срезов (по одному на спан).
+
+    :param target: Массив (height, width) или (height, width, channels);
+    :param spans: Массив (K, 3) [y, x_start, x_end];
+    :param value: Значение пикселя (например, цвет RGBA);
+    :param origin: Координаты холста (x, y) левого верхнего пикселя target;
+                   части спанов вне target отбрасываются.
+    """
+    height, width = target.shape[:2]
+    ox, oy = origin
+    for y, x_start, x_end in np.asarray(spans).reshape(-1, 3).tolist():
+        y, x_start, x_end = y - oy, max(x_start - ox, 0), min(x_end - ox + 1, width)
+        if 0 <= y < height and x_start < x_end:
+            target[y, x_start:x_end] = value
+
+
+def spans_mask(spans, shape, origin=(0, 0)):
+    """
+    Маска пикселей, покрытых спанами, без цикла по спанам.
+
+    Начало и конец каждого спана отмечаются +1 и -1 в разностном массиве строки,
+    накопленная сумма по строке положительна внутри спанов. Вычисляется только
+    в прямоугольнике, охватывающем спаны.
+
+    :param spans: Массив (K, 3) [y, x_start, x_end];
+    :param shape: Размер (height, width) маски;
+    :param origin: Координаты холста (x, y) левого верхнего пикселя маски;
+    :return: Пара (mask, (x0, y0)) -- булева маска охватывающего прямоугольника и её
+             положение в координатах маски shape, или (None, None), если спаны не попадают в неё.
+    """
+    height, width = shape[:2]
+    spans = np.asarray(spans, dtype=np.int64).reshape(-1, 3)
+    rows = spans[:, 0] - origin[1]
+    starts = np.clip(spans[:, 1] - origin[0], 0, width)
+    ends = np.clip(spans[:, 2] - origin[0] + 1, 0, width)
+    keep = (rows >= 0) & (rows < height) & (starts < ends)
+    rows, starts, ends = rows[keep], starts[keep], ends[keep]
+    if not len(rows):
+        return None, None
+    y0, x0 = int(rows.min()), int(starts.min())
+    # Спаны в строке не пересекаются (разве что касаются концами), так что хватает int8
+    difference = np.zeros((int(rows.max()) + 1 - y0, int(ends.max()) + 1 - x0), dtype=np.int8)
+    np.add.at(difference, (rows - y0, starts - x0), 1)
+    np.add.at(difference, (rows - y0, ends - x0), -1)
+    return np.cumsum(difference[:, :-1], axis=1, dtype=np.int8) > 0, (x0, y0)
@@ -0,0 +1,123 @@
+"""
+Векторизованная заливка многоугольника средствами NumPy.
+
+Пересечения всех рёбер со всеми строками развёртки вычисляются одним набором
+операций над массивами (ребро активно на строках y_start <= y < y_end, как в
+алгоритме с упорядоченным списком рёбер), затем сортируются по x внутри каждой
+строки. Поддерживаются правила чётности (even-odd) и ненулевого индекса (nonzero).
+Результат -- спаны или закраска маски uint8 / RGBA-буфера холста.
+"""
+import numpy as np
+
+from polygon.fill_algorithms.spans import make_spans, spans_mask, spans_to_points
+
+EVEN_ODD = "evenodd"
+NONZERO = "nonzero"
+
+
+def edge_crossings(vertices):
+    """
+    Пересечения рёбер со строками развёртки, упорядоченные по строкам, а внутри строки -- по x.
+
+    :param vertices: Вершины [(x, y), ...] с целыми координатами;
+    :return: Тройка массивов (y, x, direction): строка, x пересечения и направление
+             ребра (+1 -- вниз по y, -1 -- вверх).
+    """
+    points = np.asarray(vertices, dtype=np.int64).reshape(-1, 2)
+    x1, y1 = points[:, 0], points[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    direction = np.sign(y2 - y1)
+    keep = direction != 0  # Горизонтальные рёбра пропускаются
+    x1, y1, x2, y2, direction = x1[keep], y1[keep], x2[keep], y2[keep], direction[keep]
+
+    # Нижний по y конец ребра -- начало, верхний -- конец
+    flip = y1 > y2
+    x_start, y_start = np.where(flip, x2, x1), np.minimum(y1, y2)
+    dx, dy = np.where(flip, x1, x2) - x_start, np.abs(y2 - y1)
+
+    # Для каждого ребра -- строки y_start .. y_end - 1
+    edge = np.repeat(np.arange(len(dy)), dy)
+    step = np.arange(len(edge)) - np.repeat(np.cumsum(dy) - dy, dy)
+    y = y_start[edge] + step
+    # Та же формула, что и в edge_list: x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    x = x_start[edge] + step * dx[edge] / dy[edge]
+
+    order = np.lexsort((x, y))
+    return y[order], x[order], direction[edge][order]
+
+
+def polygon_spans(vertices, rule=EVEN_ODD):
+    """
+    Спаны заливки многоугольника.
+
+    :param vertices: Вершины [(x, y), ...] с целыми координатами;
+    :param rule: Правило заполнения: EVEN_ODD или NONZERO;
+    :return: Массив спанов (K, 3) [y, x_start, x_end] с включительным x_end
+             (пересечения отбрасываются к целому, как в fill_edge_list).
+    """
+    if len(vertices) < 3:
+        return make_spans([])
+    y, x, direction = edge_crossings(vertices)
+    if rule == EVEN_ODD:
+        # В каждой строке чётное число пересечений: заполняются промежутки между парами
+        rows, left, right = y[0::2], x[0::2], x[1::2]
+    elif rule == NONZERO:
+        # Сумма направлений по строке равна нулю, поэтому накопленная сумма сама
+        # обнуляется на границах строк; спан -- от выхода индекса из нуля до возврата в ноль
+        winding = np.cumsum(direction)
+        previous = winding - direction
+        starts = (winding != 0) & (previous == 0)
+        ends = (winding == 0) & (previous != 0)
+        rows, left, right = y[starts], x[starts], x[ends]
+    else:
+        raise ValueError(f"Неизвестное правило заполнения: {rule}")
+    spans = np.column_stack([rows, np.trunc(left), np.trunc(right)]).astype(np.int32)
+    return spans[spans[:, 2] >= spans[:, 1]]
+
+
+def fill_polygon(target, vertices, value, rule=EVEN_ODD, origin=(0, 0)):
+    """
+    Закрашивает многоугольник прямо в растре.
+
+    :param target: Маска (height, width), например uint8, или буфер холста (height, width, 4);
+    :param vertices: Вершины [(x, y), ...] с целыми координатами;
+    :param value: Значение пикселя (1 или 255 для маски, цвет RGBA для буфера);
+    :param rule: Правило заполнения: EVEN_ODD или NONZERO;
+    :param origin: Координаты холста (x, y) левого верхнего пикселя target;
+    :return: Количество закрашенных пикселей.
+    """
+    mask, offset = spans_mask(polygon_spans(vertices, rule), target.shape, origin)
+    if mask is None:
+        return 0
+    x0, y0 = offset
+    if target.ndim == 3 and target.shape[2] == 4 and target.dtype == np.uint8 and target.flags.c_contiguous:
+        # Пиксель RGBA записывается одним 32-битным словом, а не четырьмя байтами
+        target = target.view(np.uint32)[..., 0]
+        value = np.asarray(value, dtype=np.uint8).view(np.uint32)[0]
+    target[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]][mask] = value
+    return int(np.count_nonzero(mask))
+
+
+def polygon_mask(vertices, shape, rule=EVEN_ODD, origin=(0, 0)):
+    """Маска uint8 (0 или 1) многоугольника размера shape."""
+    mask = np.zeros(shape[:2], dtype=np.uint8)
+    fill_polygon(mask, vertices, 1, rule, origin)
+    return mask
+
+
+def numpy_even_odd_spans(polygon):
+    return polygon_spans(polygon.vertices, EVEN_ODD)
+
+
+def numpy_nonzero_spans(polygon):
+    return polygon_spans(polygon.vertices, NONZERO)
+
+
+def fill_numpy_even_odd(polygon):
+    """Векторизованная заливка по правилу чётности: точки заливки [(x, y), ...]"""
+    return spans_to_points(numpy_even_odd_spans(polygon))
+
+
+def fill_numpy_nonzero(polygon):
+    """Векторизованная заливка по правилу ненулевого индекса: точки заливки [(x, y), ...]"""
+    return spans_to_points(numpy_nonzero_spans(polygon))
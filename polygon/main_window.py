@@ -1,8 +1,11 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QToolBar,
-                             QMenuBar, QMenu, QComboBox, QPushButton, QStatusBar, QLabel, QCheckBox)
+                             QMenuBar, QMenu, QComboBox, QPushButton, QStatusBar, QLabel, QCheckBox,
+                             QFileDialog, QMessageBox)
 from PyQt6.QtGui import QAction, QActionGroup
 from canvas_widget import CanvasWidget
 from lab_7.delaunay_editor import DelaunayEditor
+from src.profiling import profiler
+from src.view.profiler_overlay import TRACE_FILTER, ProfilerOverlay
 
 
 class MainWindow(QMainWindow):
@@ -31,13 +34,19 @@ class MainWindow(QMainWindow):
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        self.profiler_overlay = ProfilerOverlay(self.status_bar)
         self.canvas.editor.polygon_finished.connect(self.show_status_message)
+        self.canvas.editor.fill_failed.connect(self.show_fill_error)
+        self.canvas.editor.status_message.connect(self.show_status_message)
 
         self.delaunay_editor = DelaunayEditor(self.canvas)
 
     def show_status_message(self, message):
         self.status_bar.showMessage(message)
 
+    def show_fill_error(self, message):
+        QMessageBox.warning(self, "Заливка", message)
+
     def create_menu(self):
         menubar = self.menuBar()
 
@@ -68,6 +77,17 @@ class MainWindow(QMainWindow):
         clear_action.triggered.connect(self.clear_canvas)
         polygon_menu.addAction(clear_action)
 
+        # Меню "Профилирование"
+        profiling_menu = menubar.addMenu("Профилирование")
+
+        overlay_action = QAction("Показывать время в строке состояния", self, checkable=True)
+        overlay_action.toggled.connect(lambda checked: self.profiler_overlay.set_enabled(checked))
+        profiling_menu.addAction(overlay_action)
+
+        trace_action = QAction("Сохранить трассу...", self)
+        trace_action.triggered.connect(self.export_trace)
+        profiling_menu.addAction(trace_action)
+
     def create_toolbar(self):
         toolbar = QToolBar()
         self.addToolBar(toolbar)
@@ -101,7 +121,8 @@ class MainWindow(QMainWindow):
 
         # Заливка
         fill_combo = QComboBox(self)
-        fill_combo.addItems(["EdgeList", "ActiveEdge", "SimpleSeed", "ScanlineSeed", "None"])
+        fill_combo.addItems(["EdgeList", "ActiveEdge", "SimpleSeed", "ScanlineSeed", "NumPyEvenOdd", "NumPyNonZero",
+                            "None"])
         fill_combo.currentTextChanged.connect(
             lambda text: self.set_fill_algorithm(text))
         toolbar.addWidget(fill_combo)
@@ -150,6 +171,16 @@ class MainWindow(QMainWindow):
         print(f"Алгоритм заливки: {algorithm}")
         self.canvas.editor.set_fill_algorithm(algorithm)
 
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Сохранить трассу", "", TRACE_FILTER)
+        if path:
+            try:
+                profiler.export_chrome_trace(path)
+            except OSError as error:
+                QMessageBox.warning(self, "Сохранить трассу", str(error))
+                return
+            self.show_status_message(f"Трасса сохранена в {path}")
+
     def fill(self):
         self.canvas.update()
 
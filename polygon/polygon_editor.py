@@ -1,12 +1,21 @@
 import math
+from types import SimpleNamespace
 
+import numpy as np
 from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QPen
 
-from polygon.fill_algorithms import fill_edge_list, fill_active_edge, fill_simple_seed, fill_scanline_seed
+from polygon.fill_algorithms import FILL_ALGORITHMS, SPAN_FILL_ALGORITHMS, span_pixel_count, spans_to_points
 from src.drawing_algorithms.lines.bresenham import bresenham_line
 from src.drawing_algorithms.lines.dda import dda_line
 from src.drawing_algorithms.lines.wu import wu_line
+from src.profiling import profiler
+from src.view.render_worker import BackgroundRenderer
+
+# Количество точек заливки, передаваемых из фонового потока за раз
+FILL_CHUNK = 4096
+# Количество спанов заливки, передаваемых из фонового потока за раз
+SPAN_CHUNK = 256
 
 
 class Polygon:
@@ -15,15 +24,36 @@ class Polygon:
         self.hull_points = []
         self.normals = []
         self.is_closed = False
-        self.fill = []
+        self.fill = []  # Точки заливки (пошаговая отладка и алгоритмы без спанов)
+        self.fill_spans = []  # Спаны заливки (y, x_start, x_end)
+        self.fill_key = None  # (вершины, алгоритм), для которых построена или строится заливка
 
 
 def distance(p, q):
     return math.sqrt((q[0] - p[0]) ** 2 + (q[1] - p[1]) ** 2)
 
 
+def fill_parts(algorithm, vertices):
+    """
+    Заливка многоугольника частями; выполняется в фоновом потоке.
+
+    Для алгоритмов из SPAN_FILL_ALGORITHMS части -- массивы по SPAN_CHUNK спанов,
+    для остальных -- списки по FILL_CHUNK точек.
+    """
+    if algorithm in SPAN_FILL_ALGORITHMS:
+        spans = SPAN_FILL_ALGORITHMS[algorithm](SimpleNamespace(vertices=vertices))
+        for start in range(0, len(spans), SPAN_CHUNK):
+            yield spans[start:start + SPAN_CHUNK]
+        return
+    points = FILL_ALGORITHMS[algorithm](SimpleNamespace(vertices=vertices))
+    for start in range(0, len(points), FILL_CHUNK):
+        yield points[start:start + FILL_CHUNK]
+
+
 class PolygonEditor(QObject):
     polygon_finished = pyqtSignal(str)
+    fill_failed = pyqtSignal(str)  # Сообщение об ошибке фонового построения заливки
+    status_message = pyqtSignal(str)  # Ход пошаговой заливки для строки состояния
 
     def __init__(self, canvas):
         super().__init__()
@@ -46,6 +76,13 @@ class PolygonEditor(QObject):
         self.fill_point_index = 0  # Текущий индекс для пошаговой заливки
         self.batch_size = 100  # Количество точек, отрисовываемых за один шаг
 
+        # Заливка строится в фоне; новая задача отменяет предыдущую, ставшую неактуальной
+        self.fill_renderer = BackgroundRenderer(self)
+        self.fill_renderer.partial.connect(self.on_fill_partial)
+        self.fill_renderer.finished.connect(self.on_fill_finished)
+        self.fill_renderer.failed.connect(self.on_fill_failed)
+        self.fill_job = None  # (номер задачи, ключ, полигон, для отладки ли)
+
     def reset_current_action(self):
         """Сбрасывает текущее действие при смене режима"""
         self.current_line_start = None
@@ -112,7 +149,8 @@ class PolygonEditor(QObject):
         self.polygon_finished.emit(f"Многоугольник замкнут. Он {convex_text}.")
 
         # Вычисляем выпуклую оболочку
-        self.current_polygon.hull_points = self.build_convex_hull()
+        with profiler.stage("polygon.hull", method=self.hull_method):
+            self.current_polygon.hull_points = self.build_convex_hull()
 
         # Вычисляем внутренние нормали
         self.calculate_internal_normals()
@@ -285,6 +323,7 @@ class PolygonEditor(QObject):
 
     def point_in_polygon(self, point, vertices):
         """Реализация алгоритма ray casting для определения положения точки"""
+        profiler.count("point_in_polygon")
         x, y = point
         n = len(vertices)
         inside = False
@@ -435,6 +474,7 @@ class PolygonEditor(QObject):
                  center_y + normal_y * normal_length)
             ))
 
+    @profiler.timed("polygon.paint")
     def draw(self, painter):
         """Отрисовывает все полигоны, текущий полигон и линии"""
         # Отрисовка завершенных полигонов
@@ -464,7 +504,8 @@ class PolygonEditor(QObject):
             painter.drawPoint(point[0], point[1])
 
         # Отрисовка остальных точек
-        self.check_all_points_in_polygons()
+        with profiler.stage("polygon.check_points"):
+            self.check_all_points_in_polygons()
         for point, status in self.points_in_polygons.items():
             self._draw_vertice(painter, point, status)
 
@@ -568,40 +609,74 @@ class PolygonEditor(QObject):
         
         # Если активен режим отладки и у нас нет еще точек заливки, получаем их
         if self.debug_mode and not self.fill_points and self.fill_algorithm != "None":
-            self.fill_points = []
-            self.fill_point_index = 0
-            
-            # Получаем все точки для заливки сразу, но отображать будем постепенно
-            if self.fill_algorithm == "EdgeList":
-                self.fill_points = fill_edge_list(polygon)
-            elif self.fill_algorithm == "ActiveEdge":
-                self.fill_points = fill_active_edge(polygon)
-            elif self.fill_algorithm == "SimpleSeed":
-                self.fill_points = fill_simple_seed(polygon)
-            elif self.fill_algorithm == "ScanlineSeed":
-                self.fill_points = fill_scanline_seed(polygon)
-                
-            print(f"Подготовлено точек для заливки: {len(self.fill_points)}")
+            # Все точки строятся в фоне (см. on_fill_finished), но отображать будем постепенно
+            self.request_fill(polygon, debug=True)
             return  # В режиме отладки не показываем точки сразу, а ждем нажатия кнопки
         
         # В обычном режиме или если отладка включена позже
         if not self.debug_mode:
-            if self.fill_algorithm == "EdgeList":
-                polygon.fill = fill_edge_list(polygon)
-            elif self.fill_algorithm == "ActiveEdge":
-                polygon.fill = fill_active_edge(polygon)
-            elif self.fill_algorithm == "SimpleSeed":
-                polygon.fill = fill_simple_seed(polygon)
-            elif self.fill_algorithm == "ScanlineSeed":
-                polygon.fill = fill_scanline_seed(polygon)
-            elif self.fill_algorithm == "None":
+            if self.fill_algorithm == "None":
                 polygon.fill = []
+                polygon.fill_spans = []
+                polygon.fill_key = None
+            elif polygon.fill_key != (tuple(polygon.vertices), self.fill_algorithm):
+                # Заливка строится в фоне и дорисовывается по мере прихода частей
+                self.request_fill(polygon)
         
-        # Отрисовываем точки из fill свойства полигона
+        # Спаны рисуются горизонтальными линиями, отдельные точки -- только при пошаговой отладке
+        for y, x_start, x_end in polygon.fill_spans:
+            painter.drawLine(x_start, y, x_end, y)
         for x, y in polygon.fill:
             painter.drawPoint(x, y)
 
+    def request_fill(self, polygon, debug=False):
+        """Запускает построение заливки в фоне, если оно ещё не запущено для тех же данных."""
+        key = (tuple(polygon.vertices), self.fill_algorithm)
+        if self.fill_job is not None and self.fill_job[1:] == (key, polygon, debug):
+            return
+        self.cancel_fill()
+        if not debug:
+            polygon.fill = []
+            polygon.fill_spans = []
+            polygon.fill_key = key
+        parts = fill_parts(self.fill_algorithm, list(polygon.vertices))
+        size = span_pixel_count if self.fill_algorithm in SPAN_FILL_ALGORITHMS else len
+        job_id = self.fill_renderer.submit(profiler.iterate("polygon.fill", parts, "fill pixels", size=size,
+                                                            algorithm=self.fill_algorithm))
+        self.fill_job = (job_id, key, polygon, debug)
+
+    def cancel_fill(self):
+        """Отменяет построение заливки, ставшее неактуальным."""
+        if self.fill_job is not None:
+            self.fill_renderer.cancel(self.fill_job[0])
+            self.fill_job = None
+
+    def on_fill_partial(self, job_id, part):
+        _, (_, algorithm), polygon, debug = self.fill_job
+        if not debug:
+            if algorithm in SPAN_FILL_ALGORITHMS:
+                polygon.fill_spans.extend(part.tolist())
+            else:
+                polygon.fill.extend(part)
+            self.canvas.update()
+
+    def on_fill_finished(self, job_id, parts):
+        _, (_, algorithm), polygon, debug = self.fill_job
+        self.fill_job = None
+        if debug:
+            # Для пошаговой отладки спаны разворачиваются в отдельные точки
+            if algorithm in SPAN_FILL_ALGORITHMS:
+                self.fill_points = spans_to_points(np.concatenate(parts)) if parts else []
+            else:
+                self.fill_points = [point for part in parts for point in part]
+            self.fill_point_index = 0
+
+    def on_fill_failed(self, job_id, message):
+        self.fill_job = None
+        self.fill_failed.emit(f"Ошибка заливки: {message}")
+
     def clear(self):
+        self.cancel_fill()
         self.polygons.clear()
         self.current_polygon = Polygon()
         self.points_in_polygons = {}
@@ -632,10 +707,11 @@ class PolygonEditor(QObject):
         
         # Проверяем, закончили ли мы заполнение
         if self.fill_point_index >= len(self.fill_points):
-            print(f"Заполнение завершено. Всего точек: {len(self.fill_points)}")
+            self.status_message.emit(f"Заполнение завершено. Всего точек: {len(self.fill_points)}")
         else:
             remaining = len(self.fill_points) - self.fill_point_index
-            print(f"Отрисовано: {self.fill_point_index}/{len(self.fill_points)} точек. Осталось: {remaining}")
+            self.status_message.emit(
+                f"Отрисовано: {self.fill_point_index}/{len(self.fill_points)} точек. Осталось: {remaining}")
         
         # Перерисовываем холст
         self.canvas.update()
@@ -650,8 +726,11 @@ class PolygonEditor(QObject):
         self.fill_point_index = 0
         
         # Очищаем предыдущую заливку у всех полигонов
+        self.cancel_fill()
         for polygon in self.polygons:
             polygon.fill = []
+            polygon.fill_spans = []
+            polygon.fill_key = None
         
         self.canvas.update()
 
@@ -664,8 +743,11 @@ class PolygonEditor(QObject):
         self.fill_point_index = 0
 
         # Очищаем заливку у всех полигонов для перерисовки
+        self.cancel_fill()
         for polygon in self.polygons:
             polygon.fill = []
+            polygon.fill_spans = []
+            polygon.fill_key = None
 
         self.canvas.update()
 
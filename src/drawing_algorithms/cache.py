@@ -0,0 +1,371 @@
+import math
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from src.drawing_algorithms.conic_sections.circle import draw_circle
+from src.drawing_algorithms.conic_sections.ellipse import draw_ellipse
+from src.drawing_algorithms.conic_sections.hyperbola import draw_hyperbola
+from src.drawing_algorithms.conic_sections.parabola import draw_parabola
+from src.drawing_algorithms.curves.b_spline import draw_b_spline
+from src.drawing_algorithms.curves.bezier import draw_bezier_curve
+from src.drawing_algorithms.curves.chains import draw_spline_chain
+from src.drawing_algorithms.curves.flatten import B_SPLINE, BEZIER, HERMITE, bezier_polygon
+from src.drawing_algorithms.curves.hermite import draw_hermite_curve
+from src.drawing_algorithms.lines.batch import bresenham_lines, dda_lines, wu_lines
+from src.drawing_algorithms.lines.bresenham import bresenham_line
+from src.drawing_algorithms.lines.dda import dda_line
+from src.drawing_algorithms.lines.wu import wu_line
+
+# Объём кэша по умолчанию
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Название алгоритма -> функция от исходных точек фигуры и прямоугольника отсечения (или None),
+# возвращающая пиксели [x, y] или [x, y, alpha] (списком или массивом NumPy)
+RASTERIZERS = {
+    "wu": lambda points, clip: wu_line(*points, clip=clip),
+    "bresenham": lambda points, clip: bresenham_line(*points, clip=clip),
+    "dda": lambda points, clip: dda_line(*points, clip=clip),
+    "circle": lambda points, clip: draw_circle(points[0][0], points[0][1], round(math.dist(*points)),
+                                               as_array=True, clip=clip),
+    "ellipse": lambda points, clip: draw_ellipse(*points, as_array=True, clip=clip),
+    "parabola": lambda points, clip: draw_parabola(*points, as_array=True, clip=clip),
+    "hyperbola": lambda points, clip: draw_hyperbola(*points, clip=clip),
+    "hermite": lambda points, clip: draw_hermite_curve(*points, as_array=True, clip=clip),
+    "bezier": lambda points, clip: draw_bezier_curve(*points, as_array=True, clip=clip),
+    "b-spline": lambda points, clip: draw_b_spline(*points, as_array=True, clip=clip),
+    "bezier-chain": lambda points, clip: draw_spline_chain(points, "bezier", as_array=True, clip=clip),
+    "b-spline-chain": lambda points, clip: draw_spline_chain(points, "b-spline", as_array=True, clip=clip),
+    "catmull-rom-chain": lambda points, clip: draw_spline_chain(points, "catmull-rom", as_array=True, clip=clip),
+}
+
+# Векторизованные алгоритмы для промахов-отрезков (lines/batch.py), результат совпадает с RASTERIZERS
+BATCH_RASTERIZERS = {
+    "bresenham": bresenham_lines,
+    "dda": dda_lines,
+    "wu": wu_lines,
+}
+
+# Алгоритмы, у которых при отсечении вычисляются только видимые участки фигуры: отрезки
+# Брезенхема и ЦДА и дуги конических сечений -- бинарным поиском диапазона шагов, отдельные
+# кривые -- по оболочкам участков. У остальных (Ву накапливает intery с первого шага, гипербола
+# перебирает все точки, цепочки вычисляют видимые сегменты целиком) время отсечённой
+# растеризации зависит от размера всей фигуры
+CLIP_EFFICIENT = {"bresenham", "dda", "circle", "ellipse", "parabola", "hermite", "bezier", "b-spline"}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "nbytes", "max_bytes"])
+
+
+def _normalize_points(points):
+    """Начало координат -- первая точка, параметры -- смещения точек относительно неё."""
+    ox, oy = points[0]
+    return (ox, oy), tuple((x - ox, y - oy) for x, y in points)
+
+
+def _normalize_circle(points):
+    """Окружность зависит только от радиуса; начало координат -- центр."""
+    center, edge = points
+    radius = round(math.dist(center, edge))
+    return tuple(center), ((0, 0), (radius, 0))
+
+
+def _normalize_ellipse(points):
+    """Эллипс зависит только от полуосей; начало координат -- целочисленный центр."""
+    (x0, y0), (x1, y1) = points
+    a, b = abs(x1 - x0) // 2, abs(y1 - y0) // 2
+    return ((x0 + x1) // 2, (y0 + y1) // 2), ((-a, -b), (a, b))
+
+
+NORMALIZERS = {
+    "circle": _normalize_circle,
+    "ellipse": _normalize_ellipse,
+}
+
+# Алгоритмы в целых числах, результат которых зависит только от взаимного положения точек.
+# Остальные (ЦДА, Ву, кривые) округляют значения с плавающей точкой, и после сдвига фигуры
+# в начало координат отдельные пиксели могут округлиться иначе, поэтому их ключ --
+# абсолютные координаты
+TRANSLATION_INVARIANT = {"bresenham", "circle", "ellipse", "parabola", "hyperbola"}
+
+
+def _points_bounds(local):
+    """Прямоугольник точек с запасом в пиксель (у линии Ву соседний пиксель по неосновной оси)."""
+    xs, ys = [x for x, _ in local], [y for _, y in local]
+    return min(xs) - 1, min(ys) - 1, max(xs) + 2, max(ys) + 2
+
+
+def _circle_bounds(local):
+    radius = local[1][0]
+    return -radius - 1, -radius - 1, radius + 2, radius + 2
+
+
+def _parabola_bounds(local):
+    """Ветви симметричны относительно вершины и не выходят за |x| <= |dx| и y между 0 и dy."""
+    dx, dy = local[1]
+    return -abs(dx) - 1, min(dy, 0) - 1, abs(dx) + 2, max(dy, 0) + 2
+
+
+def _curve_bounds(basis):
+    """Кривая лежит в выпуклой оболочке своего контрольного многоугольника Безье."""
+    def bounds(local):
+        polygon = bezier_polygon(basis, local)
+        low, high = np.floor(polygon.min(axis=0)), np.ceil(polygon.max(axis=0))
+        return int(low[0]) - 1, int(low[1]) - 1, int(high[0]) + 2, int(high[1]) + 2
+    return bounds
+
+
+# Название алгоритма -> функция от точек ключа, возвращающая прямоугольник, содержащий все пиксели фигуры
+# (у гиперболы ветви не ограничены прямоугольником start-end, а кривая Catmull-Rom может выходить
+# за выпуклую оболочку контрольных точек, и их границы не оцениваются)
+BOUNDS = {
+    "wu": _points_bounds,
+    "bresenham": _points_bounds,
+    "dda": _points_bounds,
+    "circle": _circle_bounds,
+    "ellipse": _points_bounds,
+    "parabola": _parabola_bounds,
+    "hermite": _curve_bounds(HERMITE),
+    "bezier": _curve_bounds(BEZIER),
+    "b-spline": _curve_bounds(B_SPLINE),
+    # Составные кривые Безье и B-сплайны лежат в выпуклой оболочке контрольных точек
+    "bezier-chain": _points_bounds,
+    "b-spline-chain": _points_bounds,
+}
+
+
+def normalize(algorithm, points):
+    """
+    Приводит фигуру к ключу, не зависящему от её положения.
+
+    Для алгоритмов не из TRANSLATION_INVARIANT начало координат -- (0, 0), и ключ
+    содержит абсолютные координаты точек.
+
+    :param algorithm: Название алгоритма (см. RASTERIZERS);
+    :param points: Исходные точки фигуры;
+    :return: Начало координат (ox, oy) и ключ (algorithm, точки относительно начала координат).
+    """
+    points = [(int(x), int(y)) for x, y in points]
+    if algorithm not in TRANSLATION_INVARIANT:
+        return (0, 0), (algorithm, tuple(points))
+    origin, local = NORMALIZERS.get(algorithm, _normalize_points)(points)
+    return origin, (algorithm, local)
+
+
+def shape_bounds(algorithm, points):
+    """
+    Прямоугольник, содержащий все пиксели фигуры, без её растеризации.
+
+    :param algorithm: Название алгоритма (см. RASTERIZERS);
+    :param points: Исходные точки фигуры;
+    :return: Кортеж (x0, y0, x1, y1) или None, если границы алгоритма не оцениваются (см. BOUNDS).
+    """
+    (ox, oy), (algorithm, local) = normalize(algorithm, points)
+    if algorithm not in BOUNDS:
+        return None
+    x0, y0, x1, y1 = BOUNDS[algorithm](local)
+    return x0 + ox, y0 + oy, x1 + ox, y1 + oy
+
+
+def local_clip(key, clip):
+    """
+    Прямоугольник отсечения для ключа фигуры.
+
+    :param key: Ключ (algorithm, точки относительно начала координат);
+    :param clip: Прямоугольник (x0, y0, x1, y1) относительно начала координат;
+    :return: None, если фигура целиком внутри прямоугольника; пустой кортеж, если целиком
+             снаружи; иначе прямоугольник в целых числах.
+    """
+    x0, y0, x1, y1 = (int(value) for value in clip)
+    if x0 >= x1 or y0 >= y1:
+        return ()
+    algorithm, local = key
+    if algorithm not in BOUNDS:
+        return x0, y0, x1, y1
+    bx0, by0, bx1, by1 = BOUNDS[algorithm](local)
+    if bx1 <= x0 or x1 <= bx0 or by1 <= y0 or y1 <= by0:
+        return ()
+    if x0 <= bx0 and y0 <= by0 and bx1 <= x1 and by1 <= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+class RasterCache:
+    """
+    Общий кэш результатов растеризации для всех алгоритмов.
+
+    Фигура растеризуется относительно начала координат (см. normalize), и в кэше
+    хранятся смещения пикселей от него, поэтому для целочисленных алгоритмов одна
+    запись обслуживает все копии фигуры в разных местах холста. Записи вытесняются
+    по давности использования (LRU), когда их суммарный объём превышает max_bytes.
+
+    Результат совпадает с вызовом алгоритма в исходных координатах: фигуры
+    алгоритмов с плавающей точкой кэшируются по абсолютным координатам.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # Ключ -> массив смещений (M, 3) [dx, dy, alpha], в порядке использования
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def rasterize(self, algorithm, points, clip=None):
+        """
+        Пиксели фигуры, растеризуемой при промахе кэша.
+
+        Если фигура целиком внутри прямоугольника отсечения, используется общая запись
+        без отсечения; если целиком снаружи -- растеризация не нужна. Иначе прямоугольник
+        (относительно начала координат) входит в ключ, и вычисляются только видимые пиксели.
+
+        :param algorithm: Название алгоритма (см. RASTERIZERS);
+        :param points: Исходные точки фигуры;
+        :param clip: Прямоугольник (x0, y0, x1, y1) отсечения или None;
+        :return: Новый массив int32 формы (M, 3) пикселей [x, y, alpha].
+        """
+        pixels, _ = self.rasterize_many([(algorithm, points)], clip)
+        return pixels
+
+    def rasterize_many(self, shapes, clip=None):
+        """
+        Пиксели набора фигур подряд.
+
+        Промахи кэша для отрезков строятся векторизованно (см. BATCH_RASTERIZERS) -- одним
+        вызовом на алгоритм, одинаковые ключи растеризуются один раз; остальные фигуры --
+        функциями RASTERIZERS. Результат совпадает с вызовами rasterize по очереди.
+
+        :param shapes: Последовательность фигур (algorithm, points);
+        :param clip: Прямоугольник (x0, y0, x1, y1) отсечения или None;
+        :return: Пара (pixels, counts) -- новый массив int32 формы (M, 3) пикселей [x, y, alpha]
+                 всех фигур подряд и количество пикселей каждой фигуры.
+        """
+        requests = []  # (ключ, начало координат) каждой фигуры; ключ None -- фигура не видна
+        batches = {}  # (алгоритм, отсечён ли ключ) -> {ключ: точки} промахов-отрезков
+        for algorithm, points in shapes:
+            origin, key = self._key(algorithm, points, clip)
+            requests.append((key, origin))
+            if key is not None and key not in self.entries and algorithm in BATCH_RASTERIZERS:
+                batches.setdefault((algorithm, len(key) > 2), {}).setdefault(key, (points, origin))
+
+        computed = {}
+        for (algorithm, clipped), misses in batches.items():
+            computed.update(self._compute_lines(algorithm, misses, clip if clipped else None))
+
+        parts = []
+        for key, _ in requests:
+            if key is None:
+                parts.append(np.empty((0, 3), dtype=np.int32))
+                continue
+            offsets = computed.pop(key, None)
+            if offsets is not None:
+                self.misses += 1
+                self._store(key, offsets)
+            elif key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                offsets = self.entries[key]
+            else:
+                self.misses += 1
+                offsets = self._compute(key)
+                self._store(key, offsets)
+            parts.append(offsets)
+
+        counts = np.array([len(part) for part in parts], dtype=np.int64)
+        pixels = np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int32)
+        origins = np.array([origin for _, origin in requests], dtype=np.int32).reshape(-1, 2)
+        pixels[:, :2] += np.repeat(origins, counts, axis=0)
+        return pixels, counts
+
+    def cache_info(self):
+        """Статистика попаданий и промахов."""
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self.entries), self.nbytes, self.max_bytes)
+
+    def clear(self):
+        """Очищает кэш и статистику."""
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _key(algorithm, points, clip):
+        """
+        Начало координат и ключ фигуры с учётом отсечения.
+
+        :return: Пара (origin, key); key равен None, если фигура целиком вне прямоугольника.
+        """
+        (ox, oy), key = normalize(algorithm, points)
+        if clip is not None:
+            clip = local_clip(key, (clip[0] - ox, clip[1] - oy, clip[2] - ox, clip[3] - oy))
+            if clip == ():
+                return (ox, oy), None
+            if clip is not None:
+                key = key + (clip,)
+        return (ox, oy), key
+
+    @staticmethod
+    def _compute(key):
+        algorithm, local, *clip = key
+        pixels = RASTERIZERS[algorithm](local, clip[0] if clip else None)
+        if isinstance(pixels, np.ndarray):
+            offsets = np.full((len(pixels), 3), 255, dtype=np.int32)
+            offsets[:, :pixels.shape[1]] = pixels
+        else:
+            pixels = [pixel if len(pixel) == 3 else (pixel[0], pixel[1], 255) for pixel in pixels]
+            offsets = np.array(pixels, dtype=np.int32).reshape(-1, 3)
+        offsets.flags.writeable = False
+        return offsets
+
+    @staticmethod
+    def _compute_lines(algorithm, misses, clip):
+        """
+        Растеризует промахи-отрезки одного алгоритма одним векторизованным вызовом.
+
+        Отрезки строятся в исходных координатах: ключ инвариантного к сдвигу алгоритма
+        отличается от них только началом координат, которое вычитается из результата.
+
+        :param algorithm: Название алгоритма (см. BATCH_RASTERIZERS);
+        :param misses: Словарь ключ -> (исходные точки отрезка, начало координат ключа);
+        :param clip: Прямоугольник (x0, y0, x1, y1) отсечения в исходных координатах или None;
+        :return: Словарь ключ -> массив смещений (M, 3), как у _compute.
+        """
+        keys = list(misses)
+        pixels, offsets = BATCH_RASTERIZERS[algorithm]([misses[key][0] for key in keys], clip)
+
+        result = np.full((len(pixels), 3), 255, dtype=np.int32)
+        if pixels.dtype.names:
+            result[:, 0], result[:, 1], result[:, 2] = pixels["x"], pixels["y"], pixels["alpha"]
+        else:
+            result[:, :2] = pixels
+        origins = np.array([misses[key][1] for key in keys], dtype=np.int32).reshape(-1, 2)
+        result[:, :2] -= np.repeat(origins, np.diff(offsets), axis=0)
+
+        computed = {}
+        for key, start, stop in zip(keys, offsets[:-1].tolist(), offsets[1:].tolist()):
+            # Копия, чтобы вытеснение записи освобождало её память
+            entry = result[start:stop].copy()
+            entry.flags.writeable = False
+            computed[key] = entry
+        return computed
+
+    def _store(self, key, offsets):
+        """Добавляет запись, вытесняя давно не использованные; слишком большие записи не хранятся."""
+        if offsets.nbytes > self.max_bytes:
+            return
+        self.entries[key] = offsets
+        self.nbytes += offsets.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+
+# Кэш, общий для холста и сцены
+raster_cache = RasterCache()
+
+
+def rasterize(algorithm, points, cache=None, clip=None):
+    """Растеризует фигуру через кэш (по умолчанию общий raster_cache)."""
+    return (raster_cache if cache is None else cache).rasterize(algorithm, points, clip)
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def first_true(count, predicate):
+    """
+    Бинарный поиск первого индекса, для которого монотонный предикат истинен.
+
+    :param count: Количество индексов;
+    :param predicate: Функция индекса, ложная до некоторого места и истинная после него;
+    :return: Первый индекс с истинным предикатом или count.
+    """
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if predicate(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def monotone_range(count, key, low, high):
+    """
+    Индексы i из [0, count), для которых low <= key(i) < high, если key монотонна.
+
+    :return: Полуинтервал (first, stop); пустой, если first >= stop.
+    """
+    if count <= 0:
+        return 0, 0
+    if key(0) <= key(count - 1):
+        return first_true(count, lambda i: key(i) >= low), first_true(count, lambda i: key(i) >= high)
+    return first_true(count, lambda i: key(i) < high), first_true(count, lambda i: key(i) < low)
+
+
+def visible_range(count, point, clip):
+    """
+    Индексы монотонной по обеим координатам цепочки точек, попадающих в прямоугольник.
+
+    :param count: Количество точек;
+    :param point: Функция индекса, возвращающая точку (x, y);
+    :param clip: Прямоугольник (x0, y0, x1, y1) с исключающими правой и нижней границами;
+    :return: Полуинтервал (first, stop).
+    """
+    x_first, x_stop = monotone_range(count, lambda i: point(i)[0], clip[0], clip[2])
+    y_first, y_stop = monotone_range(count, lambda i: point(i)[1], clip[1], clip[3])
+    return max(x_first, y_first), min(x_stop, y_stop)
+
+
+def inside(rect, x, y):
+    """Проверяет, попадает ли точка в прямоугольник."""
+    return rect[0] <= x < rect[2] and rect[1] <= y < rect[3]
+
+
+def clip_points(points, clip, as_array=False):
+    """
+    Оставляет точки внутри прямоугольника (или все, если clip равен None).
+
+    :param points: Список точек или массив (M, 2);
+    :return: Список точек или массив в зависимости от as_array.
+    """
+    if clip is not None:
+        if isinstance(points, np.ndarray):
+            x, y = points[:, 0], points[:, 1]
+            points = points[(clip[0] <= x) & (x < clip[2]) & (clip[1] <= y) & (y < clip[3])]
+        else:
+            points = [point for point in points if inside(clip, point[0], point[1])]
+    if as_array and not isinstance(points, np.ndarray):
+        return np.array(points, dtype=np.int64).reshape(-1, 2)
+    return points
@@ -1,16 +1,21 @@
-def draw_circle(x0, y0, radius):
+from math import isqrt
+
+from src.drawing_algorithms.clipping import clip_points, first_true
+from src.drawing_algorithms.conic_sections.symmetry import (OCTANTS, perimeter, perimeter_order, reflect,
+                                                            reflect_array, reflect_clipped)
+
+
+def circle_arc(radius):
+    """
+    Дуга окружности во втором октанте (от (0, radius) до диагонали) относительно центра.
+
+    :param radius: Радиус окружности;
+    :return: Список точек [(x, y), ...] в порядке построения.
+    """
     x = 0
     y = radius
     d = 3 - 2 * radius
-    points = []
-
-    def plot_circle_points(cx, cy, x, y):
-        for dx, dy in [(x, y), (y, x), (-x, y), (-y, x),
-                       (-x, -y), (-y, -x), (x, -y), (y, -x)]:
-            if (cx + dx, cy + dy) not in points:
-                points.append((cx + dx, cy + dy))
-
-    plot_circle_points(x0, y0, x, y)
+    arc = [(x, y)]
     while x <= y:
         if d <= 0:
             d += 4 * x + 6
@@ -18,7 +23,64 @@ def draw_circle(x0, y0, radius):
             d += 4 * (x - y) + 10
             y -= 1
         x += 1
+        arc.append((x, y))
+    return arc
+
+
+def circle_point(radius, index):
+    """
+    Точка index дуги circle_arc(radius) в замкнутой форме, без построения предыдущих.
+
+    До диагонали y -- ближайшее к sqrt(r^2 - x^2) целое с округлением по средней точке:
+    (y - 1/2)^2 < r^2 - x^2 - 1/4, то есть y = (isqrt(4r^2 - 1 - 4x^2) + 1) // 2.
+    Точка с номером index получается из предыдущей одним шагом алгоритма, поэтому верна
+    и последняя точка за диагональю.
+
+    :param radius: Радиус окружности (больше нуля);
+    :param index: Номер точки дуги;
+    :return: Точка (x, y) относительно центра.
+    """
+    if index == 0:
+        return 0, radius
+    x = index - 1
+    y = (isqrt(max(4 * radius * radius - 1 - 4 * x * x, 0)) + 1) // 2
+    d = 2 * (x + 1) ** 2 + y * y + (y - 1) ** 2 - 2 * radius * radius
+    return index, y - (d > 0)
+
+
+def circle_arc_length(radius):
+    """Количество точек дуги circle_arc(radius): построение идёт до первой точки за диагональю."""
+    return first_true(radius + 2, lambda i: i > circle_point(radius, i)[1]) + 1
+
+
+def draw_circle(x0, y0, radius, ordered=False, as_array=False, clip=None):
+    """
+    Алгоритм Брезенхема для окружности.
+
+    Строится одна дуга октанта, остальные точки получаются отражениями;
+    повторы отбрасываются за O(1) на точку.
 
-        plot_circle_points(x0, y0, x, y)
+    :param x0: Координата x центра;
+    :param y0: Координата y центра;
+    :param radius: Радиус окружности;
+    :param ordered: Вернуть пиксели в порядке обхода контура, а не в порядке построения;
+    :param as_array: Вернуть массив NumPy формы (M, 2) вместо списка;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; вычисляются только точки дуги,
+                 отражения которых попадают в него;
+    :return: Список пикселей [(x, y), ...] или массив.
+    """
+    if clip is not None and radius > 0:
+        points = reflect_clipped(circle_arc_length(radius), lambda i: circle_point(radius, i), x0, y0, OCTANTS, clip)
+        if ordered:
+            return perimeter_order(points, x0, y0, as_array)
+        return clip_points(points, None, as_array)
 
-    return points
+    arc = circle_arc(radius)
+    if ordered and radius > 0:
+        # Точки за диагональю переносятся в октант, после чего октант отражается в четверть
+        octant = sorted({(min(x, y), max(x, y)) for x, y in arc}, key=lambda point: (point[0], -point[1]))
+        quadrant = octant + [(y, x) for x, y in reversed(octant) if x != y]
+        return perimeter(quadrant, x0, y0, as_array)
+    if as_array:
+        return clip_points(reflect_array(arc, x0, y0, OCTANTS), clip)
+    return clip_points(reflect(arc, x0, y0, OCTANTS), clip)
@@ -1,14 +1,18 @@
-def draw_ellipse(start, end):
-    x0, y0 = start
-    x1, y1 = end
-    # Центр эллипса
-    xc = (x0 + x1) // 2
-    yc = (y0 + y1) // 2
+from math import isqrt
 
-    # Полуоси
-    a = abs(x1 - x0) // 2
-    b = abs(y1 - y0) // 2
+from src.drawing_algorithms.clipping import clip_points, first_true
+from src.drawing_algorithms.conic_sections.symmetry import (QUADRANTS, perimeter, perimeter_order, reflect,
+                                                            reflect_array, reflect_clipped)
+
+
+def ellipse_arc(a, b):
+    """
+    Дуга эллипса в первой четверти (от (0, b) до (a, 0)) относительно центра.
 
+    :param a: Горизонтальная полуось;
+    :param b: Вертикальная полуось;
+    :return: Список точек [(x, y), ...] в порядке построения.
+    """
     x = 0
     y = b
     a2 = a * a
@@ -16,16 +20,11 @@ def draw_ellipse(start, end):
     fx = 0
     fy = 2 * a2 * y
     p = b2 - a2 * b + 0.25 * a2
-    points = []
-
-    def plot_points(cx, cy, x, y):
-        for dx, dy in [(x, y), (-x, y), (-x, -y), (x, -y)]:
-            if (cx + dx, cy + dy) not in points:
-                points.append((cx + dx, cy + dy))
+    arc = []
 
     # Первая область
     while fx < fy:
-        plot_points(xc, yc, x, y)
+        arc.append((x, y))
         x += 1
         fx += 2 * b2
         if p < 0:
@@ -38,7 +37,7 @@ def draw_ellipse(start, end):
     # Вторая область
     p = b2 * (x + 0.5) ** 2 + a2 * (y - 1) ** 2 - a2 * b2
     while y >= 0:
-        plot_points(xc, yc, x, y)
+        arc.append((x, y))
         y -= 1
         fy -= 2 * a2
         if p > 0:
@@ -48,4 +47,90 @@ def draw_ellipse(start, end):
             fx += 2 * b2
             p += fx - a2 * (2 * y + 1)
 
-    return points
+    return arc
+
+
+def ellipse_geometry(a, b):
+    """
+    Дуга ellipse_arc(a, b) в замкнутой форме: количество точек и точка по номеру.
+
+    В первой области y -- ближайшее к b * sqrt(1 - x^2 / a^2) целое с округлением по
+    средней точке, y = (isqrt((4a^2 b^2 - 4b^2 x^2) // a^2) + 1) // 2. Переход во вторую
+    область -- первый x, где b^2 x >= a^2 y; его состояние получается одним шагом первой
+    области. Во второй области для строки y берётся наименьший x, при котором средняя
+    точка строки y + 1 лежит вне эллипса, но не меньше x перехода.
+
+    :param a: Горизонтальная полуось;
+    :param b: Вертикальная полуось;
+    :return: Количество точек дуги и функция номера, возвращающая точку (x, y).
+    """
+    a2 = a * a
+    b2 = b * b
+
+    def region1_y(x):
+        return (isqrt((4 * a2 * b2 - 4 * b2 * x * x) // a2) + 1) // 2
+
+    def state_y(x):
+        # y после перехода к столбцу x: шаг вниз, если средняя точка не внутри эллипса
+        if x == 0:
+            return b
+        y = region1_y(x - 1)
+        return y - (4 * b2 * x * x + a2 * (2 * y - 1) ** 2 - 4 * a2 * b2 >= 0)
+
+    if a == 0 or b == 0:
+        x_turn, y_turn = 0, b
+    else:
+        x_turn = first_true(a + 1, lambda x: b2 * x >= a2 * state_y(x))
+        y_turn = state_y(x_turn)
+
+    def point(index):
+        if index < x_turn:
+            return index, region1_y(index)
+        y = y_turn - (index - x_turn)
+        if y == y_turn:
+            return x_turn, y
+        # Наименьший x с b^2 (2x + 1)^2 > limit: средняя точка строки y + 1 вне эллипса
+        limit = 4 * a2 * b2 - 4 * a2 * y * y + 8 * a2 * (y_turn - y - 1)
+        x = (isqrt(limit // b2) + 1) // 2
+        return max(x, x_turn), y
+
+    return x_turn + y_turn + 1, point
+
+
+def draw_ellipse(start, end, ordered=False, as_array=False, clip=None):
+    """
+    Алгоритм средней точки для эллипса, вписанного в прямоугольник start-end.
+
+    Строится дуга первой четверти, остальные точки получаются отражениями;
+    повторы отбрасываются за O(1) на точку.
+
+    :param start: Угол описанного прямоугольника;
+    :param end: Противоположный угол;
+    :param ordered: Вернуть пиксели в порядке обхода контура, а не в порядке построения;
+    :param as_array: Вернуть массив NumPy формы (M, 2) вместо списка;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; вычисляются только точки дуги,
+                 отражения которых попадают в него;
+    :return: Список пикселей [(x, y), ...] или массив.
+    """
+    x0, y0 = start
+    x1, y1 = end
+    # Центр эллипса
+    xc = (x0 + x1) // 2
+    yc = (y0 + y1) // 2
+
+    # Полуоси
+    a = abs(x1 - x0) // 2
+    b = abs(y1 - y0) // 2
+
+    if clip is not None:
+        points = reflect_clipped(*ellipse_geometry(a, b), xc, yc, QUADRANTS, clip)
+        if ordered:
+            return perimeter_order(points, xc, yc, as_array)
+        return clip_points(points, None, as_array)
+
+    arc = ellipse_arc(a, b)
+    if ordered:
+        return perimeter(arc, xc, yc, as_array)
+    if as_array:
+        return reflect_array(arc, xc, yc, QUADRANTS)
+    return reflect(arc, xc, yc, QUADRANTS)
@@ -1,4 +1,17 @@
-def draw_hyperbola(start, end):
+from src.drawing_algorithms.clipping import inside
+
+
+def draw_hyperbola(start, end, clip=None):
+    """
+    Строит гиперболу с вершинами, заданными прямоугольником start-end.
+
+    :param start: Угол прямоугольника (x0, y0);
+    :param end: Противоположный угол (x1, y1);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения. Точки, не попадающие в него,
+                 не сохраняются, а построение прекращается, как только все четыре ветви
+                 вышли за него (x и y вдоль ветвей только растут);
+    :return: Список пикселей [(x, y), ...].
+    """
     x0, y0 = start
     x1, y1 = end
     a = round(abs(x1 - x0) / 2)
@@ -10,10 +23,16 @@ def draw_hyperbola(start, end):
     points = []
 
     while x - a <= abs(x1 - x0):
-        points.extend([(x + x0 - a, y + y0),
-                       (x + x0 - a, y0 - y),
-                       (x0 - a - x, y + y0),
-                       (x0 - a - x, y0 - y)])
+        branches = [(x + x0 - a, y + y0),
+                    (x + x0 - a, y0 - y),
+                    (x0 - a - x, y + y0),
+                    (x0 - a - x, y0 - y)]
+        if clip is None:
+            points.extend(branches)
+        else:
+            if (x + x0 - a >= clip[2] and x0 - a - x < clip[0]) or (y + y0 >= clip[3] and y0 - y < clip[1]):
+                break
+            points.extend(point for point in branches if inside(clip, *point))
         if d < 0:
             delta = d * 2 + 2 * y * (a ** 2) + a ** 2
             if delta <= 0:
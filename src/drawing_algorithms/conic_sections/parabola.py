@@ -1,78 +1,150 @@
-import matplotlib.pyplot as plt
+from math import isqrt
 
-def draw_parabola(start, end):
-    """
-    Строит параболу x^2 = 2py, смещённую так, чтобы проходить через (x0, y0) и (x1, y1).
-    Поддерживает параболы, открытые вверх и вниз.
+import numpy as np
+
+from src.drawing_algorithms.clipping import clip_points
+from src.drawing_algorithms.conic_sections.symmetry import reflect_clipped
+
+
+def _parabola_params(start, end):
     """
+    Параметры параболы с вершиной в start, проходящей через end.
 
+    Парабола x^2 = 2py записывается в целых числах как |dy| * x^2 = dx^2 * y,
+    то есть p = dx^2 / (2 |dy|) вычисляется сразу и точно.
+
+    :return: |dx|, |dy|, направление ветвей (1 -- вниз по экрану, -1 -- вверх) и
+             последний x первой зоны (где наклон меньше 1).
+    """
     x0, y0 = start
     x1, y1 = end
 
     if y1 == y0:
         raise ValueError("y1 не должно быть равно y0 (иначе парабола вырождается)")
 
-    dy = y1 - y0
-    dx = x1 - x0
-    direction = 1 if dy > 0 else -1  # 1 — вверх, -1 — вниз
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    direction = 1 if y1 > y0 else -1
+    # Первая зона: x < p, то есть 2 * x * |dy| < dx^2; дальше конечной точки не строим
+    border_x = max(min(dx, (dx * dx - 1) // (2 * dy)), 0)
+    return dx, dy, direction, border_x
 
-    # Вычисление начального p
-    p = dx ** 2 / (2 * abs(dy))
 
-    # Центрирование: вершина -> (0,0)
-    x = 0
-    y = 0
-    d = 1 - 2 * p
-    border_x = 2 * p
+def parabola_geometry(start, end):
+    """
+    Правая ветвь draw_parabola в замкнутой форме: количество точек и точка по номеру.
+
+    В первой зоне y = round(a / b * x^2), во второй x = round(sqrt(b / a * y)) -- те же
+    формулы, что и в _parabola_array, но для одной точки.
+
+    :return: Количество точек ветви и функция номера, возвращающая точку (x, y)
+             относительно вершины (y отсчитывается в сторону ветвей).
+    """
+    dx, dy, direction, border_x = _parabola_params(start, end)
+    a, b = dy, dx * dx
+
+    def zone1_y(x):
+        return (2 * a * x * x + b) // (2 * b) if b else 0
+
+    border_y = zone1_y(border_x)
+
+    def point(index):
+        if index <= border_x:
+            return index, zone1_y(index)
+        y = border_y + index - border_x
+        return (isqrt(4 * b * y // a) + 1) // 2, y
+
+    return border_x + 1 + dy - border_y, point
+
 
+def draw_parabola(start, end, as_array=False, clip=None):
+    """
+    Строит параболу x^2 = 2py с вершиной в start, проходящую через end.
+    Поддерживает параболы, открытые вверх и вниз.
+
+    Алгоритм средней точки в целых числах за один проход: в первой зоне шаг
+    по x, во второй -- по y; в каждой зоне выбирается ближайший к кривой пиксель,
+    поэтому кривая точно попадает в конечную точку.
+
+    :param start: Вершина параболы (x0, y0);
+    :param end: Точка (x1, y1) на параболе, ограничивающая ветви по |x - x0| <= |x1 - x0|;
+    :param as_array: Вычислить все точки векторно и вернуть массив NumPy формы (M, 2);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; вычисляются только точки,
+                 попадающие в него;
+    :return: Список пикселей [(x, y), ...] или массив.
+    """
+    if clip is not None:
+        direction = 1 if end[1] > start[1] else -1
+        # Правая и левая ветви; точка на оси совпадает со своим отражением и берётся один раз
+        branches = [(False, 1, direction), (False, -1, direction)]
+        count, point = parabola_geometry(start, end)
+        return clip_points(reflect_clipped(count, point, start[0], start[1], branches, clip), None, as_array)
+
+    if as_array:
+        return _parabola_array(start, end)
+
+    x0, y0 = start
+    dx, dy, direction, border_x = _parabola_params(start, end)
+    a, b = dy, dx * dx  # Кривая: a * x^2 = b * y
     points = []
-    prev_points = []
 
-    # Итеративно уточняем p
-    iteration = 0
+    def plot_points(x, y):
+        points.append((x0 + x, y0 + direction * y))
+        if x:
+            points.append((x0 - x, y0 + direction * y))
+
+    # Зона 1: шаг по x, y -- ближайшее целое к a / b * x^2.
+    # d = 2a * x^2 - b * (2y + 1); d >= 0 -- кривая не ниже средней точки, y увеличивается
+    x = 0
+    y = 0
+    d = -b
     while True:
-        iteration += 1
-        points.clear()
-        prev_points.clear()
-
-        # Строим параболу с текущим p
-        x = 0
-        y = 0
-        d = 1 - 2 * p
-        border_x = 2 * p
-
-        # Зона 1
-        while x < border_x and abs(y) <= abs(dy):
-            points.append((x0 + x, y0 + y))
-            points.append((x0 - x, y0 + y))
-            if d < 0:
-                d = d + 2 * x + 3
-            else:
-                d = d + 2 * x - 4 * p + 3
-                y = y + direction
+        plot_points(x, y)
+        if x == border_x:
+            break
+        d += 2 * a * (2 * x + 1)
+        x += 1
+        if d >= 0:
+            y += 1
+            d -= 2 * b
+
+    # Зона 2: шаг по y, x -- ближайшее целое к sqrt(b / a * y).
+    # e = 4b * y - a * (2x + 1)^2; e >= 0 -- кривая не левее средней точки, x увеличивается
+    y += 1
+    e = 4 * b * y - a * (2 * x + 1) ** 2
+    while y <= dy:
+        while e >= 0:
+            e -= 8 * a * (x + 1)
             x += 1
+        plot_points(x, y)
+        e += 4 * b
+        y += 1
 
-        # Зона 2
-        while abs(y) <= abs(dy):
-            points.append((x0 + x, y0 + y))
-            points.append((x0 - x, y0 + y))
-            if d > 0:
-                d = d - 4 * p + 2
-            else:
-                d = d + 2 * x - 4 * p + 2
-                x += 1
-            y = y + direction
-
-        # Проверяем попадание в (x1, y1)
-        if any((px, py) == (x1, y1) for px, py in points):
-            break
+    return points
 
-        # Если точка не попала, уточняем p с помощью интерполяции
-        p = p - 0.1 * (dy / (y1 - y0))  # Примерная корректировка
 
-        # Ограничение на количество итераций
-        if iteration > 100:
-            print("Не удалось точно попасть в точку (x1, y1) после 100 итераций.")
-            break
+def _parabola_array(start, end):
+    """Те же точки, что и у draw_parabola, вычисленные по формулам для всех x и y сразу."""
+    x0, y0 = start
+    dx, dy, direction, border_x = _parabola_params(start, end)
+    a, b = dy, dx * dx
+
+    # Зона 1: y = round(a / b * x^2)
+    xs1 = np.arange(border_x + 1, dtype=np.int64)
+    ys1 = (2 * a * xs1 * xs1 + b) // (2 * b) if b else xs1
+
+    # Зона 2: x = round(sqrt(b / a * y)) с целочисленной поправкой результата sqrt
+    ys2 = np.arange(ys1[-1] + 1, dy + 1, dtype=np.int64)
+    xs2 = np.floor(np.sqrt(b * ys2 / a)).astype(np.int64)
+    for _ in range(2):
+        xs2 += a * (2 * xs2 + 1) ** 2 <= 4 * b * ys2
+        xs2 -= (xs2 > 0) & (a * (2 * xs2 - 1) ** 2 > 4 * b * ys2)
 
-    return points
\ No newline at end of file
+    xs = np.concatenate([xs1, xs2])
+    ys = np.concatenate([ys1, ys2])
+    # Для каждой точки -- правая и левая ветви; точка на оси (x = 0) берётся один раз
+    pairs = np.stack([np.stack([x0 + xs, y0 + direction * ys], axis=1),
+                      np.stack([x0 - xs, y0 + direction * ys], axis=1)], axis=1)
+    keep = np.ones((len(xs), 2), dtype=bool)
+    keep[:, 1] = xs != 0
+    return pairs[keep]
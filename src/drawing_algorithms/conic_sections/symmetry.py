@@ -0,0 +1,129 @@
+import numpy as np
+
+from src.drawing_algorithms.clipping import visible_range
+
+# Отражения точки дуги (x, y): (перестановка координат, знак x, знак y)
+OCTANTS = [(False, 1, 1), (True, 1, 1), (False, -1, 1), (True, -1, 1),
+           (False, -1, -1), (True, -1, -1), (False, 1, -1), (True, 1, -1)]
+QUADRANTS = [(False, 1, 1), (False, -1, 1), (False, -1, -1), (False, 1, -1)]
+
+
+def unique_in_order(points):
+    """
+    Убирает повторяющиеся точки, сохраняя первое вхождение.
+
+    :param points: Массив формы (M, 2);
+    :return: Массив формы (K, 2) без повторов в исходном порядке.
+    """
+    if not len(points):
+        return points
+    low = points.min(axis=0)
+    width = points[:, 0].max() - low[0] + 1
+    keys = (points[:, 1] - low[1]) * width + (points[:, 0] - low[0])
+    _, first = np.unique(keys, return_index=True)
+    return points[np.sort(first)]
+
+
+def reflect(arc, cx, cy, symmetries):
+    """
+    Отражает дугу по осям симметрии относительно центра, без повторов.
+
+    Порядок совпадает с поточечным построением: для каждой точки дуги все её отражения.
+
+    :param arc: Список точек дуги [(x, y), ...] относительно центра;
+    :param symmetries: OCTANTS или QUADRANTS;
+    :return: Список пикселей [(x, y), ...].
+    """
+    points = []
+    seen = set()
+    for x, y in arc:
+        for swap, sx, sy in symmetries:
+            dx, dy = (y, x) if swap else (x, y)
+            point = (cx + sx * dx, cy + sy * dy)
+            if point not in seen:
+                seen.add(point)
+                points.append(point)
+    return points
+
+
+def reflect_clipped(count, point, cx, cy, symmetries, clip):
+    """
+    Отражения дуги, попадающие в прямоугольник, в том же порядке, что и у reflect.
+
+    Дуга задаётся не списком, а функцией номера точки, и должна быть монотонна по обеим
+    координатам; тогда видимая часть каждого отражения -- один отрезок номеров, который
+    находится бинарным поиском, и вычисляются только видимые точки.
+
+    :param count: Количество точек дуги;
+    :param point: Функция номера, возвращающая точку дуги (x, y) относительно центра;
+    :param symmetries: OCTANTS, QUADRANTS или другой список отражений;
+    :param clip: Прямоугольник (x0, y0, x1, y1);
+    :return: Список пикселей [(x, y), ...].
+    """
+    visible = []
+    for index, (swap, sx, sy) in enumerate(symmetries):
+        def reflected(i, swap=swap, sx=sx, sy=sy):
+            dx, dy = point(i)
+            if swap:
+                dx, dy = dy, dx
+            return cx + sx * dx, cy + sy * dy
+
+        first, stop = visible_range(count, reflected, clip)
+        visible.extend((i, index, reflected(i)) for i in range(first, stop))
+
+    visible.sort()
+    points = []
+    seen = set()
+    for _, _, point in visible:
+        if point not in seen:
+            seen.add(point)
+            points.append(point)
+    return points
+
+
+def reflect_array(arc, cx, cy, symmetries):
+    """То же, что reflect, но возвращает массив формы (M, 2)."""
+    arc = np.asarray(arc, dtype=np.int64).reshape(-1, 2)
+    points = np.empty((len(arc), len(symmetries), 2), dtype=np.int64)
+    for index, (swap, sx, sy) in enumerate(symmetries):
+        source = arc[:, ::-1] if swap else arc
+        points[:, index, 0] = cx + sx * source[:, 0]
+        points[:, index, 1] = cy + sy * source[:, 1]
+    return unique_in_order(points.reshape(-1, 2))
+
+
+def perimeter(quadrant, cx, cy, as_array=False):
+    """
+    Обходит контур по порядку, собирая его из дуги первой четверти.
+
+    :param quadrant: Упорядоченная дуга от (0, b) до (a, 0) относительно центра;
+    :param as_array: Вернуть массив формы (M, 2) вместо списка;
+    :return: Пиксели контура без повторов в порядке обхода.
+    """
+    quadrant = np.asarray(quadrant, dtype=np.int64).reshape(-1, 2)
+    backward = quadrant[::-1]
+    on_x, on_y = quadrant[:, 1] == 0, quadrant[:, 0] == 0
+    # Точки на осях совпадают со своими отражениями и берутся только из первой встретившейся четверти
+    points = np.concatenate([quadrant,
+                             (backward * (1, -1))[~on_x[::-1]],
+                             (quadrant * (-1, -1))[~on_y],
+                             (backward * (-1, 1))[~(on_x | on_y)[::-1]]]) + (cx, cy)
+    return points if as_array else [tuple(point) for point in points.tolist()]
+
+
+def perimeter_order(points, cx, cy, as_array=False):
+    """
+    Упорядочивает часть контура так же, как perimeter обходит контур целиком.
+
+    :param points: Пиксели контура, симметричного относительно центра, [(x, y), ...];
+    :param as_array: Вернуть массив формы (M, 2) вместо списка;
+    :return: Пиксели в порядке обхода.
+    """
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+    dx, dy = points[:, 0] - cx, points[:, 1] - cy
+    # Четверти обхода и порядок внутри каждой из них (см. perimeter)
+    piece = np.where(dx >= 0, np.where(dy >= 0, 0, 1), np.where(dy <= 0, 2, 3))
+    major = np.choose(piece, [dx, -dx, -dx, dx])
+    minor = np.choose(piece, [-dy, -dy, dy, dy])
+    points = points[np.lexsort((minor, major, piece))]
+    return points if as_array else [tuple(point) for point in points.tolist()]
@@ -0,0 +1,154 @@
+import numpy as np
+
+from src.drawing_algorithms.curves.flatten import B_SPLINE, BEZIER, CATMULL_ROM, HERMITE, TO_BEZIER, evaluate, hull_visible
+from src.drawing_algorithms.lines.batch import counts_to_offsets
+
+# Количество отсчётов t, вычисляемых за один блок
+SAMPLE_BLOCK_SIZE = 65536
+
+# Вид цепочки -> (базисная матрица, сдвиг между соседними сегментами в контрольных точках)
+CHAINS = {
+    "bezier": (BEZIER, 3),  # Составная кривая Безье: P0..P3, P3..P6, ... (3k + 1 точек)
+    "b-spline": (B_SPLINE, 1),  # Равномерный B-сплайн: сегмент на каждые 4 подряд идущие точки
+    "catmull-rom": (CATMULL_ROM, 1),  # Catmull-Rom: проходит через P1..P(N-2)
+}
+
+
+def chain_segments(kind, control):
+    """
+    Разбивает контрольные точки цепочки на сегменты.
+
+    :param kind: Вид цепочки (см. CHAINS);
+    :param control: Контрольные точки формы (N, 2) или набор цепочек одной длины (C, N, 2);
+    :return: Базисная матрица и массив сегментов (S, 4, 2) или (C, S, 4, 2).
+    """
+    if kind not in CHAINS:
+        raise ValueError(f"Неизвестный вид цепочки: {kind}")
+    basis, stride = CHAINS[kind]
+    control = np.asarray(control, dtype=float)
+    count = control.shape[-2]
+    if count < 4 or (count - 1) % stride:
+        raise ValueError(f"Цепочке {kind} нужно не менее 4 точек" +
+                         (" и 3k + 1 точек" if stride > 1 else ""))
+    starts = np.arange(0, count - 3, stride)
+    return basis, control[..., starts[:, None] + np.arange(4), :]
+
+
+def hermite_segments(points, tangents):
+    """
+    Сегменты кривой Эрмита через все точки с заданными в них касательными.
+
+    :param points: Точки формы (N, 2) или (C, N, 2);
+    :param tangents: Векторы касательных той же формы;
+    :return: Массив сегментов [P_i, P_i+1, R_i, R_i+1] формы (N - 1, 4, 2) или (C, N - 1, 4, 2).
+    """
+    points = np.asarray(points, dtype=float)
+    tangents = np.asarray(tangents, dtype=float)
+    if points.shape != tangents.shape or points.shape[-2] < 2:
+        raise ValueError("Касательные должны быть заданы для каждой из не менее чем 2 точек")
+    return np.stack([points[..., :-1, :], points[..., 1:, :], tangents[..., :-1, :], tangents[..., 1:, :]], axis=-2)
+
+
+def flatten_segments(basis, segments, segment_counts, clip=None):
+    """
+    Растеризует сегменты нескольких цепочек за одно векторное вычисление.
+
+    Для каждого сегмента число шагов и значения t те же, что и у flatten, и точки
+    вычисляются той же функцией evaluate, поэтому каждый сегмент совпадает с flatten.
+    Отсчёты всех сегментов упакованы в один массив и обрабатываются блоками по
+    SAMPLE_BLOCK_SIZE, чтобы промежуточные массивы оставались в кэше процессора.
+    Соседние одинаковые пиксели убираются в пределах цепочки, поэтому стык
+    сегментов даёт один пиксель. При отсечении сегменты, многоугольник Безье которых
+    не пересекает прямоугольник, не вычисляются.
+
+    :param basis: Базисная матрица 4x4;
+    :param segments: Контрольные данные сегментов всех цепочек подряд, массив (S, 4, 2);
+    :param segment_counts: Количество сегментов каждой цепочки;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения или None;
+    :return: Пара (coords, offsets) -- массив int32 формы (M, 2) и таблица смещений по цепочкам.
+    """
+    segments = np.asarray(segments, dtype=float).reshape(-1, 4, 2)
+    segment_counts = np.asarray(segment_counts, dtype=np.int64)
+    chain_ids = np.repeat(np.arange(len(segment_counts)), segment_counts)
+
+    # Число шагов -- как у step_count: по длине звеньев многоугольника Безье
+    polygons = (TO_BEZIER @ basis) @ segments
+    legs = np.diff(polygons, axis=1)
+    steps = np.floor(3 * np.hypot(legs[..., 0], legs[..., 1]).max(axis=1)).astype(np.int64) + 1
+    coefficients = basis @ segments
+    visible = np.ones(len(segments), dtype=bool)
+    if clip is not None:
+        visible = hull_visible(polygons.min(axis=1), polygons.max(axis=1), clip)
+    samples = np.where(visible, steps + 1, 0)
+    sample_offsets = counts_to_offsets(samples)
+
+    # Первая точка цепочки и первая точка после пропущенного сегмента остаются всегда,
+    # остальные -- если отличаются от предыдущей
+    chain_start = np.ones(len(segments), dtype=bool)
+    chain_start[1:] = (chain_ids[1:] != chain_ids[:-1]) | ~visible[:-1]
+
+    points = np.empty((sample_offsets[-1], 2), dtype=np.int32)
+    keep = np.empty(sample_offsets[-1], dtype=bool)
+    for begin in range(0, sample_offsets[-1], SAMPLE_BLOCK_SIZE):
+        end = min(begin + SAMPLE_BLOCK_SIZE, sample_offsets[-1])
+        ids = np.searchsorted(sample_offsets, np.arange(begin, end), side="right") - 1
+        index = np.arange(begin, end) - sample_offsets[ids]
+        t = index * (1 / steps[ids])
+        t[index == steps[ids]] = 1.0
+        points[begin:end] = np.floor(evaluate(coefficients[ids], t) + 0.5)
+        keep[begin:end] = (index == 0) & chain_start[ids]
+    keep[1:] |= (points[1:] != points[:-1]).any(axis=1)
+
+    sample_chains = np.repeat(chain_ids, samples)
+    if clip is not None:
+        x, y = points[:, 0], points[:, 1]
+        keep &= (clip[0] <= x) & (x < clip[2]) & (clip[1] <= y) & (y < clip[3])
+    offsets = counts_to_offsets(np.bincount(sample_chains[keep], minlength=len(segment_counts)))
+    return points[keep], offsets
+
+
+def spline_chains(chains, kind="bezier", tangents=None, clip=None):
+    """
+    Растеризует набор цепочек сплайнов (например, при импорте векторной графики).
+
+    :param chains: Цепочки одной длины (C, N, 2) или последовательность массивов (N_i, 2);
+    :param kind: Вид цепочки (см. CHAINS) или "hermite" -- тогда нужны касательные;
+    :param tangents: Касательные в точках цепочек для "hermite", той же формы, что и chains;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения или None;
+    :return: Пара (coords, offsets) -- массив int32 формы (M, 2) и таблица смещений,
+             пиксели цепочки i лежат в coords[offsets[i]:offsets[i + 1]].
+    """
+    def split(control, tangent=None):
+        if kind == "hermite":
+            if tangent is None:
+                raise ValueError("Для цепочки Эрмита нужны касательные")
+            return HERMITE, hermite_segments(control, tangent)
+        return chain_segments(kind, control)
+
+    if isinstance(chains, np.ndarray) and chains.ndim == 3:
+        basis, segments = split(chains, tangents)
+        counts = np.full(len(chains), segments.shape[1], dtype=np.int64)
+        return flatten_segments(basis, segments.reshape(-1, 4, 2), counts, clip)
+
+    tangents = [None] * len(chains) if tangents is None else tangents
+    parts = [split(control, tangent) for control, tangent in zip(chains, tangents)]
+    if not parts:
+        return np.empty((0, 2), dtype=np.int32), np.zeros(1, dtype=np.int64)
+    basis = parts[0][0]
+    segments = np.concatenate([part[1] for part in parts])
+    return flatten_segments(basis, segments, [len(part[1]) for part in parts], clip)
+
+
+def draw_spline_chain(control, kind="bezier", tangents=None, as_array=False, clip=None):
+    """
+    Растеризует цепочку сплайнов по всему контрольному многоугольнику сразу.
+
+    :param control: Контрольные точки формы (N, 2);
+    :param kind: "bezier" (3k + 1 точек), "b-spline", "catmull-rom" или "hermite";
+    :param tangents: Касательные в каждой точке для "hermite";
+    :param as_array: Вернуть массив NumPy формы (M, 2) вместо списка;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; сегменты вне него не вычисляются;
+    :return: Список пикселей [(x, y), ...] или массив.
+    """
+    coords, _ = spline_chains([control], kind, None if tangents is None else [tangents], clip)
+    return coords if as_array else [tuple(pixel) for pixel in coords.tolist()]
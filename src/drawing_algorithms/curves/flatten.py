@@ -0,0 +1,190 @@
+import math
+
+import numpy as np
+
+from src.drawing_algorithms.clipping import clip_points
+
+# Базисные матрицы кубических кривых: точка кривой = [t^3, t^2, t, 1] @ M @ P
+BEZIER = np.array([
+    [-1, 3, -3, 1],
+    [3, -6, 3, 0],
+    [-3, 3, 0, 0],
+    [1, 0, 0, 0]
+], dtype=float)
+
+HERMITE = np.array([
+    [2, -2, 1, 1],
+    [-3, 3, -2, -1],
+    [0, 0, 1, 0],
+    [1, 0, 0, 0]
+], dtype=float)
+
+B_SPLINE = np.array([
+    [-1, 3, -3, 1],
+    [3, -6, 3, 0],
+    [-3, 0, 3, 0],
+    [1, 4, 1, 0]
+]) / 6
+
+# Catmull-Rom: сегмент от P1 до P2 по точкам P0..P3, касательные (P2 - P0) / 2 и (P3 - P1) / 2
+CATMULL_ROM = np.array([
+    [-1, 3, -3, 1],
+    [2, -5, 4, -1],
+    [-1, 0, 1, 0],
+    [0, 2, 0, 0]
+]) / 2
+
+# Переход от коэффициентов многочлена к контрольным точкам Безье
+TO_BEZIER = np.linalg.inv(BEZIER)
+
+# Количество шагов по t в одном участке кривой при отсечении
+CLIP_CHUNK = 64
+
+
+def bezier_polygon(basis, control):
+    """
+    Контрольный многоугольник Безье того же кубического сегмента.
+
+    :param basis: Базисная матрица 4x4 (BEZIER, HERMITE, B_SPLINE);
+    :param control: Контрольные данные сегмента, массив (4, 2);
+    :return: Массив (4, 2) вершин многоугольника Безье.
+    """
+    return TO_BEZIER @ basis @ np.asarray(control, dtype=float)
+
+
+def step_count(basis, control):
+    """
+    Количество шагов по t, при котором соседние точки кривой ближе одного пикселя.
+
+    Скорость кубической кривой Безье не превышает 3 * (длина наибольшего звена
+    контрольного многоугольника), поэтому такого числа шагов достаточно и для
+    длинных, и для коротких кривых.
+    """
+    legs = np.diff(bezier_polygon(basis, control), axis=0)
+    return math.floor(3 * np.hypot(legs[:, 0], legs[:, 1]).max()) + 1
+
+
+def parameter_values(indices, steps):
+    """Значения t = i / steps, те же, что и у np.linspace(0, 1, steps + 1)."""
+    t = indices * (1 / steps)
+    t[indices == steps] = 1.0
+    return t
+
+
+def evaluate(coefficients, t):
+    """
+    Точки кривой [t^3, t^2, t, 1] @ coefficients по схеме Горнера.
+
+    :param coefficients: Коэффициенты многочлена (4, 2) или свои для каждого t, (M, 4, 2);
+    :param t: Значения параметра формы (M,);
+    :return: Массив float формы (M, 2).
+    """
+    t = t[:, None]
+    return ((coefficients[..., 0, :] * t + coefficients[..., 1, :]) * t + coefficients[..., 2, :]) * t + \
+        coefficients[..., 3, :]
+
+
+def hull_visible(low, high, clip):
+    """
+    Может ли участок кривой с оболочкой [low, high] дать пиксель внутри прямоугольника.
+
+    Пиксель floor(p + 0.5) попадает в [x0, x1), если p в [x0 - 0.5, x1 - 0.5); запас -- на погрешность.
+
+    :param low: Нижние углы оболочек формы (K, 2);
+    :param high: Верхние углы оболочек формы (K, 2);
+    :param clip: Прямоугольник (x0, y0, x1, y1);
+    :return: Булев массив формы (K,).
+    """
+    return ((high >= np.array(clip[:2]) - 0.5 - 1e-6) & (low < np.array(clip[2:]) - 0.5 + 1e-6)).all(axis=1)
+
+
+def visible_steps(coefficients, steps, clip):
+    """
+    Номера шагов по t на участках кривой, которые могут попасть в прямоугольник.
+
+    Кривая делится на участки по CLIP_CHUNK шагов; для каждого участка многочлен
+    перепараметризуется на [t_a, t_b] и переводится в контрольный многоугольник Безье,
+    который содержит участок целиком. Участки, многоугольник которых не пересекает
+    прямоугольник (расширенный на половину пикселя из-за округления), пропускаются.
+
+    :param coefficients: Коэффициенты многочлена basis @ control, массив (4, 2);
+    :param steps: Количество шагов по t;
+    :param clip: Прямоугольник (x0, y0, x1, y1);
+    :return: Массив номеров шагов по возрастанию.
+    """
+    starts = np.arange(0, steps + 1, CLIP_CHUNK)
+    t_a = parameter_values(starts, steps)[:, None]
+    h = parameter_values(np.minimum(starts + CLIP_CHUNK, steps), steps)[:, None] - t_a
+    c0, c1, c2, c3 = coefficients
+    local = np.stack([c0 * h ** 3,
+                      (3 * c0 * t_a + c1) * h ** 2,
+                      (3 * c0 * t_a ** 2 + 2 * c1 * t_a + c2) * h,
+                      ((c0 * t_a + c1) * t_a + c2) * t_a + c3], axis=1)
+    hull = TO_BEZIER @ local
+    visible = hull_visible(hull.min(axis=1), hull.max(axis=1), clip)
+    chunks = [np.arange(start, min(start + CLIP_CHUNK, steps + 1)) for start in starts[visible]]
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+
+def fixed_points(basis, control, num_points, repeats):
+    """
+    Пиксели кривой при заданном количестве точек -- так же, как в исходных реализациях кривых.
+
+    Значения t -- np.linspace(0, 1, num_points), точка -- [t^3, t^2, t, 1] @ basis @ control
+    для каждого t отдельно (матричное произведение сразу для всех t складывает в другом
+    порядке и на точных половинах может округлиться иначе), координаты округляются
+    round() (половины -- к чётному).
+
+    :param basis: Базисная матрица 4x4;
+    :param control: Контрольные данные сегмента (4 точки);
+    :param num_points: Количество точек на кривой;
+    :param repeats: "keep" -- повторы остаются, "adjacent" -- соседние повторы удаляются,
+                    "first" -- остаётся только первое вхождение каждого пикселя;
+    :return: Массив int64 формы (M, 2).
+    """
+    points = [np.array([t ** 3, t ** 2, t, 1]) @ basis @ control for t in np.linspace(0, 1, num_points)]
+    points = np.rint(np.array(points).reshape(-1, 2)).astype(np.int64)
+    if repeats == "adjacent":
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = (points[1:] != points[:-1]).any(axis=1)
+        return points[keep]
+    if repeats == "first":
+        _, first = np.unique(points, axis=0, return_index=True)
+        return points[np.sort(first)]
+    return points
+
+
+def flatten(basis, control, num_points=None, as_array=False, clip=None, repeats="adjacent"):
+    """
+    Растеризует кубический сегмент за одно векторное вычисление.
+
+    Все значения t вычисляются сразу, одним векторным проходом. При выборе числа
+    шагов по step_count соседние точки отличаются меньше чем на пиксель, и после
+    округления и удаления повторов получается непрерывная 8-связная цепочка пикселей.
+    При заданном num_points точки и повторы -- как в исходной реализации кривой (см. fixed_points).
+
+    :param basis: Базисная матрица 4x4;
+    :param control: Контрольные данные сегмента (4 точки);
+    :param num_points: Фиксированное количество точек на кривой (None -- выбрать по длине);
+    :param as_array: Вернуть массив NumPy формы (M, 2) вместо списка;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; вычисляются только участки
+                 кривой, которые могут в него попасть (см. visible_steps);
+    :param repeats: Обработка повторов при заданном num_points (см. fixed_points);
+    :return: Список пикселей [(x, y), ...] или массив.
+    """
+    control = np.asarray(control, dtype=float)
+    if num_points is not None:
+        pixels = clip_points(fixed_points(basis, control, num_points, repeats), clip)
+        return pixels if as_array else [tuple(pixel) for pixel in pixels.tolist()]
+
+    steps = step_count(basis, control)
+    coefficients = basis @ control
+    indices = np.arange(steps + 1) if clip is None else visible_steps(coefficients, steps, clip)
+    points = np.floor(evaluate(coefficients, parameter_values(indices, steps)) + 0.5).astype(np.int64)
+
+    # Соседние точки, попавшие в один пиксель, оставляются один раз; после пропущенного
+    # участка точка сравнивается с точкой вне прямоугольника и всегда остаётся
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = (points[1:] != points[:-1]).any(axis=1) | (np.diff(indices) != 1)
+    pixels = clip_points(points[keep], clip)
+    return pixels if as_array else [tuple(pixel) for pixel in pixels.tolist()]
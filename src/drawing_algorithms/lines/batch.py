@@ -0,0 +1,353 @@
+import numpy as np
+
+from src.drawing_algorithms.lines.bresenham import bresenham_line
+from src.drawing_algorithms.lines.dda import dda_line
+from src.drawing_algorithms.lines.wu import wu_line
+
+# Количество отрезков, накапливаемых за один блок
+ACCUMULATE_BLOCK_SIZE = 1024
+
+# Пиксель сглаженной линии: координаты и покрытие (альфа-канал)
+WU_PIXEL = np.dtype([("x", np.int32), ("y", np.int32), ("alpha", np.uint8)])
+
+
+def as_segments(segments):
+    """
+    Приводит набор отрезков к массиву формы (N, 2, 2).
+
+    :param segments: Последовательность отрезков ((x1, y1), (x2, y2)) или массив (N, 2, 2);
+    :return: Массив int64 формы (N, 2, 2).
+    """
+    segments = np.asarray(segments, dtype=np.int64)
+    if segments.size == 0:
+        return segments.reshape(0, 2, 2)
+    if segments.ndim != 3 or segments.shape[1:] != (2, 2):
+        raise ValueError("Отрезки должны иметь форму (N, 2, 2)")
+    return segments
+
+
+def counts_to_offsets(counts):
+    """
+    Строит таблицу смещений по количеству пикселей каждого отрезка.
+
+    :param counts: Массив количеств пикселей;
+    :return: Массив int64 длины N + 1, пиксели отрезка i лежат в [offsets[i], offsets[i + 1]).
+    """
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def split_pixels(coords, offsets):
+    """
+    Разбивает упакованный массив пикселей на массивы отдельных отрезков.
+
+    :param coords: Упакованный массив пикселей;
+    :param offsets: Таблица смещений;
+    :return: Список массивов, по одному на отрезок.
+    """
+    return np.split(coords, offsets[1:-1])
+
+
+def _step_indices(offsets):
+    """Возвращает номер отрезка и номер шага для каждого пикселя упакованного массива."""
+    counts = np.diff(offsets)
+    segment_ids = np.repeat(np.arange(len(counts)), counts)
+    steps = np.arange(offsets[-1], dtype=np.int64) - offsets[segment_ids]
+    return segment_ids, steps
+
+
+def _visible_steps(start, step, counts, clip, margin):
+    """
+    Диапазоны шагов отрезков, пиксели которых могут попасть в прямоугольник.
+
+    Пиксель шага i отстоит от точки start + i * step прямой не больше чем на margin
+    по каждой оси, поэтому диапазон находится пересечением прямой с прямоугольником,
+    расширенным на margin, с запасом в шаг на погрешность округления.
+
+    :param start: Начальные точки формы (N, 2);
+    :param step: Приращения на шаг формы (N, 2);
+    :param counts: Количество шагов каждого отрезка;
+    :param clip: Прямоугольник (x0, y0, x1, y1);
+    :param margin: Наибольшее отклонение пикселя от прямой по оси;
+    :return: Пара массивов int64 (first, stop), видимые шаги отрезка i -- [first[i], stop[i]).
+    """
+    low = np.array(clip[:2], dtype=np.float64) - margin - start
+    high = np.array(clip[2:], dtype=np.float64) - 1 + margin - start
+    moving = step != 0
+    # По неподвижной оси видны все шаги или ни одного
+    still = np.where((low <= 0) & (high >= 0), np.inf, -np.inf)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a, b = low / step, high / step
+    enter = np.where(moving, np.minimum(a, b), -still).max(axis=1)
+    leave = np.where(moving, np.maximum(a, b), still).min(axis=1)
+    stop = np.clip(np.floor(leave) + 2, 0, counts).astype(np.int64)
+    first = np.minimum(np.clip(np.floor(enter) - 1, 0, counts).astype(np.int64), stop)
+    return first, stop
+
+
+def _clip_mask(x, y, offsets, clip):
+    """
+    Пиксели упакованного массива внутри прямоугольника.
+
+    :return: Пара (маска, таблица смещений оставшихся пикселей).
+    """
+    inside = (clip[0] <= x) & (x < clip[2]) & (clip[1] <= y) & (y < clip[3])
+    ids = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    return inside, counts_to_offsets(np.bincount(ids[inside], minlength=len(offsets) - 1))
+
+
+def _accumulate(start, increment, counts, offsets):
+    """
+    Последовательно накапливает приращения для каждого отрезка (x, x + d, x + d + d, ...).
+
+    Суммирование выполняется np.cumsum вдоль строки, то есть в том же порядке,
+    что и в скалярном цикле, поэтому ошибки округления совпадают. Отрезки
+    сортируются по длине и обрабатываются блоками, чтобы выравнивание строк
+    было минимальным.
+
+    :param start: Начальные значения формы (N,) или (N, K);
+    :param increment: Приращения той же формы;
+    :param counts: Количество значений для каждого отрезка;
+    :param offsets: Таблица смещений упакованного результата;
+    :return: Упакованный массив float64 формы (M,) или (M, K).
+    """
+    start = np.asarray(start, dtype=np.float64)
+    increment = np.asarray(increment, dtype=np.float64)
+    result = np.empty((offsets[-1],) + start.shape[1:], dtype=np.float64)
+    order = np.argsort(counts, kind="stable")
+
+    for block_start in range(0, len(order), ACCUMULATE_BLOCK_SIZE):
+        block = order[block_start:block_start + ACCUMULATE_BLOCK_SIZE]
+        width = counts[block[-1]]
+        if width == 0:
+            continue
+
+        track = np.empty((len(block), width) + start.shape[1:], dtype=np.float64)
+        track[:, 0] = start[block]
+        track[:, 1:] = increment[block][:, None]
+        np.cumsum(track, axis=1, out=track)
+
+        rows, cols = np.nonzero(np.arange(width) < counts[block][:, None])
+        result[offsets[block][rows] + cols] = track[rows, cols]
+
+    return result
+
+
+def bresenham_lines(segments, clip=None):
+    """
+    Векторизованный алгоритм Брезенхема для набора отрезков.
+
+    Результат попиксельно совпадает с bresenham_line: номер шага по неосновной оси
+    вычисляется в замкнутой форме из того же целочисленного условия на ошибку.
+
+    :param segments: Отрезки формы (N, 2, 2);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; строятся только шаги,
+                 которые могут в него попасть (см. _visible_steps);
+    :return: Пара (coords, offsets) -- массив int32 формы (M, 2) и таблица смещений.
+    """
+    segments = as_segments(segments)
+    x1, y1 = segments[:, 0, 0], segments[:, 0, 1]
+    x2, y2 = segments[:, 1, 0], segments[:, 1, 1]
+
+    dx = np.abs(x2 - x1)
+    dy = np.abs(y2 - y1)
+    sx = np.where(x2 > x1, 1, -1)
+    sy = np.where(y2 > y1, 1, -1)
+
+    counts = np.maximum(dx, dy) + 1
+    first = np.zeros_like(counts)
+    if clip is not None:
+        step = (segments[:, 1] - segments[:, 0]) / np.maximum(counts - 1, 1)[:, None]
+        first, counts = _visible_steps(segments[:, 0], step, counts, clip, 1)
+        counts -= first
+    offsets = counts_to_offsets(counts)
+    ids, i = _step_indices(offsets)
+    i += first[ids]
+
+    dx, dy = dx[ids], dy[ids]
+    x_major = dx >= dy
+
+    # Основная ось меняется на каждом шаге, неосновная -- при 2 * err < d_major
+    major = np.where(x_major, dx, dy)
+    minor = np.where(x_major, dy, dx)
+    k = np.where(major > 0, (2 * i * minor + major - 1) // np.maximum(2 * major, 1), 0)
+
+    coords = np.empty((offsets[-1], 2), dtype=np.int32)
+    coords[:, 0] = x1[ids] + sx[ids] * np.where(x_major, i, k)
+    coords[:, 1] = y1[ids] + sy[ids] * np.where(x_major, k, i)
+    if clip is not None:
+        inside, offsets = _clip_mask(coords[:, 0], coords[:, 1], offsets, clip)
+        coords = coords[inside]
+    return coords, offsets
+
+
+def dda_lines(segments, clip=None):
+    """
+    Векторизованный алгоритм ЦДА для набора отрезков.
+
+    Координаты накапливаются в том же порядке, что и в dda_line, поэтому
+    результат совпадает попиксельно. Вырожденный отрезок даёт один пиксель.
+
+    :param segments: Отрезки формы (N, 2, 2);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; пиксели строятся только для шагов,
+                 которые могут в него попасть (координаты по-прежнему накапливаются
+                 с первого шага, как в dda_line);
+    :return: Пара (coords, offsets) -- массив int32 формы (M, 2) и таблица смещений.
+    """
+    segments = as_segments(segments)
+    start = segments[:, 0].astype(np.float64)
+    delta = (segments[:, 1] - segments[:, 0]).astype(np.float64)
+
+    steps = np.abs(segments[:, 1] - segments[:, 0]).max(axis=1)
+    increments = delta / np.maximum(steps, 1)[:, None]
+
+    first, stop = np.zeros_like(steps), steps + 1
+    if clip is not None:
+        first, stop = _visible_steps(start, increments, stop, clip, 1)
+    offsets = counts_to_offsets(stop - first)
+    ids, i = _step_indices(offsets)
+    i += first[ids]
+
+    # Координаты накапливаются до последнего видимого шага, пиксели -- с первого
+    accumulated = counts_to_offsets(stop)
+    coords = np.rint(_accumulate(start, increments, stop, accumulated)[accumulated[ids] + i]).astype(np.int32)
+    if clip is not None:
+        inside, offsets = _clip_mask(coords[:, 0], coords[:, 1], offsets, clip)
+        coords = coords[inside]
+    return coords, offsets
+
+
+def _fpart(x):
+    """Дробная часть числа."""
+    return x - np.floor(x)
+
+
+def _coverage(value):
+    """Переводит покрытие 0..255 в альфа-канал с отбрасыванием дробной части, как np.uint8."""
+    return value.astype(np.uint8)
+
+
+def wu_lines(segments, clip=None):
+    """
+    Векторизованный алгоритм Ву для набора отрезков.
+
+    Повторяет wu_line: обмен осей для крутых отрезков, упорядочивание концов,
+    обработку концов с x_gap и последовательное накопление intery. Для каждого
+    отрезка сначала идут по два пикселя каждого конца, затем пары пикселей
+    основного цикла -- в том же порядке, что и в скалярной версии.
+
+    :param segments: Отрезки формы (N, 2, 2);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; пиксели основного цикла строятся
+                 только для шагов, которые могут в него попасть (intery по-прежнему
+                 накапливается с первого шага, как в wu_line);
+    :return: Пара (pixels, offsets) -- структурированный массив WU_PIXEL формы (M,)
+             и таблица смещений.
+    """
+    segments = as_segments(segments).astype(np.float64)
+    x1, y1 = segments[:, 0, 0], segments[:, 0, 1]
+    x2, y2 = segments[:, 1, 0], segments[:, 1, 1]
+
+    steep = np.abs(y2 - y1) > np.abs(x2 - x1)
+    x1, y1 = np.where(steep, y1, x1), np.where(steep, x1, y1)
+    x2, y2 = np.where(steep, y2, x2), np.where(steep, x2, y2)
+
+    swap = x1 > x2
+    x1, x2 = np.where(swap, x2, x1), np.where(swap, x1, x2)
+    y1, y2 = np.where(swap, y2, y1), np.where(swap, y1, y2)
+
+    dx = x2 - x1
+    dy = y2 - y1
+    gradient = np.where(dx != 0, dy / np.where(dx != 0, dx, 1), 1.0)
+
+    # Первый конец
+    x_end = np.floor(x1 + 0.5)
+    y_end1 = y1 + gradient * (x_end - x1)
+    x_gap1 = 1 - _fpart(x1 + 0.5)
+    x_pixel1 = x_end
+    intery = y_end1 + gradient
+
+    # Второй конец
+    x_end = np.floor(x2 + 0.5)
+    y_end2 = y2 + gradient * (x_end - x2)
+    x_gap2 = _fpart(x2 + 0.5)
+    x_pixel2 = x_end
+
+    inner = np.maximum(x_pixel2 - x_pixel1 - 1, 0).astype(np.int64)
+    first, stop = np.zeros_like(inner), inner
+    if clip is not None:
+        # Прямая основного цикла в координатах (x, y); пиксели -- floor(intery) и floor(intery) + 1
+        start = np.stack([x_pixel1 + 1, intery], axis=1)
+        step = np.stack([np.ones_like(gradient), gradient], axis=1)
+        if steep.any():
+            start[steep], step[steep] = start[steep][:, ::-1], step[steep][:, ::-1]
+        first, stop = _visible_steps(start, step, inner, clip, 2)
+    offsets = counts_to_offsets(4 + 2 * (stop - first))
+    pixels = np.empty(offsets[-1], dtype=WU_PIXEL)
+
+    # Пиксели по основной оси и по неосновной оси, обмен осей выполняется при записи
+    major = np.empty(offsets[-1], dtype=np.int64)
+    minor = np.empty(offsets[-1], dtype=np.int64)
+    alpha = np.empty(offsets[-1], dtype=np.uint8)
+
+    base = offsets[:-1]
+    for shift, x_pixel, y_end, x_gap in ((0, x_pixel1, y_end1, x_gap1), (2, x_pixel2, y_end2, x_gap2)):
+        major[base + shift] = x_pixel
+        major[base + shift + 1] = x_pixel
+        minor[base + shift] = np.floor(y_end)
+        minor[base + shift + 1] = np.floor(y_end) + 1
+        alpha[base + shift] = _coverage(255 * (1 - _fpart(y_end)) * x_gap)
+        alpha[base + shift + 1] = _coverage(255 * _fpart(y_end) * x_gap)
+
+    # Основной цикл: intery накапливается до последнего видимого шага, пиксели -- с первого
+    ids, step = _step_indices(counts_to_offsets(stop - first))
+    position = offsets[ids] + 4 + 2 * step
+    step += first[ids]
+    accumulated = counts_to_offsets(stop)
+    intery = _accumulate(intery, gradient, stop, accumulated)[accumulated[ids] + step]
+
+    major[position] = x_pixel1[ids] + 1 + step
+    major[position + 1] = major[position]
+    minor[position] = np.floor(intery)
+    minor[position + 1] = minor[position] + 1
+    alpha[position] = _coverage(255 * (1 - _fpart(intery)))
+    alpha[position + 1] = _coverage(255 * _fpart(intery))
+
+    steep = np.repeat(steep, np.diff(offsets))
+    pixels["x"] = np.where(steep, minor, major)
+    pixels["y"] = np.where(steep, major, minor)
+    pixels["alpha"] = alpha
+    if clip is not None:
+        inside, offsets = _clip_mask(pixels["x"], pixels["y"], offsets, clip)
+        pixels = pixels[inside]
+    return pixels, offsets
+
+
+# Эталонные (скалярные) реализации для сверки результатов
+REFERENCE = {
+    "bresenham": bresenham_line,
+    "dda": dda_line,
+    "wu": wu_line,
+}
+
+
+def reference_lines(algorithm, segments):
+    """
+    Строит набор отрезков эталонной скалярной реализацией и упаковывает результат.
+
+    :param algorithm: Название алгоритма ("bresenham", "dda" или "wu");
+    :param segments: Отрезки формы (N, 2, 2);
+    :return: Пара (pixels, offsets) в том же формате, что и у пакетных функций.
+    """
+    line = REFERENCE[algorithm]
+    pixels = []
+    for start, end in as_segments(segments).tolist():
+        start, end = tuple(start), tuple(end)
+        # dda_line не определена для вырожденного отрезка
+        pixels.append([start] if algorithm == "dda" and start == end else line(start, end))
+
+    offsets = counts_to_offsets([len(p) for p in pixels])
+    flat = [tuple(int(v) for v in p) for line_pixels in pixels for p in line_pixels]
+    if algorithm == "wu":
+        return np.array(flat, dtype=WU_PIXEL), offsets
+    return np.array(flat, dtype=np.int32).reshape(-1, 2), offsets
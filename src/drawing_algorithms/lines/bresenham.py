@@ -1,10 +1,14 @@
-def bresenham_line(start_point, end_point):
+from src.drawing_algorithms.clipping import visible_range
+
+
+def bresenham_line(start_point, end_point, clip=None):
     """
     Алгоритм Брезенхема для рисования отрезка между двумя точками.
 
     Аргументы:
     x1, y1 -- координаты начальной точки
     x2, y2 -- координаты конечной точки
+    clip -- прямоугольник (x0, y0, x1, y1) отсечения; строятся только пиксели внутри него
 
     Возвращает:
     Список координат пикселей, которые формируют линию.
@@ -12,6 +16,9 @@ def bresenham_line(start_point, end_point):
     x1, y1 = start_point
     x2, y2 = end_point
 
+    if clip is not None:
+        return _clipped_line(x1, y1, x2, y2, clip)
+
     # Список для хранения координат пикселей линии
     pixels = []
 
@@ -51,3 +58,26 @@ def bresenham_line(start_point, end_point):
             y += sy
 
     return pixels
+
+
+def _clipped_line(x1, y1, x2, y2, clip):
+    """
+    Видимые пиксели отрезка в замкнутой форме.
+
+    На шаге i по основной оси неосновная координата меняется k раз, где k -- наименьшее
+    целое с 2 * (i * d_minor - k * d_major) <= d_major (то же условие на ошибку, что и в цикле).
+    Обе координаты монотонны по i, поэтому видимые шаги образуют один отрезок [first, stop).
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    sx = 1 if x2 > x1 else -1
+    sy = 1 if y2 > y1 else -1
+    x_major = dx >= dy
+    major, minor = (dx, dy) if x_major else (dy, dx)
+
+    def point(i):
+        k = (2 * i * minor + major - 1) // (2 * major) if major else 0
+        return (x1 + sx * i, y1 + sy * k) if x_major else (x1 + sx * k, y1 + sy * i)
+
+    first, stop = visible_range(major + 1, point, clip)
+    return [point(i) for i in range(first, stop)]
@@ -1,9 +1,15 @@
-def dda_line(start_point, end_point):
+import numpy as np
+
+from src.drawing_algorithms.clipping import inside, visible_range
+
+
+def dda_line(start_point, end_point, clip=None):
     """
     Алгоритм ЦДА для рисования отрезка между двумя точками.
 
     :param start_point: Координаты начальной точки;
-    :param end_point: Координаты конечной точки.
+    :param end_point: Координаты конечной точки;
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения; строятся только пиксели внутри него.
     """
     x1, y1 = start_point
     x2, y2 = end_point
@@ -19,6 +25,9 @@ def dda_line(start_point, end_point):
     x_increment = dx / steps
     y_increment = dy / steps
 
+    if clip is not None:
+        return _clipped_line(x1, y1, x_increment, y_increment, steps, clip)
+
     # Инициализация начальной точки
     x = x1
     y = y1
@@ -35,3 +44,22 @@ def dda_line(start_point, end_point):
         y += y_increment
 
     return pixels
+
+
+def _clipped_line(x1, y1, x_increment, y_increment, steps, clip):
+    """
+    Видимые пиксели отрезка ЦДА.
+
+    Диапазон шагов находится по точной прямой с запасом в один шаг на погрешность
+    накопления; координаты до конца диапазона накапливаются np.cumsum в том же порядке,
+    что и в цикле, поэтому пиксели совпадают с неотсечённым построением.
+    """
+    first, stop = visible_range(steps + 1, lambda i: (round(x1 + i * x_increment), round(y1 + i * y_increment)), clip)
+    first, stop = max(first - 1, 0), min(stop + 1, steps + 1)
+    if first >= stop:
+        return []
+
+    xs = np.cumsum(np.r_[x1, np.full(stop - 1, x_increment)])[first:]
+    ys = np.cumsum(np.r_[y1, np.full(stop - 1, y_increment)])[first:]
+    pixels = zip(np.rint(xs).astype(np.int64).tolist(), np.rint(ys).astype(np.int64).tolist())
+    return [pixel for pixel in pixels if inside(clip, *pixel)]
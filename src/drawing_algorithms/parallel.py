@@ -0,0 +1,167 @@
+"""
+Параллельная растеризация независимых фигур в пуле процессов.
+
+Фигуры делятся на части по chunk_size и растеризуются в процессах-исполнителях.
+Исполнитель записывает результат в блок общей памяти (multiprocessing.shared_memory)
+и возвращает только его имя и размеры, поэтому пиксели не сериализуются через pickle.
+Результаты собираются строго в порядке подачи частей, и наложение на холст совпадает
+с последовательной растеризацией всех фигур подряд.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from src.drawing_algorithms import cache
+from src.drawing_algorithms.lines.batch import counts_to_offsets
+from src.raster.compositing import composite_pixels
+
+# Количество фигур в одной задаче исполнителя
+CHUNK_SIZE = 2048
+
+
+def rasterize_shapes(shapes, clip=None):
+    """
+    Растеризует фигуры подряд в текущем процессе через общий кэш (RasterCache.rasterize_many).
+
+    :param shapes: Последовательность фигур (algorithm, points);
+    :param clip: Прямоугольник (x0, y0, x1, y1) отсечения или None;
+    :return: Пара (pixels, counts) -- массив int32 формы (M, 3) пикселей [x, y, alpha]
+             всех фигур подряд и количество пикселей каждой фигуры.
+    """
+    return cache.raster_cache.rasterize_many(shapes, clip)
+
+
+def _run(task, items, args):
+    """
+    Выполняет задачу в исполнителе и записывает результат в новый блок общей памяти.
+
+    Блок остаётся зарегистрированным в общем resource_tracker и освобождается главным
+    процессом (_collect или _release); при ошибке записи исполнитель освобождает его сам.
+    """
+    pixels, counts = task(items, *args)
+    pixels = np.ascontiguousarray(pixels, dtype=np.int32)
+    block = shared_memory.SharedMemory(create=True, size=max(counts.nbytes + pixels.nbytes, 1))
+    try:
+        np.ndarray(counts.shape, np.int64, block.buf)[:] = counts
+        np.ndarray(pixels.shape, np.int32, block.buf, offset=counts.nbytes)[:] = pixels
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    block.close()
+    return block.name, len(counts), len(pixels)
+
+
+def _collect(name, item_count, pixel_count):
+    """Копирует результат из блока общей памяти и освобождает блок."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        counts = np.ndarray((item_count,), np.int64, block.buf).copy()
+        pixels = np.ndarray((pixel_count, 3), np.int32, block.buf, offset=counts.nbytes).copy()
+    finally:
+        block.close()
+        block.unlink()
+    return pixels, counts
+
+
+def _release(future):
+    """Освобождает блок части, результат которой не был собран (отменяет её, если она не начата)."""
+    if future.cancel():
+        return
+    try:
+        name = future.result()[0]
+    except Exception:
+        # Блок не создан или уже освобождён исполнителем
+        return
+    block = shared_memory.SharedMemory(name=name)
+    block.close()
+    block.unlink()
+
+
+class ParallelRasterizer:
+    """
+    Планировщик параллельной растеризации.
+
+    task -- функция верхнего уровня модуля (её можно передать в другой процесс),
+    которая по списку элементов возвращает пару (pixels, counts), как rasterize_shapes.
+    Одновременно выполняется не больше 2 * workers частей, поэтому объём общей памяти
+    ограничен независимо от количества фигур. При workers=0 части обрабатываются
+    в текущем процессе (те же части и тот же порядок, без пула).
+    """
+
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE, task=rasterize_shapes):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+        self.task = task
+        if self.workers:
+            # Исполнители наследуют один resource_tracker с главным процессом, поэтому блок,
+            # созданный исполнителем, снимается с учёта при unlink в главном процессе,
+            # а не освобождённые блоки удаляются трекером при завершении
+            resource_tracker.ensure_running()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def map(self, items, *args):
+        """
+        Результаты частей в порядке подачи.
+
+        :param items: Последовательность элементов (для rasterize_shapes -- фигур);
+        :param args: Дополнительные аргументы задачи (например, clip);
+        :return: Итератор пар (pixels, counts) по частям.
+        """
+        if self.executor is None:
+            for start in range(0, len(items), self.chunk_size):
+                yield self.task(items[start:start + self.chunk_size], *args)
+            return
+
+        # Блоки частей, не собранных из-за ошибки или закрытия итератора (GeneratorExit), освобождаются в finally
+        pending = deque()
+        try:
+            for start in range(0, len(items), self.chunk_size):
+                pending.append(self.executor.submit(_run, self.task, items[start:start + self.chunk_size], args))
+                if len(pending) >= 2 * self.workers:
+                    yield _collect(*pending.popleft().result())
+            while pending:
+                yield _collect(*pending.popleft().result())
+        finally:
+            while pending:
+                _release(pending.popleft())
+
+    def rasterize(self, items, *args):
+        """
+        Растеризует все элементы.
+
+        :return: Пара (pixels, offsets) -- массив int32 формы (M, 3) и таблица смещений,
+                 пиксели элемента i лежат в pixels[offsets[i]:offsets[i + 1]].
+        """
+        parts = list(self.map(items, *args))
+        if not parts:
+            return np.empty((0, 3), dtype=np.int32), np.zeros(1, dtype=np.int64)
+        pixels = np.concatenate([part[0] for part in parts])
+        return pixels, counts_to_offsets(np.concatenate([part[1] for part in parts]))
+
+    def render(self, target, items, *args):
+        """
+        Растеризует элементы и накладывает их на холст по мере готовности частей, в порядке подачи.
+
+        :param target: RGBA-массив (height, width, 4) или поверхность с методом composite;
+        :param items: Последовательность элементов;
+        :param args: Дополнительные аргументы задачи.
+        """
+        for pixels, _ in self.map(items, *args):
+            if isinstance(target, np.ndarray):
+                composite_pixels(target, pixels)
+            else:
+                target.composite(pixels)
@@ -0,0 +1,196 @@
+"""
+Рендеринг сцены без графического интерфейса (без импорта Qt).
+
+Сцена -- файл JSON Lines. Первая строка может быть заголовком
+{"width": 800, "height": 600, "scale": 1}, остальные -- по одной фигуре в формате
+записей проекта: {"algorithm": "circle", "points": [[x, y], ...], "color": [r, g, b, a]}.
+Пустые строки и строки, начинающиеся с #, пропускаются.
+
+Файл читается потоково: одновременно в памяти находятся холст (для больших холстов --
+ограниченное число плиток, см. TiledSurface), пакет пикселей не больше BATCH_PIXELS
+и кэш растеризации, поэтому объём памяти не зависит от количества фигур.
+
+Запуск из корня репозитория:
+    python -m src.headless scene.jsonl -o scene.png
+    python -m src.headless - -o scene.rgba --width 4096 --height 4096 < scene.jsonl
+"""
+import argparse
+import json
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from src.model.base import RGBA, create_record
+from src.model.scene import rasterize
+from src.raster.framebuffer import TILED_AREA
+from src.raster.surface import DenseSurface
+from src.raster.tiles import TiledSurface
+
+# Размер холста, если он не задан ни в заголовке, ни в аргументах
+DEFAULT_SIZE = (800, 600)
+
+# Сколько пикселей фигур накапливается перед наложением на холст
+BATCH_PIXELS = 1 << 20
+
+# Сколько плиток большого холста одновременно держится в памяти
+MAX_RESIDENT_TILES = 256
+
+# Количество строк изображения, записываемых за раз
+BAND_HEIGHT = 256
+
+
+def read_scene(lines):
+    """
+    Разбирает строки сцены.
+
+    :param lines: Итерируемый набор строк (например, открытый файл);
+    :return: Заголовок (словарь, возможно пустой) и итератор пар (номер строки, фигура).
+    """
+    def items():
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                try:
+                    yield number, json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"строка {number}: {error}") from None
+
+    shapes = items()
+    for number, item in shapes:
+        if "algorithm" in item:
+            return {}, _prepend((number, item), shapes)
+        return item, shapes
+    return {}, iter(())
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
+
+
+def create_surface(width, height):
+    """Поверхность холста: плотная для небольших холстов, плиточная с вытеснением -- для больших."""
+    if width * height >= TILED_AREA:
+        return TiledSurface(width, height, max_resident=MAX_RESIDENT_TILES)
+    return DenseSurface(width, height)
+
+
+def render_scene(shapes, width, height, scale=1, errors=None):
+    """
+    Растеризует фигуры сцены и накладывает их на холст в порядке следования.
+
+    Пиксели фигур накапливаются пакетами: наложение пакета совпадает с последовательным
+    наложением фигур (см. composite_pixels), а вызовов становится намного меньше.
+
+    :param shapes: Итератор пар (номер строки, фигура) из read_scene;
+    :param width: Ширина холста;
+    :param height: Высота холста;
+    :param scale: Целочисленный масштаб: фигуры строятся на сетке, в scale раз более мелкой;
+    :param errors: Список, куда добавляются сообщения о пропущенных фигурах (None -- прервать на ошибке);
+    :return: Поверхность размером (width * scale, height * scale) и количество нарисованных фигур.
+    """
+    surface = create_surface(width * scale, height * scale)
+    clip = (0, 0, width * scale, height * scale)
+    batch, batch_size, count = [], 0, 0
+
+    for number, shape in shapes:
+        try:
+            color = RGBA(*shape["color"]) if "color" in shape else None
+            record = create_record(shape["algorithm"], shape["points"], color, shape.get("layer", 0))
+            pixels = rasterize(record, scale, clip)
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as error:
+            if errors is None:
+                raise ValueError(f"строка {number}: {error!r}") from None
+            errors.append(f"строка {number}: {error!r}")
+            continue
+
+        count += 1
+        batch.append(pixels)
+        batch_size += len(pixels)
+        if batch_size >= BATCH_PIXELS:
+            surface.composite(np.concatenate(batch))
+            batch, batch_size = [], 0
+
+    if batch:
+        surface.composite(np.concatenate(batch))
+    return surface, count
+
+
+def bands(surface, width, height):
+    """Полосы изображения по BAND_HEIGHT строк, массивы (rows, width, 4)."""
+    for y in range(0, height, BAND_HEIGHT):
+        yield surface.read((0, y, width, min(y + BAND_HEIGHT, height)))
+
+
+def write_png(file, surface, width, height):
+    """
+    Записывает поверхность в PNG (RGBA, 8 бит) без сторонних библиотек.
+
+    Изображение сжимается полосами, и каждая полоса записывается отдельным блоком IDAT,
+    поэтому весь растр целиком в памяти не собирается.
+    """
+    def chunk(kind, data):
+        file.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+    file.write(b"\x89PNG\r\n\x1a\n")
+    chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+    compressor = zlib.compressobj(6)
+    for band in bands(surface, width, height):
+        # Каждая строка начинается с байта фильтра (0 -- без фильтра)
+        rows = np.zeros((len(band), width * 4 + 1), dtype=np.uint8)
+        rows[:, 1:] = band.reshape(len(band), -1)
+        data = compressor.compress(rows.tobytes())
+        if data:
+            chunk(b"IDAT", data)
+    chunk(b"IDAT", compressor.flush())
+    chunk(b"IEND", b"")
+
+
+def write_raw(file, surface, width, height):
+    """Записывает поверхность как последовательность байтов RGBA построчно."""
+    for band in bands(surface, width, height):
+        file.write(band.tobytes())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Рендеринг сцены без графического интерфейса")
+    parser.add_argument("scene", help="файл сцены JSON Lines или - для стандартного ввода")
+    parser.add_argument("-o", "--output", required=True, help="файл изображения (.png или .rgba)")
+    parser.add_argument("--width", type=int, help="ширина холста (по умолчанию из заголовка)")
+    parser.add_argument("--height", type=int, help="высота холста (по умолчанию из заголовка)")
+    parser.add_argument("--scale", type=int, help="целочисленный масштаб растеризации")
+    parser.add_argument("--format", choices=["png", "raw"], help="формат (по умолчанию по расширению)")
+    parser.add_argument("--strict", action="store_true", help="прерываться на первой ошибочной фигуре")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    source = sys.stdin if args.scene == "-" else open(args.scene, encoding="utf-8")
+    try:
+        header, shapes = read_scene(source)
+        width = args.width or header.get("width", DEFAULT_SIZE[0])
+        height = args.height or header.get("height", DEFAULT_SIZE[1])
+        scale = args.scale or header.get("scale", 1)
+        errors = None if args.strict else []
+        surface, count = render_scene(shapes, width, height, scale, errors)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    image_format = args.format or ("png" if args.output.lower().endswith(".png") else "raw")
+    with open(args.output, "wb") as file:
+        (write_png if image_format == "png" else write_raw)(file, surface, width * scale, height * scale)
+    if isinstance(surface, TiledSurface):
+        surface.close()
+
+    for message in errors or []:
+        print(message, file=sys.stderr)
+    print(f"{count} фигур, {width * scale}x{height * scale}, {time.perf_counter() - started:.2f} с -> {args.output}",
+          file=sys.stderr)
+    return 0 if not errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass
 from typing import List
 
@@ -31,7 +32,7 @@ class Point:
 @dataclass
 class BaseObject:
     main_points: List[Point]  # Key points defining the object
-    pixels: List[Point]  # Actual pixels to be drawn
+    pixels: List[Point]  # Actual pixels to be drawn (empty when rasterized on demand by a Scene)
     params: dict  # Additional parameters like radius, axes etc.
     color: RGBA  # Object color
     visible: bool = True  # Whether an object should be drawn
@@ -41,7 +42,7 @@ class BaseObject:
     style: dict = None  # Visual style properties (line width, pattern, etc.)
 
 
-@dataclass
+@dataclass(kw_only=True)
 class Line(BaseObject):
     """Represents a straight line between two points"""
     start: Point  # Starting point of the line
@@ -52,7 +53,7 @@ class Line(BaseObject):
             raise ValueError("Line must have valid start and end points")
 
 
-@dataclass
+@dataclass(kw_only=True)
 class Circle(BaseObject):
     """Represents a circle defined by center point and radius"""
     center: Point  # Center point of the circle
@@ -63,7 +64,7 @@ class Circle(BaseObject):
             raise ValueError("Circle must have valid center point and radius")
 
 
-@dataclass
+@dataclass(kw_only=True)
 class Ellipse(BaseObject):
     """Represents an ellipse defined by a center point and two axes"""
     center: Point  # Center point of the ellipse
@@ -76,7 +77,7 @@ class Ellipse(BaseObject):
             raise ValueError("Ellipse must have valid center point and axis lengths")
 
 
-@dataclass
+@dataclass(kw_only=True)
 class Curve(BaseObject):
     """Base class for parametric curves defined by control points"""
     control_points: List[Point]  # List of control points defining the curve
@@ -87,5 +88,27 @@ class Curve(BaseObject):
             raise ValueError("Curve must have at least 2 valid control points")
 
 
-rgb = RGBA(255, 0, 0)
-print(rgb)
+LINE_ALGORITHMS = {"wu", "bresenham", "dda"}
+CURVE_ALGORITHMS = {"hermite", "bezier", "b-spline", "bezier-chain", "b-spline-chain", "catmull-rom-chain"}
+
+
+def create_record(algorithm: str, points: List[tuple], color: RGBA = None, layer: int = 0) -> BaseObject:
+    """Builds the metadata record for a shape from the algorithm name and its input points"""
+    color = color if color is not None else RGBA(0, 0, 0)
+    main_points = [Point(int(x), int(y)) for x, y in points]
+    common = dict(main_points=main_points, pixels=[], params={"algorithm": algorithm}, color=color, layer=layer)
+
+    if algorithm in LINE_ALGORITHMS:
+        return Line(**common, start=main_points[0], end=main_points[1])
+    if algorithm == "circle":
+        center, edge = main_points
+        radius = round(math.sqrt(pow(center.x - edge.x, 2) + pow(center.y - edge.y, 2)))
+        return Circle(**common, center=center, radius=radius)
+    if algorithm == "ellipse":
+        start, end = main_points
+        center = Point((start.x + end.x) // 2, (start.y + end.y) // 2)
+        return Ellipse(**common, center=center,
+                       major_axis=abs(end.x - start.x) // 2, minor_axis=abs(end.y - start.y) // 2)
+    if algorithm in CURVE_ALGORITHMS:
+        return Curve(**common, control_points=list(main_points))
+    return BaseObject(**common)
@@ -0,0 +1,142 @@
+from typing import List, Optional
+
+import numpy as np
+
+from src.model.base import BaseObject
+from src.raster.compositing import as_pixel_array
+
+
+class ObjectStore:
+    """
+    Columnar storage for rasterized objects.
+
+    Pixels of all objects live in contiguous arrays (int16 coordinates, uint8 alpha);
+    object i occupies rows offsets[i]:offsets[i + 1]. Per-object metadata is kept as
+    BaseObject records and bounding boxes in a separate int32 table. Scene keeps the
+    shapes removed for debugging here (see Scene.take_last), so they can be stepped
+    through pixel by pixel and put back without rasterizing them again.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.xy = np.empty((capacity, 2), dtype=np.int16)  # Pixel coordinates
+        self.alpha = np.empty(capacity, dtype=np.uint8)  # Pixel alpha
+        self.offsets = np.zeros(64 + 1, dtype=np.int64)  # Start of each object in xy/alpha
+        self.bounds = np.empty((64, 4), dtype=np.int32)  # Bounding box (x0, y0, x1, y1) of each object
+        self.records: List[Optional[BaseObject]] = []  # Metadata of each object
+
+    @classmethod
+    def from_arrays(cls, xy, alpha, offsets, bounds, records):
+        """Creates a store over existing (e.g. memory-mapped) arrays without copying them"""
+        store = cls.__new__(cls)
+        store.xy = xy
+        store.alpha = alpha
+        store.offsets = offsets
+        store.bounds = bounds
+        store.records = list(records)
+        return store
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.pixels(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.pixels(index)
+
+    @property
+    def pixel_count(self) -> int:
+        return int(self.offsets[len(self)])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the pixel data of stored objects"""
+        used = self.pixel_count
+        return used * (self.xy.itemsize * 2 + self.alpha.itemsize) + len(self) * (8 + 16)
+
+    def append(self, pixels, record: BaseObject = None) -> int:
+        """Adds an object given as [x, y, alpha] pixels, returns its index"""
+        pixels = as_pixel_array(pixels)
+        index = len(self)
+        start = self.pixel_count
+        end = start + len(pixels)
+
+        self._reserve(end, index + 1)
+        self._fit_coordinates(pixels[:, :2])
+        self.xy[start:end] = pixels[:, :2]
+        self.alpha[start:end] = pixels[:, 2]
+        self.offsets[index + 1] = end
+        if len(pixels):
+            self.bounds[index, :2] = pixels[:, :2].min(axis=0)
+            self.bounds[index, 2:] = pixels[:, :2].max(axis=0) + 1
+        else:
+            self.bounds[index] = (0, 0, 0, 0)
+        self.records.append(record)
+        return index
+
+    def remove_last(self):
+        """Removes the last object, returns its pixels and record"""
+        pixels = self.pixels(len(self) - 1)
+        record = self.records.pop()
+        return pixels, record
+
+    def clear(self):
+        self.records.clear()
+
+    def pixels(self, index: int, start: int = 0, stop: int = None) -> np.ndarray:
+        """Pixels of an object (optionally a slice of them) as an (M, 3) array"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("object index out of range")
+        first, last = self.offsets[index], self.offsets[index + 1]
+        stop = last - first if stop is None else min(stop, last - first)
+        return self._columns(first + start, first + stop)
+
+    def object_size(self, index: int) -> int:
+        return int(self.offsets[index + 1] - self.offsets[index])
+
+    def bounding_rect(self, index: int):
+        if not self.object_size(index):
+            return None
+        return tuple(int(v) for v in self.bounds[index])
+
+    def all_pixels(self) -> np.ndarray:
+        """Pixels of all objects in drawing order"""
+        return self._columns(0, self.pixel_count)
+
+    def pixels_in_rect(self, rect) -> np.ndarray:
+        """Pixels of all objects whose bounding box intersects rect, in drawing order"""
+        count = len(self)
+        bounds = self.bounds[:count]
+        x0, y0, x1, y1 = rect
+        hit = ((bounds[:, 0] < x1) & (x0 < bounds[:, 2]) & (bounds[:, 1] < y1) & (y0 < bounds[:, 3]) &
+               (self.offsets[1:count + 1] > self.offsets[:count]))
+        parts = [self._columns(self.offsets[i], self.offsets[i + 1]) for i in np.flatnonzero(hit)]
+        return np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int32)
+
+    def _columns(self, start, stop) -> np.ndarray:
+        pixels = np.empty((stop - start, 3), dtype=np.int32)
+        pixels[:, :2] = self.xy[start:stop]
+        pixels[:, 2] = self.alpha[start:stop]
+        return pixels
+
+    def _reserve(self, pixel_count: int, object_count: int):
+        """Grows the arrays geometrically so appends are amortized O(object size)"""
+        if pixel_count > len(self.alpha):
+            capacity = max(pixel_count, 2 * len(self.alpha))
+            self.xy = np.resize(self.xy, (capacity, 2))
+            self.alpha = np.resize(self.alpha, capacity)
+        if object_count > len(self.bounds):
+            capacity = max(object_count, 2 * len(self.bounds))
+            self.offsets = np.resize(self.offsets, capacity + 1)
+            self.bounds = np.resize(self.bounds, (capacity, 4))
+
+    def _fit_coordinates(self, coordinates: np.ndarray):
+        """Widens the coordinate column to int32 when a shape goes beyond the int16 range"""
+        if self.xy.dtype == np.int32 or not len(coordinates):
+            return
+        limits = np.iinfo(self.xy.dtype)
+        if coordinates.min() < limits.min or coordinates.max() > limits.max:
+            self.xy = self.xy.astype(np.int32)
@@ -0,0 +1,166 @@
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.model.base import RGBA, create_record
+from src.model.scene import Scene
+
+MAGIC = b"GIISPRJ\x01"
+PROLOGUE = struct.Struct("<8sQQ")  # magic, header offset, header length
+ALIGNMENT = 4096  # Sections start on page boundaries so they can be memory-mapped
+FORMAT_VERSION = 2
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _to_json(value):
+    """Converts tuples and NumPy scalars in canvas state to plain JSON values"""
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _to_tuples(value):
+    """Restores the tuples of points that JSON turned into lists"""
+    if isinstance(value, list):
+        return tuple(_to_tuples(v) for v in value)
+    return value
+
+
+@dataclass
+class Project:
+    """A project file opened for reading; arrays are memory-mapped and read on demand"""
+    path: str
+    width: int
+    height: int
+    scene: Scene
+    state: dict = field(default_factory=dict)
+    sections: dict = field(default_factory=dict)
+
+    def section(self, name: str, mode: str = "c") -> np.ndarray:
+        """Memory-maps a section; the default copy-on-write mode never modifies the file"""
+        info = self.sections[name]
+        if not np.prod(info["shape"]):
+            return np.zeros(tuple(info["shape"]), dtype=np.dtype(info["dtype"]))
+        return np.memmap(self.path, dtype=np.dtype(info["dtype"]), mode=mode,
+                         offset=info["offset"], shape=tuple(info["shape"]))
+
+    def raster(self) -> np.ndarray:
+        """New copy-on-write mapping of the saved RGBA raster"""
+        return self.section("raster")
+
+    @property
+    def tile_map(self):
+        """Tiles present in the raster of a tiled canvas, None if the whole raster was written"""
+        return self.section("tile_map", mode="r") if "tile_map" in self.sections else None
+
+
+def save_project(path: str, scene: Scene, framebuffer, state: dict = None):
+    """
+    Saves the committed raster, the shapes of the scene and the canvas state to a project file.
+
+    Layout: prologue, page-aligned raw sections (raster, shape bounds, tile_map for
+    tiled canvases) and a JSON header at the end describing the sections, shape
+    records and state. Shapes are saved by their parameters only; their pixels are
+    rasterized again on demand. The raster is written tile by tile, so blank regions
+    of a tiled canvas stay sparse holes in the file.
+
+    A memory-mapped file cannot be replaced on Windows, so a framebuffer that maps path
+    (see Framebuffer.maps) must be released first, together with any other views of its
+    arrays; it can then be mapped again from the returned project (Framebuffer.reopen).
+
+    :return: The saved project opened for reading
+    """
+    arrays = {
+        "bounds": scene.bounds[:len(scene)],
+    }
+
+    sections = {}
+    offset = _align(PROLOGUE.size)
+    raster_shape = (framebuffer.height, framebuffer.width, 4)
+    sections["raster"] = {"offset": offset, "dtype": "uint8", "shape": list(raster_shape)}
+    offset = _align(offset + int(np.prod(raster_shape)))
+    for name, array in arrays.items():
+        sections[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+        offset = _align(offset + array.nbytes)
+
+    records = []
+    for record in scene.records:
+        color = record.color if record is not None else RGBA(0, 0, 0)
+        records.append({
+            "algorithm": record.params.get("algorithm") if record is not None else None,
+            "points": [[p.x, p.y] for p in record.main_points] if record is not None else [],
+            "color": [color.r, color.g, color.b, color.a],
+            "layer": record.layer if record is not None else 0,
+        })
+
+    # Write next to the target and swap it in, so a failed save leaves the old file intact
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(PROLOGUE.pack(MAGIC, 0, 0))
+        for name, array in arrays.items():
+            file.seek(sections[name]["offset"])
+            file.write(np.ascontiguousarray(array).tobytes())
+        file.truncate(offset)
+
+    raster = np.memmap(temporary, dtype=np.uint8, mode="r+", offset=sections["raster"]["offset"], shape=raster_shape)
+    tile_map = framebuffer.save_base(raster)
+    raster.flush()
+    del raster
+
+    header = {
+        "version": FORMAT_VERSION,
+        "width": framebuffer.width,
+        "height": framebuffer.height,
+        "sections": sections,
+        "records": records,
+        "state": _to_json(state or {}),
+    }
+    with open(temporary, "r+b") as file:
+        if tile_map is not None:
+            # Regions of missing tiles are left as holes in the file and read back as background
+            sections["tile_map"] = {"offset": offset, "dtype": "|b1", "shape": list(tile_map.shape),
+                                    "tile_size": framebuffer.base_surface.tile_size}
+            file.seek(offset)
+            file.write(tile_map.tobytes())
+            offset = _align(offset + tile_map.nbytes)
+        encoded = json.dumps(header).encode("utf-8")
+        file.seek(offset)
+        file.write(encoded)
+        file.seek(0)
+        file.write(PROLOGUE.pack(MAGIC, offset, len(encoded)))
+    os.replace(temporary, path)
+    return Project(path=path, width=framebuffer.width, height=framebuffer.height, scene=scene,
+                   state=state or {}, sections=sections)
+
+
+def load_project(path: str) -> Project:
+    """Opens a project file; the raster stays on disk until it is accessed"""
+    with open(path, "rb") as file:
+        magic, header_offset, header_length = PROLOGUE.unpack(file.read(PROLOGUE.size))
+        if magic != MAGIC:
+            raise ValueError("Not a project file")
+        file.seek(header_offset)
+        header = json.loads(file.read(header_length).decode("utf-8"))
+    if header["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported project version {header['version']}")
+
+    project = Project(path=path, width=header["width"], height=header["height"], scene=None,
+                      state={key: _to_tuples(value) for key, value in header["state"].items()},
+                      sections=header["sections"])
+
+    records = []
+    for item in header["records"]:
+        if item["algorithm"] is None:
+            records.append(None)
+        else:
+            records.append(create_record(item["algorithm"], item["points"], RGBA(*item["color"]), item["layer"]))
+    project.scene = Scene.from_records(records, np.array(project.section("bounds")))
+    return project
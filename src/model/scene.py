@@ -0,0 +1,208 @@
+from typing import List, Optional
+
+import numpy as np
+
+from src.drawing_algorithms import cache
+from src.model.base import BaseObject
+from src.model.object_store import ObjectStore
+from src.raster.compositing import as_pixel_array, composite_pixels
+from src.raster.surface import BACKGROUND
+
+
+def rasterize(record: BaseObject, scale: int = 1, clip=None, raster_cache=None) -> np.ndarray:
+    """
+    Rasterizes a shape from its parameters.
+
+    :param record: Shape record; params["algorithm"] selects the rasterizer, main_points are its inputs
+    :param scale: Integer zoom level; points are mapped to the centers of the scaled canvas pixels
+    :param clip: Optional rect (x0, y0, x1, y1) in coordinates of the scaled canvas; only pixels
+                 inside it are computed
+    :param raster_cache: Cache to use instead of the shared one
+    :return: (M, 3) array of [x, y, alpha] pixels in coordinates of the scaled canvas
+    """
+    points = [(p.x * scale + scale // 2, p.y * scale + scale // 2) for p in record.main_points]
+    pixels = cache.rasterize(record.params["algorithm"], points, raster_cache, clip)
+    if record.color.a != 255:
+        pixels[:, 2] = pixels[:, 2] * record.color.a // 255
+    return pixels
+
+
+def split_bands(pixels: np.ndarray, top: int, rows: int):
+    """
+    Splits pixels into horizontal bands, keeping their order within each band.
+
+    :param pixels: (M, 3) array of [x, y, alpha] pixels
+    :param top: Row where the first band starts
+    :param rows: Band height in pixels
+    :return: List of (M_i, 3) arrays for the non-empty bands, top to bottom
+    """
+    bands = (pixels[:, 1] - top) // rows
+    order = np.argsort(bands, kind="stable")
+    edges = np.flatnonzero(np.diff(bands[order])) + 1
+    return np.split(pixels[order], edges) if len(pixels) else []
+
+
+def rasterize_bands(record: BaseObject, clip, rows: int):
+    """
+    Rasterizes a shape at zoom level 1 in horizontal bands of clip, for progressive display.
+
+    Every pixel falls into exactly one band and keeps its order within the shape, so
+    compositing the bands one after another gives the same result as compositing
+    rasterize(record, clip=clip). Bands outside the shape's bounds are skipped. Only
+    rasterizers whose clipped cost follows the visible part (cache.CLIP_EFFICIENT) are
+    run per band; other shapes, and shapes without estimated bounds (see cache.BOUNDS),
+    are rasterized once and split into bands.
+
+    :param record: Shape record
+    :param clip: Rect (x0, y0, x1, y1) to rasterize
+    :param rows: Band height in pixels
+    :return: Generator of (M, 3) arrays of [x, y, alpha] pixels
+    """
+    x0, y0, x1, y1 = clip
+    # Band results are used once, so they are not kept in the shared raster cache
+    band_cache = cache.RasterCache(max_bytes=0)
+    algorithm = record.params["algorithm"]
+    bounds = cache.shape_bounds(algorithm, [(p.x, p.y) for p in record.main_points])
+    if bounds is None or algorithm not in cache.CLIP_EFFICIENT:
+        yield from split_bands(rasterize(record, clip=clip, raster_cache=band_cache), y0, rows)
+        return
+    for top in range(max(y0, bounds[1]), min(y1, bounds[3]), rows):
+        yield rasterize(record, clip=(x0, top, x1, min(top + rows, y1)), raster_cache=band_cache)
+
+
+class Scene:
+    """
+    Shapes of the canvas kept as parametric records.
+
+    Only the records and their bounding boxes are stored; pixels are rasterized on
+    demand for a zoom level through the shared raster cache (see
+    src.drawing_algorithms.cache), so memory scales with the number of shapes
+    rather than their size. Only shapes taken out for debugging keep their pixels,
+    in the compact columns of an ObjectStore (see take_last).
+    """
+
+    def __init__(self):
+        self.records: List[Optional[BaseObject]] = []  # Shape records in drawing order
+        self.bounds = np.empty((64, 4), dtype=np.int32)  # Bounding box (x0, y0, x1, y1) at zoom level 1
+        self.removed = ObjectStore(capacity=0)  # Shapes taken out by take_last, with their pixels at zoom level 1
+
+    @classmethod
+    def from_records(cls, records, bounds):
+        """Creates a scene from saved records and their bounding boxes without rasterizing them"""
+        scene = cls()
+        for record, rect in zip(records, bounds):
+            scene._push(record, rect)
+        return scene
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.pixels(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.pixels(index)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bounding boxes"""
+        return len(self) * self.bounds.itemsize * 4
+
+    def append(self, record: BaseObject, pixels=None) -> int:
+        """
+        Adds a shape, returns its index.
+
+        :param pixels: Already rasterized pixels at zoom level 1 (e.g. of a shape returned by remove_last)
+        """
+        pixels = rasterize(record) if pixels is None else as_pixel_array(pixels)
+        if len(pixels):
+            rect = (*pixels[:, :2].min(axis=0), *(pixels[:, :2].max(axis=0) + 1))
+        else:
+            rect = (0, 0, 0, 0)
+        return self._push(record, rect)
+
+    def remove_last(self, clip=None):
+        """
+        Removes the last shape, returns its pixels at zoom level 1 and its record.
+
+        :param clip: Optional rect (x0, y0, x1, y1); only pixels inside it are rasterized and returned
+        """
+        pixels = self.pixels(len(self) - 1, clip=clip)
+        return pixels, self.records.pop()
+
+    def take_last(self, clip=None) -> int:
+        """
+        Moves the last shape into the removed store, where its pixels can be sliced
+        (removed.pixels(index, stop=n)) and which pop_removed returns it from.
+
+        :param clip: Optional rect (x0, y0, x1, y1); only pixels inside it are kept
+        :return: Index of the shape in the removed store
+        """
+        pixels, record = self.remove_last(clip)
+        return self.removed.append(pixels, record)
+
+    def pop_removed(self):
+        """Takes the last shape out of the removed store, returns its pixels at zoom level 1 and its record"""
+        return self.removed.remove_last()
+
+    def clear(self):
+        self.records.clear()
+
+    def pixels(self, index: int, scale: int = 1, clip=None) -> np.ndarray:
+        """Pixels of a shape at a zoom level, optionally only those inside clip (scaled coordinates)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("shape index out of range")
+        return rasterize(self.records[index], scale, clip)
+
+    def bounding_rect(self, index: int):
+        x0, y0, x1, y1 = (int(v) for v in self.bounds[index])
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def all_pixels(self) -> np.ndarray:
+        """Pixels of all shapes at zoom level 1 in drawing order"""
+        parts = [self.pixels(index) for index in range(len(self))]
+        return np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int32)
+
+    def shapes_in_rect(self, rect, margin: int = 0) -> np.ndarray:
+        """Indices of shapes whose bounding box (grown by margin) intersects rect, in drawing order"""
+        bounds = self.bounds[:len(self)]
+        x0, y0, x1, y1 = rect
+        hit = ((bounds[:, 0] - margin < x1) & (x0 < bounds[:, 2] + margin) &
+               (bounds[:, 1] - margin < y1) & (y0 < bounds[:, 3] + margin) &
+               (bounds[:, 0] < bounds[:, 2]))
+        return np.flatnonzero(hit)
+
+    def pixels_in_rect(self, rect) -> np.ndarray:
+        """Pixels at zoom level 1 inside rect of all shapes whose bounding box intersects it, in drawing order"""
+        parts = [self.pixels(index, clip=rect) for index in self.shapes_in_rect(rect)]
+        return np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int32)
+
+    def render(self, rect, scale: int) -> np.ndarray:
+        """
+        Renders a region of the canvas at native resolution of a zoom level.
+
+        :param rect: Region (x0, y0, x1, y1) in canvas coordinates
+        :param scale: Integer zoom level
+        :return: RGBA array ((y1 - y0) * scale, (x1 - x0) * scale, 4)
+        """
+        x0, y0, x1, y1 = rect
+        target = np.full(((y1 - y0) * scale, (x1 - x0) * scale, 4), BACKGROUND, dtype=np.uint8)
+        # Only the visible part of each shape is rasterized, so the cost follows the region, not the zoom
+        clip = (x0 * scale, y0 * scale, x1 * scale, y1 * scale)
+        # A shape rasterized at a finer grid may leave its zoom level 1 box by up to a pixel
+        for index in self.shapes_in_rect(rect, margin=1):
+            composite_pixels(target, self.pixels(index, scale, clip) - np.array([x0 * scale, y0 * scale, 0]))
+        return target
+
+    def _push(self, record, rect) -> int:
+        index = len(self)
+        if index == len(self.bounds):
+            self.bounds = np.resize(self.bounds, (2 * index, 4))
+        self.bounds[index] = rect
+        self.records.append(record)
+        return index
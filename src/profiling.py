@@ -0,0 +1,182 @@
+"""
+Профилирование горячих участков редакторов.
+
+Участки кода отмечаются через profiler.stage("имя") (время выполнения) и
+profiler.count("имя", n) (счётчики: пиксели, проверенные треугольники, вызовы
+point_in_polygon и т. п.). Пока профилировщик выключен (по умолчанию), stage и
+count почти ничего не стоят. Включённый профилировщик накапливает статистику
+по участкам для строки состояния и события для трассы в формате Chrome
+(chrome://tracing, Perfetto), которую сохраняет export_chrome_trace.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# Сколько последних событий хранится для трассы
+MAX_EVENTS = 200_000
+
+
+class StageStats:
+    """Статистика участка: количество вызовов, суммарное, последнее и наибольшее время в секундах."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+        self.finished = 0  # Номер последнего завершения (для порядка в summary)
+
+    @property
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+
+class Profiler:
+    """Таймеры участков и счётчики с записью событий трассы."""
+
+    def __init__(self, enabled=False, max_events=MAX_EVENTS):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.events = deque(maxlen=max_events)  # События трассы (словари формата Chrome)
+        self.stages = {}  # Имя участка -> StageStats
+        self.counters = {}  # Имя счётчика -> значение
+        self.threads = {}  # Идентификатор потока -> (номер в трассе, имя)
+        self.origin = time.perf_counter_ns()
+        self.sequence = 0
+        self.counters_changed = False
+
+    def reset(self):
+        """Сбрасывает статистику, счётчики и события."""
+        with self.lock:
+            self.events.clear()
+            self.stages.clear()
+            self.counters.clear()
+            self.origin = time.perf_counter_ns()
+            self.counters_changed = False
+
+    def stage(self, name, **args):
+        """
+        Контекстный менеджер, замеряющий время участка.
+
+        :param name: Имя участка (например, "canvas.paint");
+        :param args: Дополнительные данные события трассы (алгоритм, размер и т. п.).
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._stage(name, args)
+
+    @contextmanager
+    def _stage(self, name, args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter_ns() - start, args)
+
+    def timed(self, name):
+        """Декоратор, замеряющий каждый вызов функции как участок name."""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, value=1):
+        """Увеличивает счётчик."""
+        if self.enabled:
+            with self.lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+                self.counters_changed = True
+
+    def iterate(self, name, parts, counter=None, size=len, **args):
+        """
+        Итератор частей результата, в котором вычисление каждой части замеряется как участок.
+
+        Подходит для заданий фоновой растеризации: время записывается в потоке,
+        который вычисляет части.
+
+        :param name: Имя участка;
+        :param parts: Итератор частей;
+        :param counter: Имя счётчика, к которому прибавляется размер каждой части;
+        :param size: Функция размера части для счётчика (по умолчанию len);
+        :param args: Дополнительные данные событий трассы.
+        """
+        parts = iter(parts)
+        while True:
+            start = time.perf_counter_ns()
+            part = next(parts, None)
+            if part is None:
+                return
+            if self.enabled:
+                self.record(name, start, time.perf_counter_ns() - start, args)
+                if counter is not None:
+                    self.count(counter, size(part))
+            yield part
+
+    def record(self, name, start, duration, args=None):
+        """Добавляет завершённый участок (время в наносекундах от time.perf_counter_ns)."""
+        thread = self._thread_id()
+        event = {"name": name, "ph": "X", "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+                 "pid": os.getpid(), "tid": thread}
+        if args:
+            event["args"] = args
+        with self.lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            seconds = duration / 1e9
+            stats.calls += 1
+            stats.total += seconds
+            stats.last = seconds
+            stats.max = max(stats.max, seconds)
+            self.sequence += 1
+            stats.finished = self.sequence
+            self.events.append(event)
+            # Значения счётчиков попадают в трассу в конце участков, во время которых они изменились
+            if self.counters_changed:
+                self.events.append({"name": "counters", "ph": "C", "ts": event["ts"] + event["dur"],
+                                    "pid": event["pid"], "tid": thread, "args": dict(self.counters)})
+                self.counters_changed = False
+
+    def summary(self, limit=4):
+        """
+        Краткая сводка для строки состояния: последние завершённые участки и счётчики.
+
+        :param limit: Количество участков в сводке;
+        :return: Строка вида "canvas.paint 1.2 ms (max 4.0) | ... | pixels 12345".
+        """
+        with self.lock:
+            recent = sorted(self.stages.items(), key=lambda item: -item[1].finished)[:limit]
+            counters = list(self.counters.items())
+        parts = [f"{name} {stats.last * 1e3:.1f} ms (max {stats.max * 1e3:.1f})" for name, stats in recent]
+        parts += [f"{name} {value}" for name, value in counters]
+        return " | ".join(parts)
+
+    def export_chrome_trace(self, path):
+        """Сохраняет накопленные события в JSON-файл трассы Chrome (Trace Event Format)."""
+        with self.lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": number, "args": {"name": name}}
+                    for number, name in threads.values()]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, file)
+
+    def _thread_id(self):
+        """Короткий номер потока для трассы (идентификаторы потоков ОС слишком длинные для просмотра)."""
+        ident = threading.get_ident()
+        entry = self.threads.get(ident)
+        if entry is None:
+            with self.lock:
+                entry = self.threads.setdefault(ident, (len(self.threads) + 1, threading.current_thread().name))
+        return entry[0]
+
+
+# Профилировщик, общий для всех редакторов
+profiler = Profiler()
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+def as_pixel_array(pixels):
+    """
+    Приводит пиксели объекта к массиву формы (M, 3) со столбцами x, y, alpha.
+
+    :param pixels: Список [x, y, alpha], массив (M, 3) или структурированный массив с полями x, y, alpha;
+    :return: Массив int64 формы (M, 3).
+    """
+    if isinstance(pixels, np.ndarray) and pixels.dtype.names:
+        return np.stack([pixels["x"], pixels["y"], pixels["alpha"]], axis=1).astype(np.int64)
+    pixels = np.asarray(pixels, dtype=np.int64)
+    return pixels.reshape(-1, 3)
+
+
+def occurrence_rank(indices):
+    """
+    Для каждого элемента возвращает номер его повторения среди предыдущих элементов.
+
+    Первое вхождение пикселя получает 0, второе -- 1 и т.д. Пиксели с одинаковым
+    номером уникальны, поэтому их можно записывать одной операцией индексации.
+
+    :param indices: Линейные индексы пикселей;
+    :return: Массив номеров повторений.
+    """
+    order = np.argsort(indices, kind="stable")
+    sorted_indices = indices[order]
+    group_start = np.r_[True, sorted_indices[1:] != sorted_indices[:-1]] if len(indices) else np.zeros(0, bool)
+    first = np.maximum.accumulate(np.where(group_start, np.arange(len(indices)), 0))
+
+    rank = np.empty(len(indices), dtype=np.int64)
+    rank[order] = np.arange(len(indices)) - first
+    return rank
+
+
+def composite_pixels(canvas_pixels, pixels):
+    """
+    Накладывает чёрные пиксели с альфа-каналом на RGBA-буфер.
+
+    Пиксели за пределами буфера отбрасываются маской. Повторяющиеся пиксели
+    накладываются в порядке следования проходами по номеру повторения, поэтому
+    результат совпадает с последовательным попиксельным наложением.
+
+    :param canvas_pixels: RGBA-буфер формы (height, width, 4), изменяется на месте;
+    :param pixels: Пиксели объекта (см. as_pixel_array).
+    """
+    height, width = canvas_pixels.shape[:2]
+    pixels = as_pixel_array(pixels)
+    x, y, alpha = pixels[:, 0], pixels[:, 1], pixels[:, 2]
+
+    inside = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+    x, y, alpha = x[inside], y[inside], alpha[inside]
+
+    rank = occurrence_rank(y * width + x)
+
+    new_alpha = alpha / 255.0
+    inv_alpha = 1.0 - new_alpha
+
+    for current in range(int(rank.max()) + 1 if len(rank) else 0):
+        selected = rank == current
+        ys, xs = y[selected], x[selected]
+        inv = inv_alpha[selected]
+        existing = canvas_pixels[ys, xs].astype(np.float64)
+
+        canvas_pixels[ys, xs, :3] = (existing[:, :3] * inv[:, None]).astype(np.uint8)
+        canvas_pixels[ys, xs, 3] = (255 * new_alpha[selected] + existing[:, 3] * inv).astype(np.uint8)
@@ -0,0 +1,215 @@
+import os
+
+import numpy as np
+
+from src.raster.compositing import as_pixel_array
+from src.raster.surface import DenseSurface
+from src.raster.tiles import TiledSurface
+
+# Начиная с такой площади холст хранится плитками
+TILED_AREA = 4096 * 4096
+# Плиток каждого слоя в ОЗУ (по 256 КиБ), остальные сбрасываются в файл подкачки
+MAX_RESIDENT_TILES = 512
+
+
+def bounding_rect(pixels):
+    """
+    Прямоугольник, охватывающий пиксели объекта.
+
+    :param pixels: Пиксели объекта (см. as_pixel_array);
+    :return: Кортеж (x0, y0, x1, y1) с исключающей правой и нижней границей или None для пустого объекта.
+    """
+    pixels = as_pixel_array(pixels)
+    if not len(pixels):
+        return None
+    x0, y0 = pixels[:, :2].min(axis=0)
+    x1, y1 = pixels[:, :2].max(axis=0) + 1
+    return int(x0), int(y0), int(x1), int(y1)
+
+
+def union_rect(first, second):
+    """Объединение двух прямоугольников (любой из них может быть None)."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
+
+
+class Framebuffer:
+    """
+    Слоистый кадровый буфер холста.
+
+    base -- закэшированная композиция всех зафиксированных объектов;
+    pixels -- отображаемый буфер: base и поверх него отлаживаемый объект (overlay).
+    Изменения затрагивают только «грязный» прямоугольник, а не весь буфер.
+    Для больших холстов оба слоя хранятся разреженно плитками (TiledSurface).
+    """
+
+    def __init__(self, width, height, tiled=None, max_resident_tiles=None, open_raster=None, tile_map=None):
+        """
+        :param open_raster: Функция, возвращающая новое отображение (с копированием при записи)
+                            сохранённого растра, с которого начинают оба слоя;
+        :param tile_map: Карта плиток, присутствующих в сохранённом растре (для плиточного холста).
+        """
+        self.width = width
+        self.height = height
+        if tiled is None:
+            tiled = width * height >= TILED_AREA
+        if tiled:
+            self.base_surface, self.surface = (
+                TiledSurface(width, height, max_resident=max_resident_tiles,
+                             backing=None if open_raster is None else open_raster(), backing_tiles=tile_map)
+                for _ in range(2))
+        else:
+            self.base_surface, self.surface = (
+                DenseSurface(width, height, None if open_raster is None else open_raster()) for _ in range(2))
+        self.overlay = None
+        self.overlay_rect = None
+        self.dirty_rect = None
+        if open_raster is None:
+            self.clear()
+        else:
+            self.mark_dirty((0, 0, width, height))
+
+    @property
+    def tiled(self):
+        return isinstance(self.surface, TiledSurface)
+
+    @property
+    def pixels(self):
+        """Отображаемый буфер как массив (height, width, 4); для плиточного холста -- None."""
+        return None if self.tiled else self.surface.array
+
+    @property
+    def base(self):
+        return None if self.tiled else self.base_surface.array
+
+    def maps(self, path):
+        """
+        Используют ли слои отображение файла path (например, открытого проекта).
+
+        Отображённый в память файл нельзя заменить или удалить в Windows, поэтому перед
+        сохранением поверх него слои отвязываются от файла (release).
+        """
+        backing = self.base_surface.backing if self.tiled else self.base_surface.array
+        return isinstance(backing, np.memmap) and os.path.exists(path) and os.path.samefile(backing.filename, path)
+
+    def release(self):
+        """Переносит содержимое слоёв, отображённое из файла, в память (плиточные слои -- в плитки)."""
+        self.base_surface.release_backing()
+        self.surface.release_backing()
+
+    def reopen(self, open_raster, tile_map=None):
+        """
+        Отображает оба слоя из сохранённого растра, совпадающего с базовым слоем (например, после сохранения).
+
+        :param open_raster: Функция, возвращающая новое отображение растра (см. __init__);
+        :param tile_map: Карта плиток, присутствующих в растре (для плиточного холста).
+        """
+        self.base_surface.reopen(open_raster(), tile_map)
+        self.surface.reopen(open_raster(), tile_map)
+        self.refresh(self.overlay_rect)
+        self.mark_dirty((0, 0, self.width, self.height))
+
+    def clip(self, rect):
+        """Обрезает прямоугольник по границам буфера, возвращает None для пустого результата."""
+        if rect is None:
+            return None
+        x0, y0 = max(rect[0], 0), max(rect[1], 0)
+        x1, y1 = min(rect[2], self.width), min(rect[3], self.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def mark_dirty(self, rect):
+        """Добавляет прямоугольник к области, изменённой с момента последнего take_dirty."""
+        self.dirty_rect = union_rect(self.dirty_rect, self.clip(rect))
+
+    def take_dirty(self):
+        """Возвращает изменённую область и сбрасывает её."""
+        rect, self.dirty_rect = self.dirty_rect, None
+        return rect
+
+    def clear(self):
+        """Заполняет буфер белым фоном и убирает все слои."""
+        full = (0, 0, self.width, self.height)
+        self.base_surface.fill(full)
+        self.surface.fill(full)
+        self.overlay = None
+        self.overlay_rect = None
+        self.mark_dirty(full)
+
+    def commit(self, pixels):
+        """Накладывает объект на базовый слой."""
+        rect = self.clip(bounding_rect(pixels))
+        if rect is None:
+            return
+        self.base_surface.composite(pixels)
+        self.refresh(rect)
+
+    def set_overlay(self, pixels):
+        """Заменяет отлаживаемый объект, перерисовывая только старую и новую области."""
+        old_rect = self.overlay_rect
+        self.overlay = None if pixels is None else as_pixel_array(pixels)
+        self.overlay_rect = None if pixels is None else self.clip(bounding_rect(self.overlay))
+        self.refresh(union_rect(old_rect, self.overlay_rect))
+
+    def rebuild_region(self, rect, pixels):
+        """
+        Пересобирает базовый слой в прямоугольнике из пикселей зафиксированных объектов.
+
+        Используется после удаления объекта: достаточно передать пиксели объектов,
+        пересекающих удалённую область.
+
+        :param rect: Прямоугольник (x0, y0, x1, y1);
+        :param pixels: Пиксели объектов в порядке наложения.
+        """
+        rect = self.clip(rect)
+        if rect is None:
+            return
+        self.base_surface.fill(rect)
+        self.base_surface.composite(pixels, rect)
+        self.refresh(rect)
+
+    def rebuild(self, pixels):
+        """Полностью пересобирает базовый слой."""
+        self.rebuild_region((0, 0, self.width, self.height), pixels)
+
+    def refresh(self, rect):
+        """Копирует базовый слой в отображаемый буфер и накладывает overlay в пределах прямоугольника."""
+        rect = self.clip(rect)
+        if rect is None:
+            return
+        self.surface.copy_from(self.base_surface, rect)
+        if self.overlay is not None and self._intersects(self.overlay_rect, rect):
+            self.surface.composite(self.overlay, rect)
+        self.mark_dirty(rect)
+
+    def read(self, rect):
+        """Содержимое отображаемого буфера в прямоугольнике."""
+        return self.surface.read(rect)
+
+    def close(self):
+        """Закрывает слои (и удаляет их временные файлы подкачки), когда буфер больше не нужен."""
+        self.base_surface.close()
+        self.surface.close()
+
+    def save_base(self, target):
+        """
+        Записывает базовый слой в плотный массив (например, отображение файла проекта).
+
+        :return: Карта записанных плиток для плиточного холста или None, если записан весь растр.
+        """
+        if self.tiled:
+            return self.base_surface.export(target)
+        target[:] = self.base_surface.array
+        return None
+
+    @staticmethod
+    def _intersects(first, second):
+        """Проверяет пересечение двух прямоугольников."""
+        if first is None or second is None:
+            return False
+        return first[0] < second[2] and second[0] < first[2] and first[1] < second[3] and second[1] < first[3]
@@ -0,0 +1,74 @@
+import numpy as np
+
+from src.raster.compositing import as_pixel_array, composite_pixels
+
+# Цвет фона холста (белый, непрозрачный)
+BACKGROUND = 255
+
+
+def clip_pixels(pixels, rect):
+    """
+    Оставляет пиксели, попадающие в прямоугольник.
+
+    :param pixels: Пиксели объекта (см. as_pixel_array);
+    :param rect: Прямоугольник (x0, y0, x1, y1) с исключающими правой и нижней границами;
+    :return: Массив формы (M, 3).
+    """
+    pixels = as_pixel_array(pixels)
+    x0, y0, x1, y1 = rect
+    x, y = pixels[:, 0], pixels[:, 1]
+    return pixels[(x0 <= x) & (x < x1) & (y0 <= y) & (y < y1)]
+
+
+class DenseSurface:
+    """
+    RGBA-поверхность на одном непрерывном массиве (height, width, 4).
+
+    Все операции принимают прямоугольники и пиксели в координатах холста.
+    """
+
+    def __init__(self, width, height, array=None):
+        self.width = width
+        self.height = height
+        self.array = np.full((height, width, 4), BACKGROUND, dtype=np.uint8) if array is None else array
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+    def composite(self, pixels, rect=None):
+        """Накладывает пиксели [x, y, alpha], ограничиваясь прямоугольником rect."""
+        if rect is None:
+            composite_pixels(self.array, pixels)
+            return
+        x0, y0, x1, y1 = rect
+        composite_pixels(self.array[y0:y1, x0:x1], clip_pixels(pixels, rect) - np.array([x0, y0, 0]))
+
+    def fill(self, rect, value=BACKGROUND):
+        x0, y0, x1, y1 = rect
+        self.array[y0:y1, x0:x1] = value
+
+    def read(self, rect):
+        """Содержимое прямоугольника (для плотной поверхности -- без копирования)."""
+        x0, y0, x1, y1 = rect
+        return self.array[y0:y1, x0:x1]
+
+    def write(self, rect, values):
+        x0, y0, x1, y1 = rect
+        self.array[y0:y1, x0:x1] = values
+
+    def release_backing(self):
+        """Копирует массив, отображённый в память, в ОЗУ и отвязывает поверхность от файла."""
+        if isinstance(self.array, np.memmap):
+            self.array = np.array(self.array)
+
+    def reopen(self, backing, backing_tiles=None):
+        """Заменяет содержимое поверхности сохранённым растром (backing_tiles -- для совместимости с TiledSurface)."""
+        self.array = backing
+
+    def copy_from(self, other, rect):
+        """Копирует прямоугольник из другой поверхности."""
+        self.write(rect, other.read(rect))
+
+    def close(self):
+        """Плотной поверхности нечего закрывать (для совместимости с TiledSurface)."""
@@ -0,0 +1,275 @@
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from src.raster.compositing import as_pixel_array, composite_pixels
+from src.raster.surface import BACKGROUND, clip_pixels
+
+TILE_SIZE = 256
+
+
+class TiledSurface:
+    """
+    Разреженная RGBA-поверхность из квадратных плиток.
+
+    Плитка выделяется при первой записи; плитки, содержащие только фон, не хранятся.
+    Если задано max_resident, в памяти остаётся не больше max_resident плиток
+    (LRU), а вытесненные плитки сбрасываются в файл, отображённый в память
+    (np.memmap), и загружаются обратно при следующем обращении.
+
+    backing -- необязательный сохранённый растр (height, width, 4), например
+    отображение файла проекта: плитка читается из него при первом обращении.
+    backing_tiles -- карта (ny, nx) плиток, присутствующих в backing (None -- все).
+    """
+
+    def __init__(self, width, height, tile_size=TILE_SIZE, max_resident=None, spill_path=None,
+                 backing=None, backing_tiles=None):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.max_resident = max_resident
+
+        self.backing = backing
+        self.backing_tiles = backing_tiles
+        self.detached = set()  # Плитки, для которых backing больше не действует
+
+        self.resident = OrderedDict()  # (tx, ty) -> массив плитки, в порядке последнего обращения
+        self.spilled = {}  # (tx, ty) -> номер слота в файле подкачки
+        self.free_slots = []
+
+        self.spill_path = spill_path
+        self.spill = None  # np.memmap формы (слоты, tile_size, tile_size, 4)
+        self._owns_spill_file = False
+
+    @property
+    def nbytes(self):
+        """Память, занятая плитками в ОЗУ."""
+        return len(self.resident) * self.tile_size * self.tile_size * 4
+
+    def __contains__(self, key):
+        return key in self.resident or key in self.spilled or self._in_backing(key)
+
+    @property
+    def grid_size(self):
+        """Количество плиток по горизонтали и вертикали."""
+        size = self.tile_size
+        return (self.width + size - 1) // size, (self.height + size - 1) // size
+
+    def tile(self, tx, ty, create=True):
+        """
+        Массив плитки (tile_size, tile_size, 4).
+
+        :param create: Создать плитку, заполненную фоном, если её нет;
+        :return: Массив плитки или None, если плитки нет и create ложно.
+        """
+        key = (tx, ty)
+        if key in self.resident:
+            self.resident.move_to_end(key)
+            return self.resident[key]
+        if key in self.spilled:
+            slot = self.spilled.pop(key)
+            array = np.array(self.spill[slot])
+            self.free_slots.append(slot)
+        elif self._in_backing(key):
+            array = self._read_backing(key)
+            self.detached.add(key)
+        elif create:
+            array = np.full((self.tile_size, self.tile_size, 4), BACKGROUND, dtype=np.uint8)
+        else:
+            return None
+        self.resident[key] = array
+        self._evict()
+        return array
+
+    def drop(self, tx, ty):
+        """Удаляет плитку (она снова считается заполненной фоном)."""
+        key = (tx, ty)
+        self.resident.pop(key, None)
+        if key in self.spilled:
+            self.free_slots.append(self.spilled.pop(key))
+        self.detached.add(key)
+
+    def composite(self, pixels, rect=None):
+        """Накладывает пиксели [x, y, alpha] плитка за плиткой, ограничиваясь прямоугольником rect."""
+        bounds = (0, 0, self.width, self.height) if rect is None else rect
+        pixels = clip_pixels(as_pixel_array(pixels), bounds)
+        if not len(pixels):
+            return
+
+        size = self.tile_size
+        tx, ty = pixels[:, 0] // size, pixels[:, 1] // size
+        keys = ty * ((self.width + size - 1) // size) + tx
+        # Устойчивая сортировка сохраняет порядок наложения внутри плитки
+        order = np.argsort(keys, kind="stable")
+        pixels, tx, ty, keys = pixels[order], tx[order], ty[order], keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+
+        for start, end in zip(starts, ends):
+            key_x, key_y = int(tx[start]), int(ty[start])
+            local = pixels[start:end] - np.array([key_x * size, key_y * size, 0])
+            composite_pixels(self.tile(key_x, key_y), local)
+
+    def fill(self, rect, value=BACKGROUND):
+        """Заполняет прямоугольник; целиком покрытые фоном плитки освобождаются."""
+        for key, (x0, y0, x1, y1), (lx0, ly0, lx1, ly1) in self._tiles_in(rect):
+            if value == BACKGROUND and (lx1 - lx0, ly1 - ly0) == (self.tile_size, self.tile_size):
+                self.drop(*key)
+            elif key in self or value != BACKGROUND:
+                self.tile(*key)[ly0:ly1, lx0:lx1] = value
+
+    def read(self, rect):
+        """Копия содержимого прямоугольника; отсутствующие плитки читаются как фон."""
+        x0, y0, x1, y1 = rect
+        result = np.full((y1 - y0, x1 - x0, 4), BACKGROUND, dtype=np.uint8)
+        for key, (gx0, gy0, gx1, gy1), (lx0, ly0, lx1, ly1) in self._tiles_in(rect):
+            array = self.tile(*key, create=False)
+            if array is not None:
+                result[gy0 - y0:gy1 - y0, gx0 - x0:gx1 - x0] = array[ly0:ly1, lx0:lx1]
+        return result
+
+    def write(self, rect, values):
+        """Записывает прямоугольник; плитки, куда попадает только фон, не создаются."""
+        x0, y0, x1, y1 = rect
+        for key, (gx0, gy0, gx1, gy1), (lx0, ly0, lx1, ly1) in self._tiles_in(rect):
+            part = values[gy0 - y0:gy1 - y0, gx0 - x0:gx1 - x0]
+            if key not in self and (part == BACKGROUND).all():
+                continue
+            self.tile(*key)[ly0:ly1, lx0:lx1] = part
+
+    def copy_from(self, other, rect):
+        """Копирует прямоугольник из другой поверхности; между плиточными поверхностями -- по плиткам."""
+        if not isinstance(other, TiledSurface) or other.tile_size != self.tile_size:
+            self.write(rect, other.read(rect))
+            return
+        for key, _, (lx0, ly0, lx1, ly1) in self._tiles_in(rect):
+            source = other.tile(*key, create=False)
+            if source is None:
+                self.fill(self._tile_rect(key, lx0, ly0, lx1, ly1))
+            elif (lx1 - lx0, ly1 - ly0) == (self.tile_size, self.tile_size):
+                self.tile(*key)[:] = source
+            elif key in self or not (source[ly0:ly1, lx0:lx1] == BACKGROUND).all():
+                self.tile(*key)[ly0:ly1, lx0:lx1] = source[ly0:ly1, lx0:lx1]
+
+    def export(self, target):
+        """
+        Записывает непустые плитки в плотный массив (height, width, 4), не загружая их в LRU.
+
+        :param target: Массив назначения, например np.memmap файла проекта;
+        :return: Карта (ny, nx) записанных плиток; остальные области target не изменяются.
+        """
+        nx, ny = self.grid_size
+        written = np.zeros((ny, nx), dtype=bool)
+        for key, (gx0, gy0, gx1, gy1), (lx0, ly0, lx1, ly1) in self._tiles_in((0, 0, self.width, self.height)):
+            if key in self.resident:
+                array = self.resident[key]
+            elif key in self.spilled:
+                array = self.spill[self.spilled[key]]
+            elif self._in_backing(key):
+                target[gy0:gy1, gx0:gx1] = self.backing[gy0:gy1, gx0:gx1]
+                written[key[1], key[0]] = True
+                continue
+            else:
+                continue
+            target[gy0:gy1, gx0:gx1] = array[ly0:ly1, lx0:lx1]
+            written[key[1], key[0]] = True
+        return written
+
+    def release_backing(self):
+        """Загружает плитки сохранённого растра и отвязывает поверхность от его отображения."""
+        if self.backing is None:
+            return
+        nx, ny = self.grid_size
+        for ty in range(ny):
+            for tx in range(nx):
+                if self._in_backing((tx, ty)):
+                    self.tile(tx, ty)
+        self.backing = None
+        self.backing_tiles = None
+        self.detached.clear()
+
+    def reopen(self, backing, backing_tiles=None):
+        """Заменяет содержимое поверхности сохранённым растром; плитки снова читаются из него по мере обращения."""
+        self.resident.clear()
+        self.free_slots.extend(self.spilled.values())
+        self.spilled.clear()
+        self.detached.clear()
+        self.backing = backing
+        self.backing_tiles = backing_tiles
+
+    def close(self):
+        """Закрывает файл подкачки (временный файл удаляется); сброшенные в него плитки теряются."""
+        self.spilled.clear()
+        self.free_slots.clear()
+        if self.spill is not None:
+            self.spill = None
+            if self._owns_spill_file:
+                os.remove(self.spill_path)
+
+    def _tiles_in(self, rect):
+        """Плитки, пересекающие прямоугольник: ключ, часть в координатах холста и в координатах плитки."""
+        x0, y0 = max(rect[0], 0), max(rect[1], 0)
+        x1, y1 = min(rect[2], self.width), min(rect[3], self.height)
+        size = self.tile_size
+        for ty in range(y0 // size, (y1 - 1) // size + 1 if y1 > y0 else 0):
+            for tx in range(x0 // size, (x1 - 1) // size + 1 if x1 > x0 else 0):
+                gx0, gy0 = max(x0, tx * size), max(y0, ty * size)
+                gx1, gy1 = min(x1, (tx + 1) * size), min(y1, (ty + 1) * size)
+                yield (tx, ty), (gx0, gy0, gx1, gy1), (gx0 - tx * size, gy0 - ty * size,
+                                                       gx1 - tx * size, gy1 - ty * size)
+
+    def _in_backing(self, key):
+        if self.backing is None or key in self.detached:
+            return False
+        return self.backing_tiles is None or bool(self.backing_tiles[key[1], key[0]])
+
+    def _read_backing(self, key):
+        """Копия плитки из сохранённого растра, дополненная фоном у края холста."""
+        tx, ty = key
+        size = self.tile_size
+        x0, y0 = tx * size, ty * size
+        x1, y1 = min(x0 + size, self.width), min(y0 + size, self.height)
+        array = np.full((size, size, 4), BACKGROUND, dtype=np.uint8)
+        array[:y1 - y0, :x1 - x0] = self.backing[y0:y1, x0:x1]
+        return array
+
+    def _tile_rect(self, key, lx0, ly0, lx1, ly1):
+        """Переводит часть плитки в прямоугольник в координатах холста."""
+        tx, ty = key
+        size = self.tile_size
+        return tx * size + lx0, ty * size + ly0, tx * size + lx1, ty * size + ly1
+
+    def _evict(self):
+        """Сбрасывает давно не использованные плитки в файл подкачки."""
+        if self.max_resident is None:
+            return
+        while len(self.resident) > self.max_resident:
+            key, array = self.resident.popitem(last=False)
+            slot = self._take_slot()
+            self.spill[slot] = array
+            self.spilled[key] = slot
+
+    def _take_slot(self):
+        if self.free_slots:
+            return self.free_slots.pop()
+        used = 0 if self.spill is None else len(self.spill)
+        self._grow_spill(max(used * 2, 16))
+        self.free_slots.extend(range(len(self.spill) - 1, used, -1))
+        return used
+
+    def _grow_spill(self, slots):
+        """Увеличивает файл подкачки до заданного числа слотов."""
+        if self.spill_path is None:
+            handle, self.spill_path = tempfile.mkstemp(suffix=".tiles")
+            os.close(handle)
+            self._owns_spill_file = True
+        if self.spill is not None:
+            self.spill.flush()
+            self.spill = None
+
+        shape = (slots, self.tile_size, self.tile_size, 4)
+        with open(self.spill_path, "r+b" if os.path.exists(self.spill_path) else "w+b") as file:
+            file.truncate(int(np.prod(shape)))
+        self.spill = np.memmap(self.spill_path, dtype=np.uint8, mode="r+", shape=shape)
@@ -1,22 +1,25 @@
 import math
+from collections import OrderedDict
 from operator import invert
 from typing import List
 
 import numpy as np
-from PyQt6.QtCore import Qt, QPoint, QSize, QPointF, pyqtSignal
-from PyQt6.QtGui import QImage, QMouseEvent, QPainter, QWheelEvent, QIcon, QPen, QColor
+from PyQt6.QtCore import Qt, QPoint, QRect, QSize, QPointF, pyqtSignal
+from PyQt6.QtGui import QMouseEvent, QPainter, QWheelEvent, QIcon, QPen, QColor
 from PyQt6.QtWidgets import QWidget, QMessageBox
 
-from src.drawing_algorithms.conic_sections.circle import draw_circle
-from src.drawing_algorithms.conic_sections.ellipse import draw_ellipse
-from src.drawing_algorithms.conic_sections.hyperbola import draw_hyperbola
-from src.drawing_algorithms.conic_sections.parabola import draw_parabola
-from src.drawing_algorithms.curves.bezier import draw_bezier_curve
-from src.drawing_algorithms.curves.hermite import draw_hermite_curve
-from src.drawing_algorithms.curves.b_spline import draw_b_spline
-from src.drawing_algorithms.lines.bresenham import bresenham_line
-from src.drawing_algorithms.lines.dda import dda_line
-from src.drawing_algorithms.lines.wu import wu_line
+from src.drawing_algorithms.cache import RASTERIZERS
+from src.drawing_algorithms.curves.chains import CHAINS
+from src.model.base import create_record
+from src.model.project import load_project, save_project
+from src.model.scene import Scene, rasterize_bands
+from src.profiling import profiler
+from src.raster.framebuffer import MAX_RESIDENT_TILES, Framebuffer, bounding_rect, union_rect
+from src.view.presenter import ViewportPresenter
+from src.view.render_worker import BackgroundRenderer
+
+# Высота полос, которыми фигура растеризуется в фоне и появляется на холсте
+BAND_ROWS = 128
 
 
 class Canvas(QWidget):
@@ -42,12 +45,14 @@ class Canvas(QWidget):
         self.dragging = False
         self.last_mouse_pos = QPoint(0, 0)
 
-        # Холст в формате RGBA
-        self.canvas_pixels = np.zeros((self.image_height, self.image_width, 4), dtype=np.uint8)
-        self.canvas_pixels[:, :, :3] = 255  # Белый фон
-        self.canvas_pixels[:, :, 3] = 255  # Полная прозрачность
+        # Холст в формате RGBA: базовый слой зафиксированных объектов и отображаемый буфер
+        # (большие холсты хранятся плитками, и canvas_pixels для них равен None)
+        self.framebuffer = Framebuffer(self.image_width, self.image_height, max_resident_tiles=MAX_RESIDENT_TILES)
+        self.canvas_pixels = self.framebuffer.pixels
 
-        self.image = QImage(self.canvas_pixels, self.image_width, self.image_height, QImage.Format.Format_RGBA8888)
+        # Отображение буфера без копирования с кэшем масштабированной видимой области
+        self.presenter = ViewportPresenter(self.framebuffer)
+        self.image = self.presenter.image
 
         self.setMouseTracking(True)
 
@@ -62,16 +67,23 @@ class Canvas(QWidget):
         self.last_vector = None
         self.multi_curve = False
 
-        # Хранение всех фигур
-        self.objects = []
+        # Хранение всех фигур в виде параметров; пиксели растеризуются по требованию
+        self.objects = Scene()
+        self.presenter.scene = self.objects
 
         self.algorithm = "bezier"
 
-        # Стеки для дебага
+        # Состояние дебага: количество показанных пикселей удаленного объекта (он хранится в objects.removed)
         self.in_debug = False
-        self.debug_stack = []  # Удаленные линии (для "назад")
-        self.redo_stack = []  # Вернутые линии (для "вперед")
-        self.object_debugging = False
+        self.debug_position = 0
+
+        # Фоновая растеризация: фигуры добавляются в сцену в порядке рисования по мере готовности,
+        # а их полосы накладываются на базовый слой сразу по приходу
+        self.renderer = BackgroundRenderer(self)
+        self.renderer.partial.connect(self.on_render_partial)
+        self.renderer.finished.connect(self.on_render_finished)
+        self.renderer.failed.connect(self.on_render_failed)
+        self.pending = OrderedDict()  # Номер задачи -> [запись, прямоугольник уже наложенных полос]
 
     def sizeHint(self):
         """Размер холста с учетом масштаба"""
@@ -159,20 +171,19 @@ class Canvas(QWidget):
                 if self.algorithm == "b-spline":
                     self.preview_lines.append((self.preview_lines[-1][1], self.start_point))
             else:
-                print("cleared")
                 self.drawing_line = False
                 self.preview_lines.clear()
             self.start_point = None  # Убираем начальную точку
             self.end_point = None  # Убираем конечную точку
         self.update()
 
+    @profiler.timed("canvas.paint")
     def paintEvent(self, event):
         """Рендеринг холста с временной линией, не удаляя уже нарисованные объекты"""
         painter = QPainter(self)
 
-        # Отображаем основное изображение
-        scaled_image = self.image.scaled(self.sizeHint(), Qt.AspectRatioMode.IgnoreAspectRatio)
-        painter.drawImage(self.offset, scaled_image)
+        # Отображаем видимую часть основного изображения
+        self.presenter.draw(painter, self.offset, self.zoom_factor, event.rect())
 
         # Визуализация временных линий
         pen = QPen(QColor(255, 0, 0, 128))
@@ -238,70 +249,32 @@ class Canvas(QWidget):
 
         # Выбор алгоритма
         if self.algorithm == "wu":
-            pixels = wu_line(start, end)
-            self.draw_object_from_pixels(pixels)
-            self.objects.append(pixels)
+            self.add_object([start, end])
             self.last_line = None
 
 
         elif self.algorithm == "bresenham":
-            pixels = bresenham_line(start, end)
-            for x, y in pixels:
-                if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                    self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-            pixels_with_alpha = []
-            for x, y in pixels:
-                pixels_with_alpha.append([x, y, 255])
-            self.objects.append(pixels_with_alpha)
+            self.add_object([start, end])
             self.last_line = None
 
 
         elif self.algorithm == "dda":
-            pixels = dda_line(start, end)
-            for x, y in pixels:
-                if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                    self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-            pixels_with_alpha = []
-            for x, y in pixels:
-                pixels_with_alpha.append([x, y, 255])
-            self.objects.append(pixels_with_alpha)
+            self.add_object([start, end])
             self.last_line = None
 
 
         elif self.algorithm == "circle":
-            pixels = draw_circle(start[0], start[1],
-                                 round(math.sqrt(pow(start[0] - end[0], 2) + pow(start[1] - end[1], 2))))
-            for x, y in pixels:
-                if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                    self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-            pixels_with_alpha = []
-            for x, y in pixels:
-                pixels_with_alpha.append([x, y, 255])
-            self.objects.append(pixels_with_alpha)
+            self.add_object([start, end])
             self.last_line = None
 
 
         elif self.algorithm == "ellipse":
-            pixels = draw_ellipse(start, end)
-            for x, y in pixels:
-                if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                    self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-            pixels_with_alpha = []
-            for x, y in pixels:
-                pixels_with_alpha.append([x, y, 255])
-            self.objects.append(pixels_with_alpha)
+            self.add_object([start, end])
             self.last_line = None
 
 
         elif self.algorithm == "parabola":
-            pixels = draw_parabola(start, end)
-            for x, y in pixels:
-                if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                    self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-            pixels_with_alpha = []
-            for x, y in pixels:
-                pixels_with_alpha.append([x, y, 255])
-            self.objects.append(pixels_with_alpha)
+            self.add_object([start, end])
             self.last_line = None
 
 
@@ -313,14 +286,7 @@ class Canvas(QWidget):
                 self.show_alert("Start y and end y cannot be the same")
                 return
             else:
-                pixels = draw_hyperbola(start, end)
-                for x, y in pixels:
-                    if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                        self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-                pixels_with_alpha = []
-                for x, y in pixels:
-                    pixels_with_alpha.append([x, y, 255])
-                self.objects.append(pixels_with_alpha)
+                self.add_object([start, end])
             self.last_line = None
 
         elif self.algorithm == "hermite":
@@ -329,14 +295,7 @@ class Canvas(QWidget):
                 r1 = self.last_line[1]
                 p4 = start
                 r4 = end
-                pixels = draw_hermite_curve(p1, p4, r1, r4)
-                for x, y in pixels:
-                    if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                        self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-                pixels_with_alpha = []
-                for x, y in pixels:
-                    pixels_with_alpha.append([x, y, 255])
-                self.objects.append(pixels_with_alpha)
+                self.add_object([p1, p4, r1, r4])
                 self.last_vector = self.last_line
                 if self.multi_curve:
                     dx = start[0] - end[0]
@@ -353,14 +312,7 @@ class Canvas(QWidget):
                 p1 = self.last_line[1]
                 p2 = start
                 p3 = end
-                pixels = draw_bezier_curve(p0, p1, p2, p3)
-                for x, y in pixels:
-                    if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                        self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-                pixels_with_alpha = []
-                for x, y in pixels:
-                    pixels_with_alpha.append([x, y, 255])
-                self.objects.append(pixels_with_alpha)
+                self.add_object([p0, p1, p2, p3])
                 self.last_vector = self.last_line
                 if self.multi_curve:
                     dx = end[0] - start[0]
@@ -372,7 +324,6 @@ class Canvas(QWidget):
             else:
                 self.last_line = (start, end)
         elif self.algorithm == "b-spline":
-            print(self.last_line, self.last_point)
             if self.last_line:
                 p0 = self.last_line[0]
                 p1 = self.last_line[1]
@@ -381,18 +332,9 @@ class Canvas(QWidget):
                 if self.last_point is not None:
                     p2 = self.last_point
                     p3 = start
-                pixels = draw_b_spline(p0, p1, p2, p3)
-                for x, y in pixels:
-                    if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                        self.canvas_pixels[y, x] = [0, 0, 0, 255]  # Черный цвет
-                pixels_with_alpha = []
-                for x, y in pixels:
-                    pixels_with_alpha.append([x, y, 255])
-                self.objects.append(pixels_with_alpha)
+                self.add_object([p0, p1, p2, p3])
                 self.last_vector = self.last_line
                 if self.multi_curve:
-                    print("-----")
-                    print(p0, p1, p2, p3)
                     self.last_line = (p1, p2)
                     self.last_point = p3
                     self.preview_lines.append(self.last_line)
@@ -402,50 +344,166 @@ class Canvas(QWidget):
             else:
                 self.last_line = (start, end)
 
-        self.image = QImage(self.canvas_pixels, self.image_width, self.image_height, QImage.Format.Format_RGBA8888)
-        self.update()
+        self.update_image()
 
     def set_algorithm(self, algo_name):
         """Меняет алгоритм рисования"""
         if algo_name.lower() in {"wu", "bresenham", "dda", "circle", "ellipse", "parabola", "hyperbola", "hermite",
                                  "bezier", "b-spline"}:
             self.algorithm = algo_name.lower()
-            print(f"Алгоритм изменен на: {self.algorithm}")
+            if self.status_bar is not None:
+                self.status_bar.showMessage(f"Алгоритм изменен на: {self.algorithm}")
             self.algorithm_changed.emit()
 
     def redraw(self):
-        self.canvas_pixels[:, :, :3] = 255  # Белый фон
-        self.canvas_pixels[:, :, 3] = 255  # Полная прозрачность
-        for object in self.objects:
-            self.draw_object_from_pixels(object)
-
-        self.image = QImage(self.canvas_pixels, self.image_width, self.image_height, QImage.Format.Format_RGBA8888)
-        self.update()
+        """Полная перерисовка холста из списка объектов."""
+        self.flush_pending()
+        with profiler.stage("canvas.redraw"):
+            self.framebuffer.rebuild(self.objects.all_pixels())
+        self.framebuffer.set_overlay(self.debug_pixels())
+        self.update_image()
+
+    def update_image(self):
+        """Перерисовывает на экране только измененную область холста."""
+        rect = self.framebuffer.take_dirty()
+        if rect is None:
+            return
+        self.presenter.invalidate(rect)
+        x0, y0, x1, y1 = rect
+        self.update(QRect(math.floor(x0 * self.zoom_factor) + self.offset.x() - 1,
+                          math.floor(y0 * self.zoom_factor) + self.offset.y() - 1,
+                          math.ceil((x1 - x0) * self.zoom_factor) + 2,
+                          math.ceil((y1 - y0) * self.zoom_factor) + 2))
+
+    def add_object(self, points, record=None, pixels=None):
+        """
+        Добавляет фигуру по исходным точкам выбранного алгоритма и накладывает её на базовый слой.
+
+        Без готовых пикселей фигура растеризуется в фоне (см. on_render_partial), и
+        обработчик события мыши возвращается сразу, независимо от размера фигуры.
+
+        :param record: Готовая запись фигуры (например, возвращаемой из дебага);
+        :param pixels: Уже растеризованные пиксели [x, y, alpha] этой фигуры.
+        """
+        if record is None:
+            record = create_record(self.algorithm, points)
+        if pixels is not None:
+            self.flush_pending()
+            self.commit_object(record, pixels)
+            return
+        parts = rasterize_bands(record, self.raster_clip, BAND_ROWS)
+        job_id = self.renderer.submit(profiler.iterate("canvas.rasterize", parts, "pixels",
+                                                       algorithm=record.params["algorithm"]))
+        self.pending[job_id] = [record, None]
+
+    @property
+    def raster_clip(self):
+        """
+        Область растеризации фигур: холст с запасом в пиксель.
+
+        При увеличении фигура у края может попасть на холст (см. Scene.render).
+        """
+        return -1, -1, self.image_width + 1, self.image_height + 1
+
+    def commit_object(self, record, pixels=None):
+        """Добавляет фигуру в сцену и накладывает её на базовый слой синхронно."""
+        with profiler.stage("canvas.rasterize", algorithm=record.params["algorithm"]):
+            index = self.objects.append(record, pixels)
+            pixels = self.objects.pixels(index)
+        profiler.count("pixels", len(pixels))
+        with profiler.stage("canvas.composite"):
+            self.framebuffer.commit(pixels)
+
+    def on_render_partial(self, job_id, pixels):
+        """Накладывает готовую полосу фигуры (задачи завершаются по порядку, поэтому полосы есть только у первой)."""
+        with profiler.stage("canvas.composite"):
+            self.framebuffer.commit(pixels)
+        self.pending[job_id][1] = union_rect(self.pending[job_id][1], bounding_rect(pixels))
+        self.update_image()
+
+    def on_render_finished(self, job_id, parts):
+        """Фигура растеризована целиком: её полосы уже на холсте, остаётся добавить её в сцену."""
+        record, _ = self.pending.pop(job_id)
+        self.objects.append(record, np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.int32))
+
+    def on_render_failed(self, job_id, message):
+        self.revert_pending(job_id)
+        self.show_alert(f"Rasterization failed: {message}")
+
+    def cancel_render(self, job_id):
+        """Отменяет растеризацию фигуры и убирает с холста её уже наложенные полосы."""
+        self.renderer.cancel(job_id)
+        self.revert_pending(job_id)
+
+    def revert_pending(self, job_id):
+        _, rect = self.pending.pop(job_id)
+        if rect is not None:
+            self.framebuffer.rebuild_region(rect, self.objects.pixels_in_rect(rect))
+            self.update_image()
+
+    def flush_pending(self):
+        """Дорисовывает фигуры из очереди фоновой растеризации синхронно, в порядке рисования."""
+        if not self.pending:
+            return
+        records = [record for record, _ in self.pending.values()]
+        for job_id in list(self.pending):
+            self.cancel_render(job_id)
+        for record in records:
+            self.commit_object(record)
+
+    def drop_pending(self):
+        """Отменяет фоновую растеризацию без восстановления холста (он очищается или заменяется)."""
+        self.renderer.cancel_all()
+        self.pending.clear()
+
+    def add_spline_chain(self, control, kind="bezier"):
+        """
+        Добавляет цепочку сплайнов по всему контрольному многоугольнику сразу.
+
+        :param control: Контрольные точки [(x, y), ...] или массив (N, 2);
+        :param kind: "bezier" (3k + 1 точек), "b-spline" или "catmull-rom".
+        """
+        algorithm = f"{kind}-chain"
+        if kind not in CHAINS or algorithm not in RASTERIZERS:
+            self.show_alert(f"Unknown spline chain kind: {kind}")
+            return
+        stride = CHAINS[kind][1]
+        if len(control) < 4 or (len(control) - 1) % stride:
+            self.show_alert(f"A {kind} chain needs at least 4 points" + (" and 3k + 1 points" if stride > 1 else ""))
+            return
+        self.add_object(None, create_record(algorithm, [tuple(point) for point in control]))
+        self.update_image()
 
     def draw_object_from_pixels(self, object: List):
-        for x, y, alpha in object:
-            if 0 <= x < self.image_width and 0 <= y < self.image_height:
-                existing_color = self.canvas_pixels[y, x]
-
-                # Альфа-композиция
-                new_alpha = alpha / 255.0
-                inv_alpha = 1.0 - new_alpha
-
-                r = int(existing_color[0] * inv_alpha)
-                g = int(existing_color[1] * inv_alpha)
-                b = int(existing_color[2] * inv_alpha)
-
-                self.canvas_pixels[y, x] = [
-                    np.uint8(r),
-                    np.uint8(g),
-                    np.uint8(b),
-                    np.uint8(255 * new_alpha + existing_color[3] * inv_alpha)
-                ]
+        """Альфа-композиция пикселей объекта [x, y, alpha] на холст."""
+        self.framebuffer.surface.composite(object)
+
+    def debug_pixels(self):
+        """Показанная в дебаге часть удаленного объекта."""
+        if not len(self.objects.removed) or not self.debug_position:
+            return None
+        return self.objects.removed.pixels(-1, stop=self.debug_position)
+
+    def pop_object(self, keep=False):
+        """
+        Удаляет последний объект и пересобирает только его область.
+
+        :param keep: Сохранить объект с пикселями в objects.removed (для дебага).
+        """
+        self.flush_pending()
+        rect = self.objects.bounding_rect(len(self.objects) - 1)
+        if keep:
+            self.objects.take_last(self.raster_clip)
+        else:
+            self.objects.remove_last(self.raster_clip)
+        if rect is not None:
+            self.framebuffer.rebuild_region(rect, self.objects.pixels_in_rect(rect))
 
     def enter_debug_mode(self):
         """Удаление последней линии при входе в дебаг."""
         self.in_debug = True
-        if self.objects:
+        self.flush_pending()
+        if len(self.objects):
             self.remove_last_object()
 
     def exit_debug_mode(self):
@@ -454,46 +512,37 @@ class Canvas(QWidget):
         self.restore_last_object()
 
     def remove_last_object(self):
-        """Удаляет последнюю линию и добавляет в стек дебага."""
-        if self.objects:
-            last_object = self.objects.pop()
-            self.redo_stack = last_object
-            self.redraw()
-            self.object_debugging = False
+        """Удаляет последнюю линию и переносит её в дебаг."""
+        if len(self.objects):
+            self.pop_object(keep=True)
+            self.debug_position = 0
+            self.update_image()
 
     def restore_last_object(self):
-        """Возвращает линию из стека дебага."""
-        if self.object_debugging:
-            self.objects.pop()
-        restored_object = self.debug_stack + self.redo_stack
-        self.debug_stack = []
-        self.redo_stack = []
-        self.objects.append(restored_object)
-        self.redraw()
+        """Возвращает отлаживаемую линию на холст."""
+        if len(self.objects.removed):
+            pixels, record = self.objects.pop_removed()
+            self.debug_position = 0
+            self.framebuffer.set_overlay(None)
+            self.add_object(None, record, pixels)
+            self.update_image()
 
     def debug_prev(self):
-        """Шаг назад (удаление линии)."""
-        if self.debug_stack:
-            if self.object_debugging:
-                self.objects.pop()
-            self.redo_stack.insert(0, self.debug_stack.pop())
-            restored_object = self.debug_stack
-            self.objects.append(restored_object)
-            self.redraw()
-            self.object_debugging = True
+        """Шаг назад (удаление пикселя)."""
+        if self.debug_position > 0:
+            self.debug_position -= 1
+            self.framebuffer.set_overlay(self.debug_pixels())
+            self.update_image()
         else:
             self.show_alert("Nothing to undo.")
 
     def debug_next(self):
-        """Шаг вперед (возврат линии)."""
-        if self.redo_stack:
-            if self.object_debugging:
-                self.objects.pop()
-            self.debug_stack.append(self.redo_stack.pop(0))
-            restored_object = self.debug_stack
-            self.objects.append(restored_object)
-            self.redraw()
-            self.object_debugging = True
+        """Шаг вперед (возврат пикселя)."""
+        removed = self.objects.removed
+        if len(removed) and self.debug_position < removed.object_size(len(removed) - 1):
+            self.debug_position += 1
+            self.framebuffer.set_overlay(self.debug_pixels())
+            self.update_image()
         else:
             self.show_alert("Nothing to redo.")
 
@@ -505,19 +554,86 @@ class Canvas(QWidget):
         msg.setIcon(QMessageBox.Icon.Information)
         msg.exec()
 
+    def save_project(self, path):
+        """Сохраняет зафиксированные объекты, растр и состояние построения кривых в файл проекта."""
+        state = {
+            "algorithm": self.algorithm,
+            "multi_curve": self.multi_curve,
+            "last_line": self.last_line,
+            "last_vector": self.last_vector,
+            "last_point": self.last_point,
+            "preview_lines": self.preview_lines,
+        }
+        self.flush_pending()
+        mapped = self.framebuffer.maps(path)
+        if mapped:
+            # Открытый проект отображён в память, а такой файл нельзя заменить в Windows:
+            # слои переносятся в память на время сохранения и затем отображаются из нового файла
+            self.framebuffer.release()
+            self.attach_framebuffer()
+        project = save_project(path, self.objects, self.framebuffer, state)
+        if mapped:
+            self.framebuffer.reopen(project.raster, project.tile_map)
+            self.attach_framebuffer()
+
+    def load_project(self, path):
+        """Открывает файл проекта; растр и пиксели объектов читаются с диска по мере обращения."""
+        project = load_project(path)
+        self.drop_pending()
+        self.image_width = project.width
+        self.image_height = project.height
+        self.objects = project.scene
+        self.presenter.scene = self.objects
+        self.framebuffer.close()
+        self.framebuffer = Framebuffer(project.width, project.height, max_resident_tiles=MAX_RESIDENT_TILES,
+                                       open_raster=project.raster, tile_map=project.tile_map)
+        self.attach_framebuffer()
+
+        self.debug_position = 0
+        self.drawing_line = False
+        self.start_point = None
+        self.end_point = None
+        self.last_line = project.state.get("last_line")
+        self.last_vector = project.state.get("last_vector")
+        self.last_point = project.state.get("last_point")
+        self.preview_lines = list(project.state.get("preview_lines", []))
+        self.multi_curve = project.state.get("multi_curve", False)
+        self.set_algorithm(project.state.get("algorithm", self.algorithm))
+
+        self.clamp_offset()
+        self.updateGeometry()
+        self.update_image()
+
+    def attach_framebuffer(self):
+        """Подключает к отображению текущие массивы кадрового буфера (после замены или переотображения слоёв)."""
+        self.canvas_pixels = self.framebuffer.pixels
+        self.presenter.set_buffer(self.framebuffer)
+        self.image = self.presenter.image
+
+    def set_native_zoom(self, enabled):
+        """Включает отображение фигур в собственном разрешении масштаба вместо увеличенных пикселей."""
+        self.presenter.native = enabled
+        self.presenter.invalidate()
+        self.update()
+
     def clear_canvas(self):
-        self.objects = []
+        self.drop_pending()
+        self.objects.clear()
         self.last_line = None
         self.last_vector = None
         self.last_point = None
         self.preview_lines = []
-        self.redraw()
+        self.framebuffer.clear()
+        self.update_image()
 
     def remove_last(self):
-        if self.objects:
-            self.objects.pop()
+        if self.pending:
+            # Последняя фигура ещё растеризуется: достаточно отменить её задачу
+            self.cancel_render(next(reversed(self.pending)))
+        elif len(self.objects):
+            self.pop_object()
         self.last_line = None
         self.last_vector = None
         self.last_point = None
         self.preview_lines = []
-        self.redraw()
\ No newline at end of file
+        self.update_image()
@@ -1,9 +1,13 @@
 from PyQt6.QtCore import QSize, Qt
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtWidgets import QMainWindow, QApplication, QLineEdit, QPushButton, QWidget, QHBoxLayout, QVBoxLayout, \
-    QToolBar, QGridLayout, QMenuBar, QMenu, QStatusBar, QScrollArea, QMessageBox, QCheckBox
+    QToolBar, QGridLayout, QMenuBar, QMenu, QStatusBar, QScrollArea, QMessageBox, QCheckBox, QFileDialog
 
+from src.profiling import profiler
 from src.view.canvas_widget import Canvas
+from src.view.profiler_overlay import TRACE_FILTER, ProfilerOverlay
+
+PROJECT_FILTER = "Graphic project (*.giis)"
 
 
 class MainWindow(QMainWindow):
@@ -23,6 +27,7 @@ class MainWindow(QMainWindow):
         # Статусная строка
         self.status = QStatusBar()
         self.setStatusBar(self.status)
+        self.profiler_overlay = ProfilerOverlay(self.status)
 
         self.workspace = QWidget()
         self.canvas_size = QSize(100, 100)  # Размер холста
@@ -43,10 +48,34 @@ class MainWindow(QMainWindow):
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("File")
 
+        open_action = QAction("Open project...", self)
+        open_action.triggered.connect(self.open_project)
+        file_menu.addAction(open_action)
+
+        save_action = QAction("Save project...", self)
+        save_action.triggered.connect(self.save_project)
+        file_menu.addAction(save_action)
+
+        trace_action = QAction("Export profiling trace...", self)
+        trace_action.triggered.connect(self.export_trace)
+        file_menu.addAction(trace_action)
+
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        view_menu = menu_bar.addMenu("View")
+
+        native_zoom_action = QAction("Native resolution zoom", self)
+        native_zoom_action.setCheckable(True)
+        native_zoom_action.toggled.connect(lambda checked: self.canvas.set_native_zoom(checked))
+        view_menu.addAction(native_zoom_action)
+
+        profiling_action = QAction("Profiling overlay", self)
+        profiling_action.setCheckable(True)
+        profiling_action.toggled.connect(lambda checked: self.profiler_overlay.set_enabled(checked))
+        view_menu.addAction(profiling_action)
+
         tool_menu = menu_bar.addMenu("Tools")
         lines_submenu = tool_menu.addMenu("Lines")
 
@@ -228,6 +257,38 @@ class MainWindow(QMainWindow):
             # self.canvas.objects.append(last_painted)
             # self.canvas.redraw()
 
+    def open_project(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open project", "", PROJECT_FILTER)
+        if path:
+            try:
+                self.canvas.load_project(path)
+            except (OSError, ValueError) as error:
+                QMessageBox.warning(self, "Open project", str(error))
+                return
+            self.snap_button.setChecked(self.canvas.multi_curve)
+            self.snap_curves_mode()
+            self.status.showMessage(f"Открыт проект {path}", 3000)
+
+    def save_project(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save project", "", PROJECT_FILTER)
+        if path:
+            try:
+                self.canvas.save_project(path)
+            except OSError as error:
+                QMessageBox.warning(self, "Save project", str(error))
+                return
+            self.status.showMessage(f"Проект сохранен в {path}", 3000)
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export profiling trace", "", TRACE_FILTER)
+        if path:
+            try:
+                profiler.export_chrome_trace(path)
+            except OSError as error:
+                QMessageBox.warning(self, "Export profiling trace", str(error))
+                return
+            self.status.showMessage(f"Трасса сохранена в {path}", 3000)
+
     def snap_curves_mode(self):
         if self.canvas.algorithm in ["hermite", "bezier", "b-spline"]:
             self.snap_button.setEnabled(True)
@@ -0,0 +1,114 @@
+import math
+
+import numpy as np
+
+from PyQt6.QtCore import Qt, QRect, QRectF
+from PyQt6.QtGui import QImage, QPainter
+
+
+def zoom_level(zoom):
+    """Целый уровень масштаба, в разрешении которого растеризуются фигуры."""
+    return max(1, round(zoom))
+
+
+class ViewportPresenter:
+    """
+    Отображение кадрового буфера холста на экране.
+
+    Для плотного буфера QImage ссылается на память NumPy-массива без копирования,
+    поэтому изменения буфера сразу видны; у плиточного буфера читается только
+    видимая область. Масштабируется только видимая часть холста (с запасом
+    для перетаскивания), результат кэшируется до смены масштаба, выхода за
+    пределы запаса или изменения пикселей в закэшированной области.
+
+    Если включён native и задана сцена, при увеличении фигуры заново растеризуются
+    в разрешении уровня масштаба (см. zoom_level) вместо увеличения пикселей холста.
+    """
+
+    def __init__(self, framebuffer, margin=0.25):
+        self.margin = margin  # Запас вокруг видимой области в долях её размера
+        self.framebuffer = None
+        self.image = None  # QImage над плотным буфером (None для плиточного)
+        self.cache = None  # Масштабированная область
+        self.cache_zoom = None
+        self.cache_rect = None  # Закэшированная область в координатах холста (x0, y0, x1, y1)
+        self.cache_source = None  # Массив, над которым построен QImage области (должен жить, пока жив кэш)
+        self.scene = None  # Сцена для отображения в собственном разрешении масштаба
+        self.native = False
+        self.set_buffer(framebuffer)
+
+    def set_buffer(self, framebuffer):
+        """Подключает кадровый буфер; плотный буфер оборачивается в QImage без копирования."""
+        self.framebuffer = framebuffer
+        pixels = framebuffer.pixels
+        if pixels is not None:
+            self.image = QImage(pixels.data, framebuffer.width, framebuffer.height, pixels.strides[0],
+                                QImage.Format.Format_RGBA8888)
+        else:
+            self.image = None
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """Сбрасывает кэш, если изменённая область холста в него попадает (None -- весь холст)."""
+        if self.cache_rect is None:
+            return
+        if rect is None or self._intersects(rect, self.cache_rect):
+            self.cache = None
+            self.cache_rect = None
+
+    def visible_rect(self, offset, zoom, viewport: QRect):
+        """Видимая область холста (x0, y0, x1, y1) для прямоугольника экрана."""
+        x0 = max(math.floor((viewport.left() - offset.x()) / zoom), 0)
+        y0 = max(math.floor((viewport.top() - offset.y()) / zoom), 0)
+        x1 = min(math.ceil((viewport.right() + 1 - offset.x()) / zoom), self.framebuffer.width)
+        y1 = min(math.ceil((viewport.bottom() + 1 - offset.y()) / zoom), self.framebuffer.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def draw(self, painter: QPainter, offset, zoom, viewport: QRect):
+        """Выводит видимую часть холста, при необходимости масштабируя её заново."""
+        visible = self.visible_rect(offset, zoom, viewport)
+        if visible is None:
+            return
+
+        if self.cache is None or self.cache_zoom != zoom or not self._contains(self.cache_rect, visible):
+            self._rebuild(visible, zoom)
+
+        x0, y0, x1, y1 = self.cache_rect
+        target = QRectF(offset.x() + x0 * zoom, offset.y() + y0 * zoom, (x1 - x0) * zoom, (y1 - y0) * zoom)
+        painter.drawImage(target, self.cache)
+
+    def _rebuild(self, visible, zoom):
+        """Масштабирует видимую область с запасом по краям."""
+        x0, y0, x1, y1 = visible
+        pad_x = math.ceil((x1 - x0) * self.margin)
+        pad_y = math.ceil((y1 - y0) * self.margin)
+        x0, y0 = max(x0 - pad_x, 0), max(y0 - pad_y, 0)
+        x1, y1 = min(x1 + pad_x, self.framebuffer.width), min(y1 + pad_y, self.framebuffer.height)
+
+        level = zoom_level(zoom)
+        if self.native and self.scene is not None and level > 1 and self.framebuffer.overlay is None:
+            pixels = self.scene.render((x0, y0, x1, y1), level)
+            region = QImage(pixels.data, (x1 - x0) * level, (y1 - y0) * level, pixels.strides[0],
+                            QImage.Format.Format_RGBA8888)
+            self.cache_source = pixels
+        elif self.image is not None:
+            region = self.image.copy(QRect(x0, y0, x1 - x0, y1 - y0))
+            self.cache_source = None
+        else:
+            pixels = np.ascontiguousarray(self.framebuffer.read((x0, y0, x1, y1)))
+            region = QImage(pixels.data, x1 - x0, y1 - y0, pixels.strides[0], QImage.Format.Format_RGBA8888)
+            self.cache_source = pixels
+        self.cache = region.scaled(max(round((x1 - x0) * zoom), 1), max(round((y1 - y0) * zoom), 1),
+                                   Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        self.cache_zoom = zoom
+        self.cache_rect = (x0, y0, x1, y1)
+
+    @staticmethod
+    def _contains(outer, inner):
+        return outer[0] <= inner[0] and outer[1] <= inner[1] and inner[2] <= outer[2] and inner[3] <= outer[3]
+
+    @staticmethod
+    def _intersects(first, second):
+        return first[0] < second[2] and second[0] < first[2] and first[1] < second[3] and second[1] < first[3]
@@ -0,0 +1,38 @@
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel
+
+from src.profiling import profiler as shared_profiler
+
+# Фильтр диалога сохранения трассы
+TRACE_FILTER = "Chrome trace (*.json)"
+
+
+class ProfilerOverlay(QLabel):
+    """Сводка профилировщика в строке состояния, обновляемая по таймеру."""
+
+    def __init__(self, status_bar, profiler=None, interval=500):
+        """
+        :param status_bar: Строка состояния, в которую добавляется сводка;
+        :param profiler: Профилировщик (по умолчанию общий src.profiling.profiler);
+        :param interval: Период обновления в миллисекундах.
+        """
+        super().__init__()
+        self.profiler = shared_profiler if profiler is None else profiler
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.refresh)
+        status_bar.addPermanentWidget(self)
+        self.set_enabled(self.profiler.enabled)
+
+    def set_enabled(self, enabled):
+        """Включает сбор статистики вместе с её показом."""
+        self.profiler.enabled = enabled
+        self.setVisible(enabled)
+        if enabled:
+            self.refresh()
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def refresh(self):
+        self.setText(self.profiler.summary())
@@ -0,0 +1,132 @@
+"""
+Фоновая растеризация в пуле потоков Qt.
+
+Задача -- итератор частей результата (например, полос пикселей фигуры). Он
+выполняется в потоке пула, и каждая часть передаётся в поток интерфейса сигналом
+partial сразу после вычисления, поэтому цикл событий не блокируется даже на
+больших фигурах. Отменённая задача останавливается перед следующей частью,
+а её уже отправленные, но ещё не доставленные сигналы отбрасываются.
+"""
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class RenderJob(QRunnable):
+    """Задача пула: вычисляет части результата и отправляет их сигналами планировщика."""
+
+    def __init__(self, job_id, parts, renderer):
+        super().__init__()
+        # Объект задачи удаляет планировщик, а не пул (ссылка на него хранится до завершения)
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.parts = parts
+        self.renderer = renderer
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            self.compute()
+        finally:
+            self.renderer.job_done.emit(self.job_id)
+
+    def compute(self):
+        parts = []
+        try:
+            for part in self.parts:
+                if self.cancelled.is_set():
+                    return
+                parts.append(part)
+                self.renderer.job_partial.emit(self.job_id, part)
+        except Exception as error:
+            self.renderer.job_failed.emit(self.job_id, repr(error))
+            return
+        if not self.cancelled.is_set():
+            self.renderer.job_finished.emit(self.job_id, parts)
+
+
+class BackgroundRenderer(QObject):
+    """
+    Планировщик фоновых задач растеризации.
+
+    Сигналы partial(job_id, part), finished(job_id, parts) и failed(job_id, message)
+    приходят в потоке интерфейса и только для задач, которые не были отменены.
+    При одном потоке (по умолчанию) задачи выполняются и завершаются строго в порядке
+    отправки, поэтому получатель может накладывать результаты на холст по мере прихода.
+    """
+    partial = pyqtSignal(int, object)
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+    # Сигналы из потоков пула; доставляются в поток интерфейса через очередь событий
+    job_partial = pyqtSignal(int, object)
+    job_finished = pyqtSignal(int, object)
+    job_failed = pyqtSignal(int, str)
+    job_done = pyqtSignal(int)
+
+    def __init__(self, parent=None, threads=1):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(threads)
+        self.jobs = {}  # Номер задачи -> RenderJob, для задач в очереди и выполняющихся
+        # Задачи, переданные пулу: ссылка на объект держится, пока поток не выйдет из run,
+        # иначе отменённая выполняющаяся задача была бы удалена прямо во время работы
+        self.started = {}
+        self.next_id = 0
+        self.job_partial.connect(self._on_partial)
+        self.job_finished.connect(self._on_finished)
+        self.job_failed.connect(self._on_failed)
+        self.job_done.connect(self._on_done)
+
+    def submit(self, parts):
+        """
+        Ставит задачу в очередь пула.
+
+        :param parts: Итератор частей результата; вычисляется в потоке пула, поэтому
+                      должен зависеть только от переданных ему копий данных;
+        :return: Номер задачи.
+        """
+        self.next_id += 1
+        job = RenderJob(self.next_id, parts, self)
+        self.jobs[job.job_id] = job
+        self.started[job.job_id] = job
+        self.pool.start(job)
+        return job.job_id
+
+    def cancel(self, job_id):
+        """Отменяет задачу: ещё не начатая убирается из очереди, выполняющаяся останавливается."""
+        job = self.jobs.pop(job_id, None)
+        if job is not None:
+            job.cancel()
+            if self.pool.tryTake(job):
+                # Задача ещё не начиналась и уже не начнётся
+                self.started.pop(job_id)
+
+    def cancel_all(self):
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+
+    def is_pending(self, job_id):
+        return job_id in self.jobs
+
+    def wait(self, msecs=-1):
+        """Ожидает завершения задач пула (сигналы при этом остаются в очереди событий)."""
+        return self.pool.waitForDone(msecs)
+
+    def _on_partial(self, job_id, part):
+        if job_id in self.jobs:
+            self.partial.emit(job_id, part)
+
+    def _on_finished(self, job_id, parts):
+        if self.jobs.pop(job_id, None) is not None:
+            self.finished.emit(job_id, parts)
+
+    def _on_failed(self, job_id, message):
+        if self.jobs.pop(job_id, None) is not None:
+            self.failed.emit(job_id, message)
+
+    def _on_done(self, job_id):
+        self.started.pop(job_id, None)
@@ -0,0 +1,222 @@
+import itertools
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from src.drawing_algorithms.conic_sections.circle import circle_arc, circle_arc_length, circle_point, draw_circle
+from src.drawing_algorithms.conic_sections.ellipse import draw_ellipse, ellipse_arc, ellipse_geometry
+from src.drawing_algorithms.conic_sections.parabola import draw_parabola, parabola_geometry
+from src.drawing_algorithms.conic_sections.symmetry import OCTANTS, QUADRANTS, reflect, reflect_array
+
+
+def baseline_circle(x0, y0, radius):
+    """Исходная реализация: восемь отражений каждой точки с проверкой повторов по списку."""
+    x = 0
+    y = radius
+    d = 3 - 2 * radius
+    points = []
+
+    def plot_circle_points(cx, cy, x, y):
+        for dx, dy in [(x, y), (y, x), (-x, y), (-y, x),
+                       (-x, -y), (-y, -x), (x, -y), (y, -x)]:
+            if (cx + dx, cy + dy) not in points:
+                points.append((cx + dx, cy + dy))
+
+    plot_circle_points(x0, y0, x, y)
+    while x <= y:
+        if d <= 0:
+            d += 4 * x + 6
+        else:
+            d += 4 * (x - y) + 10
+            y -= 1
+        x += 1
+
+        plot_circle_points(x0, y0, x, y)
+
+    return points
+
+
+def baseline_ellipse(start, end):
+    """Исходная реализация: четыре отражения каждой точки с проверкой повторов по списку."""
+    x0, y0 = start
+    x1, y1 = end
+    xc = (x0 + x1) // 2
+    yc = (y0 + y1) // 2
+    a = abs(x1 - x0) // 2
+    b = abs(y1 - y0) // 2
+
+    x = 0
+    y = b
+    a2 = a * a
+    b2 = b * b
+    fx = 0
+    fy = 2 * a2 * y
+    p = b2 - a2 * b + 0.25 * a2
+    points = []
+
+    def plot_points(cx, cy, x, y):
+        for dx, dy in [(x, y), (-x, y), (-x, -y), (x, -y)]:
+            if (cx + dx, cy + dy) not in points:
+                points.append((cx + dx, cy + dy))
+
+    while fx < fy:
+        plot_points(xc, yc, x, y)
+        x += 1
+        fx += 2 * b2
+        if p < 0:
+            p += b2 * (2 * x + 1)
+        else:
+            y -= 1
+            fy -= 2 * a2
+            p += b2 * (2 * x + 1) - a2 * (2 * y)
+
+    p = b2 * (x + 0.5) ** 2 + a2 * (y - 1) ** 2 - a2 * b2
+    while y >= 0:
+        plot_points(xc, yc, x, y)
+        y -= 1
+        fy -= 2 * a2
+        if p > 0:
+            p -= a2 * (2 * y + 1)
+        else:
+            x += 1
+            fx += 2 * b2
+            p += fx - a2 * (2 * y + 1)
+
+    return points
+
+
+def inside(points, clip):
+    x0, y0, x1, y1 = clip
+    return [(x, y) for x, y in points if x0 <= x < x1 and y0 <= y < y1]
+
+
+RADII = list(range(0, 60)) + [99, 100, 101, 255, 256, 1000]
+SEMI_AXES = [0, 1, 2, 3, 5, 8, 13, 40, 97]
+CLIPS = [(-1000, -1000, 1000, 1000), (0, 0, 40, 30), (25, -10, 26, 200), (-200, -3, 200, 4), (500, 500, 600, 600)]
+
+
+@pytest.mark.parametrize("radius", RADII)
+def test_circle_matches_the_baseline(radius):
+    expected = baseline_circle(7, -3, radius)
+    assert draw_circle(7, -3, radius) == expected
+    assert draw_circle(7, -3, radius, as_array=True).tolist() == [list(point) for point in expected]
+    assert sorted(draw_circle(7, -3, radius, ordered=True)) == sorted(expected)
+    for clip in CLIPS:
+        assert draw_circle(7, -3, radius, clip=clip) == inside(expected, clip), clip
+        assert sorted(draw_circle(7, -3, radius, ordered=True, clip=clip)) == sorted(inside(expected, clip)), clip
+
+
+@pytest.mark.parametrize("radius", [r for r in RADII if r > 0])
+def test_circle_point_reproduces_the_arc(radius):
+    arc = circle_arc(radius)
+    assert circle_arc_length(radius) == len(arc)
+    assert [circle_point(radius, i) for i in range(len(arc))] == arc
+
+
+@pytest.mark.parametrize("a, b", list(itertools.product(SEMI_AXES, SEMI_AXES)))
+def test_ellipse_matches_the_baseline(a, b):
+    start, end = (-4, 9), (-4 + 2 * a, 9 + 2 * b)
+    expected = baseline_ellipse(start, end)
+    assert draw_ellipse(start, end) == expected
+    assert draw_ellipse(start, end, as_array=True).tolist() == [list(point) for point in expected]
+    assert sorted(draw_ellipse(start, end, ordered=True)) == sorted(expected)
+    for clip in CLIPS:
+        assert draw_ellipse(start, end, clip=clip) == inside(expected, clip), clip
+        assert sorted(draw_ellipse(start, end, ordered=True, clip=clip)) == sorted(inside(expected, clip)), clip
+
+    count, point = ellipse_geometry(a, b)
+    assert [point(i) for i in range(count)] == ellipse_arc(a, b)
+
+
+@pytest.mark.parametrize("clip", [None] + CLIPS)
+def test_degenerate_conics_match_the_baseline(clip):
+    def expected(points):
+        return points if clip is None else inside(points, clip)
+
+    # Окружность нулевого радиуса: исходный цикл делает ещё один шаг, к (1, -1) и её отражениям
+    assert draw_circle(5, 6, 0, clip=clip) == expected([(5, 6), (6, 5), (4, 7), (4, 5), (6, 7)])
+    assert draw_circle(5, 6, 0, clip=clip) == expected(baseline_circle(5, 6, 0))
+    assert sorted(draw_circle(5, 6, 0, ordered=True, clip=clip)) == sorted(expected(baseline_circle(5, 6, 0)))
+    # Нулевая горизонтальная полуось -- вертикальный отрезок, нулевая вертикальная -- только центр
+    for start, end in [((0, -4), (1, 4)), ((-4, 0), (4, 1)), ((3, 3), (3, 3)), ((10, 0), (10, -7))]:
+        reference = expected(baseline_ellipse(start, end))
+        assert draw_ellipse(start, end, clip=clip) == reference
+        assert sorted(draw_ellipse(start, end, ordered=True, clip=clip)) == sorted(reference)
+    assert sorted(draw_ellipse((0, -4), (1, 4))) == [(0, y) for y in range(-4, 5)]
+    assert draw_ellipse((-4, 0), (4, 1)) == [(0, 0)]
+
+
+@pytest.mark.parametrize("symmetries", [OCTANTS, QUADRANTS], ids=["octants", "quadrants"])
+def test_reflection_does_not_duplicate_pixels(symmetries):
+    # Точки на осях и диагоналях совпадают со своими отражениями
+    arc = [(0, 5), (1, 5), (3, 3), (5, 0), (1, 5)]
+    points = reflect(arc, 2, -1, symmetries)
+    assert len(points) == len(set(points))
+    assert set(points) == {(2 + sx * (y if swap else x), -1 + sy * (x if swap else y))
+                           for x, y in arc for swap, sx, sy in symmetries}
+    assert reflect_array(arc, 2, -1, symmetries).tolist() == [list(point) for point in points]
+
+    for radius in (0, 1, 2, 7, 50):
+        for ordered in (False, True):
+            pixels = draw_circle(0, 0, radius, ordered=ordered)
+            assert len(pixels) == len(set(pixels))
+            pixels = np.array(draw_ellipse((0, 0), (2 * radius, radius), ordered=ordered)).reshape(-1, 2)
+            assert len(pixels) == len(np.unique(pixels, axis=0))
+
+
+def reference_parabola(start, end):
+    """
+    Парабола a * x^2 = b * y (a = |dy|, b = dx^2) по определению, без инкрементов.
+
+    Первая зона (наклон меньше 1, 2a * x < b): y = round(a / b * x^2) с округлением
+    половины вверх; вторая зона: x = round(sqrt(b / a * y)), то есть наименьший x
+    с a * (2x + 1)^2 > 4b * y.
+    """
+    (x0, y0), (x1, y1) = start, end
+    a, b = abs(y1 - y0), (x1 - x0) ** 2
+    direction = 1 if y1 > y0 else -1
+    border_x = max(x for x in range(abs(x1 - x0) + 1) if x == 0 or 2 * a * x < b)
+    branch = [(x, math.floor(Fraction(a * x * x, b) + Fraction(1, 2)) if b else 0) for x in range(border_x + 1)]
+    for y in range(branch[-1][1] + 1, a + 1):
+        branch.append((next(x for x in itertools.count() if a * (2 * x + 1) ** 2 > 4 * b * y), y))
+    points = []
+    for x, y in branch:
+        points.append((x0 + x, y0 + direction * y))
+        if x:
+            points.append((x0 - x, y0 + direction * y))
+    return points
+
+
+PARABOLAS = [((0, 0), (10, 3)), ((0, 0), (3, 10)), ((5, -2), (-7, 30)), ((0, 0), (1, 1)), ((4, 4), (4, 9)),
+             ((-3, 8), (40, 9)), ((0, 0), (60, 17)), ((10, 10), (13, 200)), ((0, 0), (7, 49)), ((2, 1), (22, 101))]
+
+
+@pytest.mark.parametrize("direction", [1, -1], ids=["down", "up"])
+@pytest.mark.parametrize("start, end", PARABOLAS)
+def test_parabola_follows_the_formula_and_hits_both_endpoints(start, end, direction):
+    end = (end[0], start[1] + direction * abs(end[1] - start[1]))
+    expected = reference_parabola(start, end)
+    pixels = draw_parabola(start, end)
+    assert pixels == expected
+    assert draw_parabola(start, end, as_array=True).tolist() == [list(point) for point in expected]
+    for clip in CLIPS:
+        assert draw_parabola(start, end, clip=clip) == inside(expected, clip), clip
+
+    # Вершина и обе конечные точки ветвей лежат на кривой, ветви идут в сторону end
+    assert start in pixels
+    assert end in pixels and (2 * start[0] - end[0], end[1]) in pixels
+    assert all(direction * (y - start[1]) >= 0 for _, y in pixels)
+    assert max(abs(x - start[0]) for x, _ in pixels) == abs(end[0] - start[0])
+
+    count, point = parabola_geometry(start, end)
+    assert [point(i) for i in range(count)] == [(x - start[0], direction * (y - start[1]))
+                                                for x, y in expected if x >= start[0]]
+
+
+def test_parabola_orientations_mirror_each_other():
+    for start, end in PARABOLAS:
+        down = draw_parabola(start, (end[0], start[1] + abs(end[1] - start[1])))
+        up = draw_parabola(start, (end[0], start[1] - abs(end[1] - start[1])))
+        assert up == [(x, 2 * start[1] - y) for x, y in down]
@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.drawing_algorithms.curves.b_spline import draw_b_spline
+from src.drawing_algorithms.curves.bezier import draw_bezier_curve
+from src.drawing_algorithms.curves.flatten import B_SPLINE, BEZIER, HERMITE
+from src.drawing_algorithms.curves.hermite import draw_hermite_curve
+
+
+def sampled(basis, control, num_points):
+    """Пиксели исходной реализации: round() от [t^3, t^2, t, 1] @ basis @ control для каждого t."""
+    pixels = []
+    for t in np.linspace(0, 1, num_points):
+        point = np.array([t ** 3, t ** 2, t, 1]) @ basis @ np.array(control)
+        pixels.append((int(round(point[0])), int(round(point[1]))))
+    return pixels
+
+
+def without_adjacent_repeats(pixels):
+    return [pixel for i, pixel in enumerate(pixels) if i == 0 or pixel != pixels[i - 1]]
+
+
+def without_repeats(pixels):
+    return list(dict.fromkeys(pixels))
+
+
+# Кривая -> (базисная матрица, удаление повторов в исходной реализации)
+CURVES = {
+    "bezier": (draw_bezier_curve, BEZIER, without_adjacent_repeats),
+    "hermite": (draw_hermite_curve, HERMITE, without_repeats),
+    "b-spline": (draw_b_spline, B_SPLINE, list),
+}
+
+
+@pytest.mark.parametrize("curve", sorted(CURVES))
+def test_explicit_num_points_keeps_the_original_output(curve):
+    draw, basis, repeats = CURVES[curve]
+    rng = random.Random(0)
+    for _ in range(200):
+        control = [(rng.randint(-100, 300), rng.randint(-100, 300)) for _ in range(4)]
+        num_points = rng.choice([1, 2, 7, 50, 100, 200, 300])
+        assert draw(*control, num_points) == repeats(sampled(basis, control, num_points)), (control, num_points)
+
+
+@pytest.mark.parametrize("curve", sorted(CURVES))
+def test_adaptive_curve_is_connected(curve):
+    draw = CURVES[curve][0]
+    rng = random.Random(1)
+    for _ in range(100):
+        pixels = np.array(draw(*[(rng.randint(-100, 300), rng.randint(-100, 300)) for _ in range(4)]))
+        assert (np.abs(np.diff(pixels, axis=0)).max(axis=1) == 1).all()
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from src.raster.compositing import composite_pixels, occurrence_rank
+from src.raster.framebuffer import Framebuffer, bounding_rect
+from src.raster.surface import BACKGROUND
+
+WIDTH, HEIGHT = 300, 200
+
+
+def baseline_composite(canvas_pixels, pixels):
+    """Исходное попиксельное наложение (Canvas.draw_object_from_pixels)."""
+    height, width = canvas_pixels.shape[:2]
+    for x, y, alpha in pixels:
+        if 0 <= x < width and 0 <= y < height:
+            existing_color = canvas_pixels[y, x]
+            new_alpha = alpha / 255.0
+            inv_alpha = 1.0 - new_alpha
+            r = int(existing_color[0] * inv_alpha)
+            g = int(existing_color[1] * inv_alpha)
+            b = int(existing_color[2] * inv_alpha)
+            canvas_pixels[y, x] = [np.uint8(r), np.uint8(g), np.uint8(b),
+                                   np.uint8(255 * new_alpha + existing_color[3] * inv_alpha)]
+
+
+def random_object(count, seed, spread=(WIDTH, HEIGHT)):
+    """Пиксели [x, y, alpha] с повторами и выходами за холст."""
+    rng = np.random.default_rng(seed)
+    pixels = np.column_stack([rng.integers(-10, spread[0] + 10, count), rng.integers(-10, spread[1] + 10, count),
+                              rng.integers(0, 256, count)])
+    # Часть пикселей повторяется (иногда несколько раз) с другой прозрачностью
+    repeats = pixels[rng.integers(0, count, count // 2)]
+    repeats[:, 2] = rng.integers(0, 256, len(repeats))
+    return np.concatenate([pixels, repeats])[rng.permutation(count + len(repeats))]
+
+
+def test_occurrence_rank_numbers_repeats_in_order():
+    assert occurrence_rank(np.array([5, 3, 5, 5, 3, 7])).tolist() == [0, 0, 1, 2, 1, 0]
+    assert occurrence_rank(np.array([], dtype=np.int64)).tolist() == []
+
+
+def test_duplicate_pixels_are_composited_in_order():
+    rng = np.random.default_rng(0)
+    canvas = rng.integers(0, 256, (40, 30, 4), dtype=np.uint8)
+    expected = canvas.copy()
+    pixels = random_object(3000, seed=1, spread=(30, 40))
+
+    composite_pixels(canvas, pixels)
+    baseline_composite(expected, pixels.tolist())
+    assert np.array_equal(canvas, expected)
+
+    # Порядок наложения важен: перестановка повторов меняет результат
+    pixel = [[3, 4, 200], [3, 4, 30], [3, 4, 128]]
+    first, second = np.full((8, 8, 4), BACKGROUND, np.uint8), np.full((8, 8, 4), BACKGROUND, np.uint8)
+    composite_pixels(first, pixel)
+    composite_pixels(second, pixel[::-1])
+    reference = np.full((8, 8, 4), BACKGROUND, np.uint8)
+    baseline_composite(reference, pixel)
+    assert np.array_equal(first, reference) and not np.array_equal(first, second)
+
+
+@pytest.mark.parametrize("tiled", [False, True], ids=["dense", "tiled"])
+def test_overlay_is_drawn_over_the_base_and_removed(tiled):
+    framebuffer = Framebuffer(WIDTH, HEIGHT, tiled=tiled)
+    objects = [random_object(500, seed) for seed in range(3)]
+    for pixels in objects:
+        framebuffer.commit(pixels)
+    base = framebuffer.base_surface.read((0, 0, WIDTH, HEIGHT)).copy()
+    assert np.array_equal(framebuffer.read((0, 0, WIDTH, HEIGHT)), base)
+
+    overlay = random_object(300, seed=10)
+    framebuffer.set_overlay(overlay)
+    expected = base.copy()
+    composite_pixels(expected, overlay)
+    assert np.array_equal(framebuffer.read((0, 0, WIDTH, HEIGHT)), expected)
+    # Отлаживаемый объект не попадает в базовый слой
+    assert np.array_equal(framebuffer.base_surface.read((0, 0, WIDTH, HEIGHT)), base)
+
+    framebuffer.set_overlay(None)
+    assert np.array_equal(framebuffer.read((0, 0, WIDTH, HEIGHT)), base)
+
+
+@pytest.mark.parametrize("tiled", [False, True], ids=["dense", "tiled"])
+def test_rebuild_region_restores_the_base_without_a_removed_object(tiled):
+    objects = [random_object(400, seed, spread=(120, 90)) + [60 * seed, 30 * seed, 0] for seed in range(4)]
+    framebuffer = Framebuffer(WIDTH, HEIGHT, tiled=tiled)
+    for pixels in objects:
+        framebuffer.commit(pixels)
+
+    # Удаление второго объекта: пересобирается только его прямоугольник из пересекающих его объектов
+    rect = bounding_rect(objects[1])
+    x0, y0, x1, y1 = rect
+    remaining = [pixels for index, pixels in enumerate(objects) if index != 1]
+    inside = [pixels[(x0 <= pixels[:, 0]) & (pixels[:, 0] < x1) & (y0 <= pixels[:, 1]) & (pixels[:, 1] < y1)]
+              for pixels in remaining]
+    framebuffer.rebuild_region(rect, np.concatenate(inside))
+
+    expected = Framebuffer(WIDTH, HEIGHT, tiled=tiled)
+    for pixels in remaining:
+        expected.commit(pixels)
+    assert np.array_equal(framebuffer.read((0, 0, WIDTH, HEIGHT)), expected.read((0, 0, WIDTH, HEIGHT)))
+    assert np.array_equal(framebuffer.base_surface.read((0, 0, WIDTH, HEIGHT)),
+                          expected.base_surface.read((0, 0, WIDTH, HEIGHT)))
+
+
+def test_dirty_rect_covers_only_the_changed_region():
+    framebuffer = Framebuffer(WIDTH, HEIGHT)
+    assert framebuffer.take_dirty() == (0, 0, WIDTH, HEIGHT)
+    assert framebuffer.take_dirty() is None
+
+    framebuffer.commit([[10, 20, 255], [40, 25, 128], [-5, 22, 255]])
+    assert framebuffer.take_dirty() == (0, 20, 41, 26)
+
+    framebuffer.set_overlay([[100, 100, 255], [110, 105, 255]])
+    assert framebuffer.take_dirty() == (100, 100, 111, 106)
+    # Замена объекта отмечает и старую, и новую области
+    framebuffer.set_overlay([[200, 150, 255]])
+    assert framebuffer.take_dirty() == (100, 100, 201, 151)
+    framebuffer.set_overlay(None)
+    assert framebuffer.take_dirty() == (200, 150, 201, 151)
+
+    # Изменения за пределами буфера не отмечаются
+    framebuffer.commit([[WIDTH + 5, 10, 255]])
+    assert framebuffer.take_dirty() is None
+    framebuffer.rebuild_region((290, 190, 400, 400), [])
+    assert framebuffer.take_dirty() == (290, 190, WIDTH, HEIGHT)
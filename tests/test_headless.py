@@ -0,0 +1,99 @@
+import json
+import os
+import struct
+import subprocess
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENE = [
+    {"width": 40, "height": 30},
+    {"algorithm": "bresenham", "points": [[2, 5], [30, 5]]},
+    {"algorithm": "dda", "points": [[10, 10], [10, 25]], "color": [0, 0, 0, 128]},
+    {"algorithm": "circle", "points": [[20, 15], [20, 5]]},
+    {"algorithm": "unknown", "points": [[0, 0], [1, 1]]},
+]
+
+
+def write_scene(path):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("# тестовая сцена\n\n")
+        file.writelines(json.dumps(item) + "\n" for item in SCENE)
+
+
+def run_headless(*args):
+    """Запускает рендеринг в отдельном процессе и проверяет, что Qt не импортировался."""
+    code = ("import sys\n"
+            "from src.headless import main\n"
+            "status = main(sys.argv[1:])\n"
+            "assert not [name for name in sys.modules if name.startswith('PyQt')], 'Qt imported'\n"
+            "sys.exit(status)\n")
+    return subprocess.run([sys.executable, "-c", code, *args], cwd=ROOT, capture_output=True, text=True)
+
+
+def read_png(path):
+    """Разбирает PNG без фильтров (как его пишет write_png): размер и массив RGBA."""
+    with open(path, "rb") as file:
+        data = file.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position, chunks = 8, []
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        kind, body = data[position + 4:position + 8], data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:position + 12 + length])
+        assert crc == zlib.crc32(kind + body)
+        chunks.append((kind, body))
+        position += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[0][1][:10])
+    assert (chunks[0][0], chunks[-1][0], depth, color_type) == (b"IHDR", b"IEND", 8, 6)
+    rows = np.frombuffer(zlib.decompress(b"".join(body for kind, body in chunks if kind == b"IDAT")), np.uint8)
+    rows = rows.reshape(height, width * 4 + 1)
+    assert not rows[:, 0].any()
+    return width, height, rows[:, 1:].reshape(height, width, 4)
+
+
+def check_pixels(image, scale=1):
+    def pixel(x, y):
+        return image[y * scale + scale // 2, x * scale + scale // 2].tolist()
+
+    assert pixel(2, 5) == pixel(30, 5) == [0, 0, 0, 255]
+    assert pixel(31, 5) == pixel(0, 0) == [255, 255, 255, 255]
+    # Полупрозрачная линия поверх фона
+    assert pixel(10, 20) == [127, 127, 127, 255]
+    assert pixel(20, 25) == pixel(10, 15) == [0, 0, 0, 255]
+
+
+def test_render_to_png(tmp_path):
+    scene, output = tmp_path / "scene.jsonl", tmp_path / "scene.png"
+    write_scene(scene)
+    result = run_headless(str(scene), "-o", str(output))
+    # Фигура с неизвестным алгоритмом пропускается с сообщением и ненулевым кодом возврата
+    assert result.returncode == 1, result.stderr
+    assert "строка 7" in result.stderr and "3 фигур, 40x30" in result.stderr
+
+    width, height, image = read_png(output)
+    assert (width, height) == (40, 30)
+    check_pixels(image)
+
+
+@pytest.mark.parametrize("scale", [1, 3])
+def test_render_to_raw(tmp_path, scale):
+    scene, output = tmp_path / "scene.jsonl", tmp_path / "scene.rgba"
+    write_scene(scene)
+    result = run_headless(str(scene), "-o", str(output), "--scale", str(scale), "--width", "50")
+    assert result.returncode == 1, result.stderr
+
+    image = np.fromfile(output, dtype=np.uint8)
+    assert image.size == 50 * scale * 30 * scale * 4
+    check_pixels(image.reshape(30 * scale, 50 * scale, 4), scale)
+
+
+def test_strict_mode_stops_on_the_first_error(tmp_path):
+    scene = tmp_path / "scene.jsonl"
+    write_scene(scene)
+    result = run_headless(str(scene), "-o", str(tmp_path / "scene.png"), "--strict")
+    assert result.returncode != 0 and "строка 7" in result.stderr
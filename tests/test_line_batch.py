@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from src.drawing_algorithms.lines.batch import bresenham_lines, dda_lines, reference_lines, split_pixels, wu_lines
+from src.drawing_algorithms.lines.bresenham import bresenham_line
+from src.drawing_algorithms.lines.dda import dda_line
+from src.drawing_algorithms.lines.wu import wu_line
+
+# Вырожденные и граничные случаи: точка, горизонталь, вертикаль, диагональ,
+# крутые и пологие отрезки в обоих направлениях
+SPECIAL_SEGMENTS = [
+    ((0, 0), (0, 0)),
+    ((5, -3), (5, -3)),
+    ((0, 0), (9, 0)),
+    ((9, 4), (0, 4)),
+    ((2, 0), (2, 11)),
+    ((2, 11), (2, 0)),
+    ((0, 0), (7, 7)),
+    ((7, 7), (0, 0)),
+    ((0, 7), (7, 0)),
+    ((0, 0), (3, 10)),
+    ((3, 10), (0, 0)),
+    ((0, 0), (10, 3)),
+    ((10, 3), (0, 0)),
+    ((-4, 6), (5, -13)),
+    ((1, 1), (3, 2)),
+    ((0, 0), (1, 2)),
+    ((-1000, 250), (1000, -251)),
+]
+
+
+def random_segments(count=300, seed=0):
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(-200, 200, (count, 2))
+    return np.stack([starts, starts + rng.integers(-60, 61, (count, 2))], axis=1)
+
+
+SEGMENTS = np.concatenate([np.array(SPECIAL_SEGMENTS), random_segments()])
+
+# Прямоугольники отсечения: частично видимые отрезки, пустой и вмещающий все отрезки
+CLIPS = [(-50, -40, 60, 70), (0, 0, 1, 1), (10, 10, 10, 20), (-2000, -2000, 2000, 2000)]
+
+
+def baseline_dda(start, end):
+    """Исходный цикл ЦДА с накоплением координат (вырожденный отрезок -- один пиксель)."""
+    (x1, y1), (x2, y2) = start, end
+    steps = max(abs(x2 - x1), abs(y2 - y1))
+    if steps == 0:
+        return [start]
+    x_increment, y_increment = (x2 - x1) / steps, (y2 - y1) / steps
+    x, y = x1, y1
+    pixels = []
+    for _ in range(steps + 1):
+        pixels.append((round(x), round(y)))
+        x += x_increment
+        y += y_increment
+    return pixels
+
+
+def scalar_dda(start, end, clip=None):
+    # dda_line не определена для вырожденного отрезка; пакетная версия даёт один пиксель
+    if start == end:
+        return [start] if clip is None or (clip[0] <= start[0] < clip[2] and clip[1] <= start[1] < clip[3]) else []
+    return dda_line(start, end, clip=clip)
+
+
+@pytest.mark.parametrize("batch, scalar", [(bresenham_lines, bresenham_line), (dda_lines, scalar_dda)],
+                         ids=["bresenham", "dda"])
+def test_batch_lines_match_scalar(batch, scalar):
+    coords, offsets = batch(SEGMENTS)
+    assert len(offsets) == len(SEGMENTS) + 1
+    for (start, end), pixels in zip(SEGMENTS.tolist(), split_pixels(coords, offsets)):
+        expected = [(int(x), int(y)) for x, y in scalar(tuple(start), tuple(end))]
+        assert [tuple(pixel) for pixel in pixels.tolist()] == expected, (start, end)
+
+
+def test_wu_lines_match_scalar_pixels_and_intensities():
+    pixels, offsets = wu_lines(SEGMENTS)
+    for (start, end), line in zip(SEGMENTS.tolist(), split_pixels(pixels, offsets)):
+        expected = [(int(x), int(y), int(alpha)) for x, y, alpha in wu_line(tuple(start), tuple(end))]
+        actual = list(zip(line["x"].tolist(), line["y"].tolist(), line["alpha"].tolist()))
+        assert actual == expected, (start, end)
+
+
+@pytest.mark.parametrize("clip", CLIPS)
+@pytest.mark.parametrize("batch, scalar", [(bresenham_lines, bresenham_line), (dda_lines, scalar_dda)],
+                         ids=["bresenham", "dda"])
+def test_clipped_batch_lines_match_scalar(batch, scalar, clip):
+    coords, offsets = batch(SEGMENTS, clip)
+    for (start, end), pixels in zip(SEGMENTS.tolist(), split_pixels(coords, offsets)):
+        full = [(int(x), int(y)) for x, y in scalar(tuple(start), tuple(end))]
+        expected = [(x, y) for x, y in full if clip[0] <= x < clip[2] and clip[1] <= y < clip[3]]
+        assert [(int(x), int(y)) for x, y in scalar(tuple(start), tuple(end), clip=clip)] == expected
+        assert [tuple(pixel) for pixel in pixels.tolist()] == expected, (start, end)
+
+
+@pytest.mark.parametrize("clip", CLIPS)
+def test_clipped_wu_lines_match_scalar(clip):
+    pixels, offsets = wu_lines(SEGMENTS, clip)
+    for (start, end), line in zip(SEGMENTS.tolist(), split_pixels(pixels, offsets)):
+        expected = [(int(x), int(y), int(alpha)) for x, y, alpha in wu_line(tuple(start), tuple(end), clip=clip)]
+        actual = list(zip(line["x"].tolist(), line["y"].tolist(), line["alpha"].tolist()))
+        assert actual == expected, (start, end)
+
+
+# Отрезок, на котором вычисление x1 + i * dx / steps без накопления округляется иначе
+DDA_SEGMENTS = np.concatenate([SEGMENTS, [((-275, 22), (-276, -190))], random_segments(2000, seed=1)])
+
+
+def test_dda_matches_the_baseline_loop():
+    coords, offsets = dda_lines(DDA_SEGMENTS)
+    reference, reference_offsets = reference_lines("dda", DDA_SEGMENTS)
+    assert np.array_equal(offsets, reference_offsets)
+    assert np.array_equal(coords, reference)
+    for (start, end), pixels in zip(DDA_SEGMENTS.tolist(), split_pixels(coords, offsets)):
+        expected = baseline_dda(tuple(start), tuple(end))
+        assert scalar_dda(tuple(start), tuple(end)) == expected, (start, end)
+        assert [tuple(pixel) for pixel in pixels.tolist()] == expected, (start, end)
+
+
+@pytest.mark.parametrize("clip", CLIPS + [(-280, -90, -270, -80)])
+def test_clipped_dda_matches_the_baseline_loop(clip):
+    coords, offsets = dda_lines(DDA_SEGMENTS, clip)
+    for (start, end), pixels in zip(DDA_SEGMENTS.tolist(), split_pixels(coords, offsets)):
+        expected = [(x, y) for x, y in baseline_dda(tuple(start), tuple(end))
+                    if clip[0] <= x < clip[2] and clip[1] <= y < clip[3]]
+        assert scalar_dda(tuple(start), tuple(end), clip) == expected, (start, end)
+        assert [tuple(pixel) for pixel in pixels.tolist()] == expected, (start, end)
+
+
+@pytest.mark.parametrize("batch", [bresenham_lines, dda_lines, wu_lines])
+def test_empty_batch(batch):
+    pixels, offsets = batch(np.empty((0, 2, 2), dtype=np.int64))
+    assert len(pixels) == 0
+    assert offsets.tolist() == [0]
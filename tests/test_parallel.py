@@ -0,0 +1,54 @@
+import os
+import random
+
+import numpy as np
+
+from src.drawing_algorithms.cache import RasterCache
+from src.drawing_algorithms.parallel import ParallelRasterizer, rasterize_shapes
+
+SHARED_MEMORY_DIR = "/dev/shm"
+
+
+def random_shapes(count, seed=0):
+    """Случайные отрезки и окружности вперемешку, с повторами."""
+    rng = random.Random(seed)
+    shapes = []
+    for _ in range(count):
+        algorithm = rng.choice(["bresenham", "dda", "wu", "circle"])
+        points = [(rng.randint(-20, 120), rng.randint(-20, 120)) for _ in range(2)]
+        if points[0] == points[1]:
+            points[1] = (points[1][0] + 1, points[1][1])
+        shapes.append((algorithm, points))
+    return shapes + shapes[:count // 4]
+
+
+def shared_blocks():
+    return {name for name in os.listdir(SHARED_MEMORY_DIR) if name.startswith("psm_")}
+
+
+def test_rasterize_many_matches_rasterize():
+    shapes = random_shapes(300)
+    for clip in (None, (0, 0, 100, 100)):
+        pixels, counts = RasterCache().rasterize_many(shapes, clip)
+        single = RasterCache()
+        expected = [single.rasterize(algorithm, points, clip) for algorithm, points in shapes]
+        assert counts.tolist() == [len(part) for part in expected]
+        assert np.array_equal(pixels, np.concatenate(expected))
+
+
+def test_parallel_matches_sequential():
+    shapes = random_shapes(500)
+    expected, counts = rasterize_shapes(shapes, (0, 0, 100, 100))
+    with ParallelRasterizer(2, chunk_size=64) as rasterizer:
+        pixels, offsets = rasterizer.rasterize(shapes, (0, 0, 100, 100))
+    assert np.array_equal(pixels, expected)
+    assert np.array_equal(np.diff(offsets), counts)
+
+
+def test_abandoned_map_releases_shared_memory():
+    before = shared_blocks()
+    with ParallelRasterizer(2, chunk_size=16) as rasterizer:
+        parts = rasterizer.map(random_shapes(400))
+        next(parts)
+        parts.close()
+    assert shared_blocks() <= before
@@ -0,0 +1,129 @@
+import math
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from polygon.fill_algorithms.active_edge import active_edge_spans
+from polygon.fill_algorithms.edge_list import edge_list_spans, fill_edge_list
+from polygon.fill_algorithms.spans import span_pixel_count, spans_to_points
+from polygon.fill_algorithms.vectorized import (EVEN_ODD, NONZERO, fill_numpy_nonzero, fill_polygon, polygon_mask,
+                                                polygon_spans)
+
+
+class Polygon:
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+
+# Спаны active_edge_spans на точных половинах (половины округляются вверх); до перехода
+# на целочисленный шаг строки 1 у второго и строки 1, 3 и 5 у третьего многоугольника
+# начинались или заканчивались на пиксель раньше
+PINNED = [
+    ([(0, 0), (3, 2), (0, 4)], [[0, 0, 0], [1, 0, 2], [2, 0, 3], [3, 0, 2]]),
+    ([(0, 0), (5, 2), (1, 6), (-3, 2)], [[0, 0, 0], [1, -1, 3], [2, -3, 5], [3, -2, 4], [4, -1, 3], [5, 0, 2]]),
+    ([(1, 0), (4, 6), (-2, 6)], [[0, 1, 1], [1, 1, 2], [2, 0, 2], [3, 0, 3], [4, -1, 3], [5, -1, 4]]),
+]
+
+
+def reference_spans(vertices, to_int):
+    """Спаны по правилу чётности в точной рациональной арифметике."""
+    spans = []
+    n = len(vertices)
+    ys = [y for _, y in vertices]
+    for y in range(min(ys), max(ys)):
+        crossings = []
+        for i in range(n):
+            (x1, y1), (x2, y2) = vertices[i], vertices[(i + 1) % n]
+            if y1 == y2:
+                continue
+            if y1 > y2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            if y1 <= y < y2:
+                crossings.append(x1 + Fraction((x2 - x1) * (y - y1), y2 - y1))
+        crossings.sort()
+        spans.extend([y, to_int(left), to_int(right)] for left, right in zip(crossings[::2], crossings[1::2]))
+    return spans
+
+
+@pytest.mark.parametrize("vertices, spans", PINNED)
+def test_active_edge_spans_at_half_crossings(vertices, spans):
+    assert active_edge_spans(Polygon(vertices)).tolist() == spans
+
+
+@pytest.mark.parametrize("fill, to_int", [(active_edge_spans, lambda x: math.floor(x + Fraction(1, 2))),
+                                          (edge_list_spans, int)], ids=["active_edge", "edge_list"])
+def test_spans_match_exact_reference(fill, to_int):
+    rng = random.Random(0)
+    for _ in range(300):
+        vertices = [(rng.randint(-40, 40), rng.randint(-40, 40)) for _ in range(rng.randint(3, 9))]
+        assert fill(Polygon(vertices)).tolist() == reference_spans(vertices, to_int), vertices
+
+
+# Пентаграмма: центральный пятиугольник обходится дважды; квадрат, обойдённый два раза
+STAR = [(50, 0), (79, 90), (2, 35), (98, 35), (21, 90)]
+DOUBLE_SQUARE = [(0, 0), (20, 0), (20, 20), (0, 20), (0, 1), (20, 1), (20, 20), (0, 20)]
+
+
+def reference_nonzero_pixels(vertices):
+    """Пиксели по правилу ненулевого индекса в точной рациональной арифметике (пересечения отбрасываются к целому)."""
+    pixels = set()
+    n = len(vertices)
+    ys = [y for _, y in vertices]
+    for y in range(min(ys), max(ys)):
+        crossings = []
+        for i in range(n):
+            (x1, y1), (x2, y2) = vertices[i], vertices[(i + 1) % n]
+            if y1 == y2:
+                continue
+            direction = 1 if y2 > y1 else -1
+            if y1 > y2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            if y1 <= y < y2:
+                crossings.append((x1 + Fraction((x2 - x1) * (y - y1), y2 - y1), direction))
+        crossings.sort(key=lambda crossing: crossing[0])
+        winding = 0
+        for x, direction in crossings:
+            if winding == 0:
+                left = x
+            winding += direction
+            if winding == 0:
+                pixels.update((column, y) for column in range(int(left), int(x) + 1))
+    return pixels
+
+
+def test_even_odd_and_nonzero_differ_on_self_intersections():
+    # Центр звезды обходится дважды: по чётности он пуст, по ненулевому индексу закрашен
+    even_odd = polygon_mask(STAR, (100, 100), EVEN_ODD)
+    nonzero = polygon_mask(STAR, (100, 100), NONZERO)
+    assert even_odd[50, 50] == 0 and nonzero[50, 50] == 1
+    assert even_odd[10, 50] == 1 and nonzero[10, 50] == 1
+    assert (nonzero >= even_odd).all() and nonzero.sum() > even_odd.sum()
+
+    # Наложенные контуры: по чётности внутри остаётся только строка, покрытая одним обходом
+    # (от совпавших пар пересечений -- пиксели на самих рёбрах, спаны включают x_end)
+    even_odd = polygon_mask(DOUBLE_SQUARE, (30, 30), EVEN_ODD)
+    nonzero = polygon_mask(DOUBLE_SQUARE, (30, 30), NONZERO)
+    assert even_odd[0, :21].all() and not even_odd[1:, 1:20].any()
+    assert nonzero[:20, :21].all() and not nonzero[20:].any()
+
+
+@pytest.mark.parametrize("vertices", [STAR, DOUBLE_SQUARE], ids=["star", "double_square"])
+def test_vectorized_fill_matches_edge_list_and_winding_reference(vertices):
+    assert polygon_spans(vertices, EVEN_ODD).tolist() == edge_list_spans(Polygon(vertices)).tolist()
+    assert set(fill_numpy_nonzero(Polygon(vertices))) == reference_nonzero_pixels(vertices)
+
+    target = np.zeros((120, 120, 4), dtype=np.uint8)
+    count = fill_polygon(target, vertices, (1, 2, 3, 255), EVEN_ODD, origin=(-5, -5))
+    assert count == span_pixel_count(edge_list_spans(Polygon(vertices)))
+    filled = {(x - 5, y - 5) for y, x in zip(*np.nonzero(target[..., 3]))}
+    assert filled == set(fill_edge_list(Polygon(vertices)))
+
+
+def test_vectorized_fill_matches_references_on_random_polygons():
+    rng = random.Random(1)
+    for _ in range(300):
+        vertices = [(rng.randint(-40, 40), rng.randint(-40, 40)) for _ in range(rng.randint(3, 9))]
+        assert polygon_spans(vertices, EVEN_ODD).tolist() == edge_list_spans(Polygon(vertices)).tolist(), vertices
+        assert set(spans_to_points(polygon_spans(vertices, NONZERO))) == reference_nonzero_pixels(vertices), vertices
@@ -0,0 +1,51 @@
+import gc
+import os
+
+import numpy as np
+import pytest
+
+import src.model.project as project_module
+from src.model.base import create_record
+from src.model.project import load_project, save_project
+from src.model.scene import Scene
+from src.raster.framebuffer import Framebuffer
+
+
+def mapped_files():
+    gc.collect()
+    return {os.path.realpath(obj.filename) for obj in gc.get_objects()
+            if isinstance(obj, np.memmap) and obj.filename is not None}
+
+
+@pytest.mark.parametrize("tiled", [False, True], ids=["dense", "tiled"])
+def test_save_over_the_open_project(tmp_path, monkeypatch, tiled):
+    path = str(tmp_path / "drawing.giis")
+    scene = Scene()
+    framebuffer = Framebuffer(600, 500, tiled=tiled)
+    for points in ([(10, 10), (590, 480)], [(300, 250), (300, 400)]):
+        index = scene.append(create_record("bresenham" if points[0][0] == 10 else "circle", points))
+        framebuffer.commit(scene.pixels(index))
+    save_project(path, scene, framebuffer)
+
+    project = load_project(path)
+    opened = Framebuffer(project.width, project.height, tiled=tiled, open_raster=project.raster,
+                         tile_map=project.tile_map)
+    expected = np.array(opened.read((0, 0, 600, 500)))
+    assert opened.maps(path)
+
+    # Файл заменяется, только когда ни один слой его не отображает
+    replace = os.replace
+
+    def checked_replace(source, target):
+        assert os.path.realpath(target) not in mapped_files()
+        replace(source, target)
+
+    monkeypatch.setattr(project_module.os, "replace", checked_replace)
+    del project
+    opened.release()
+    assert not opened.maps(path)
+    saved = save_project(path, scene, opened)
+    opened.reopen(saved.raster, saved.tile_map)
+
+    assert opened.maps(path)
+    assert np.array_equal(opened.read((0, 0, 600, 500)), expected)
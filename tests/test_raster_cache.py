@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.drawing_algorithms.cache import RASTERIZERS, TRANSLATION_INVARIANT, RasterCache
+
+# Количество контрольных точек фигуры (у остальных алгоритмов -- две)
+POINT_COUNTS = {"hermite": 4, "bezier": 4, "b-spline": 4, "bezier-chain": 7, "b-spline-chain": 6,
+                "catmull-rom-chain": 6}
+
+
+def random_shape(rng, algorithm):
+    """Случайная невырожденная фигура алгоритма вблизи начала координат."""
+    while True:
+        points = [(rng.randint(-30, 30), rng.randint(-30, 30)) for _ in range(POINT_COUNTS.get(algorithm, 2))]
+        if algorithm == "parabola" and points[0][1] == points[1][1]:
+            continue
+        if len(points) == 2 and points[0] == points[1]:
+            continue
+        return points
+
+
+def translate(algorithm, points, dx, dy):
+    moved = [(x + dx, y + dy) for x, y in points]
+    if algorithm == "hermite":
+        # Касательные кривой Эрмита -- векторы и не сдвигаются
+        moved[2:] = points[2:]
+    return moved
+
+
+def as_pixels(pixels):
+    """Пиксели [x, y, alpha] в порядке сортировки (у алгоритмов без альфа-канала alpha = 255)."""
+    array = np.asarray(pixels, dtype=np.int64).reshape(len(pixels), -1)
+    if array.shape[1] == 2:
+        array = np.c_[array, np.full(len(array), 255)]
+    return array[np.lexsort(array.T[::-1])]
+
+
+@pytest.mark.parametrize("algorithm", sorted(RASTERIZERS))
+def test_cached_raster_matches_direct_call_after_translation(algorithm):
+    rng = random.Random(algorithm)
+    cache = RasterCache()
+    for _ in range(60):
+        points = random_shape(rng, algorithm)
+        for dx, dy in [(0, 0), (1, 1), (rng.randint(-5000, 5000), rng.randint(-5000, 5000))]:
+            moved = translate(algorithm, points, dx, dy)
+            expected = as_pixels(RASTERIZERS[algorithm](moved, None))
+            np.testing.assert_array_equal(as_pixels(cache.rasterize(algorithm, moved)), expected,
+                                          err_msg=f"{algorithm} {moved}")
+
+
+def test_dda_is_keyed_on_absolute_coordinates():
+    cache = RasterCache()
+    first = cache.rasterize("dda", [(0, 0), (2, 1)])
+    second = cache.rasterize("dda", [(1, 1), (3, 2)])
+    assert cache.cache_info().misses == 2
+    np.testing.assert_array_equal(as_pixels(second), as_pixels(RASTERIZERS["dda"]([(1, 1), (3, 2)], None)))
+    assert not np.array_equal(as_pixels(first) + [1, 1, 0], as_pixels(second))
+
+
+def test_translation_invariant_shapes_share_an_entry():
+    cache = RasterCache()
+    for algorithm in sorted(TRANSLATION_INVARIANT):
+        points = [(0, 0), (7, 5)]
+        cache.rasterize(algorithm, points)
+        cache.rasterize(algorithm, translate(algorithm, points, 101, -37))
+    assert cache.cache_info().hits == len(TRANSLATION_INVARIANT)
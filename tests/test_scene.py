@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from src.model.base import BaseObject, Point, RGBA
+from src.model.scene import Scene, rasterize, rasterize_bands
+
+SHAPES = {
+    "bresenham": [(-30, 5), (260, 190)],
+    "wu": [(-30, 5), (260, 190)],
+    "dda": [(10, 300), (200, -40)],
+    "circle": [(100, 100), (100, 230)],
+    "hyperbola": [(100, 100), (140, 160)],
+    "bezier-chain": [(0, 0), (80, 300), (160, -50), (220, 120), (250, 200), (-20, 260), (120, 40)],
+    "catmull-rom-chain": [(0, 0), (80, 300), (160, -50), (220, 120), (250, 200), (-20, 260)],
+}
+
+
+def make_record(algorithm, points):
+    return BaseObject(main_points=[Point(x, y) for x, y in points], pixels=[], params={"algorithm": algorithm},
+                      color=RGBA(0, 0, 0), layer=0)
+
+
+def by_rows(pixels):
+    """Пиксели, упорядоченные по строкам с сохранением порядка внутри строки."""
+    return pixels[np.argsort(pixels[:, 1], kind="stable")]
+
+
+@pytest.mark.parametrize("algorithm", sorted(SHAPES))
+def test_bands_split_the_clipped_shape(algorithm):
+    record = make_record(algorithm, SHAPES[algorithm])
+    clip = (-1, -1, 201, 201)
+    bands = [band for band in rasterize_bands(record, clip, 16) if len(band)]
+    for upper, lower in zip(bands, bands[1:]):
+        assert upper[:, 1].max() < lower[:, 1].min()
+    assert all(np.ptp(band[:, 1]) < 16 for band in bands)
+    pixels = np.concatenate(bands) if bands else np.empty((0, 3), dtype=np.int32)
+    assert np.array_equal(by_rows(pixels), by_rows(rasterize(record, clip=clip)))
+
+
+def test_taken_shape_keeps_its_pixels_until_popped():
+    scene = Scene()
+    for algorithm in ("circle", "bresenham"):
+        scene.append(make_record(algorithm, SHAPES[algorithm]))
+    expected = scene.pixels(-1)
+
+    index = scene.take_last()
+    assert len(scene) == 1 and len(scene.removed) == 1
+    assert scene.removed.object_size(index) == len(expected)
+    assert np.array_equal(scene.removed.pixels(index, stop=10), expected[:10])
+
+    pixels, record = scene.pop_removed()
+    assert np.array_equal(pixels, expected)
+    assert record.params["algorithm"] == "bresenham"
+    assert len(scene.removed) == 0
+
+
+def inside(pixels, rect):
+    x0, y0, x1, y1 = rect
+    return pixels[(x0 <= pixels[:, 0]) & (pixels[:, 0] < x1) & (y0 <= pixels[:, 1]) & (pixels[:, 1] < y1)]
+
+
+@pytest.mark.parametrize("rect", [(40, 40, 90, 120), (-10, -10, 20, 20), (300, 300, 400, 400)])
+def test_pixels_in_rect_are_clipped_to_the_rect(rect):
+    scene = Scene()
+    for algorithm in ("circle", "bresenham", "dda", "bezier-chain"):
+        scene.append(make_record(algorithm, SHAPES[algorithm]))
+    expected = [inside(scene.pixels(index), rect) for index in scene.shapes_in_rect(rect)]
+    expected = np.concatenate(expected) if expected else np.empty((0, 3), dtype=np.int32)
+    assert np.array_equal(by_rows(scene.pixels_in_rect(rect)), by_rows(expected))
+
+
+def test_removed_shape_is_rasterized_inside_the_clip():
+    scene = Scene()
+    scene.append(make_record("circle", [(100, 5000), (100, 100)]))
+    full = scene.pixels(0)
+    clip = (0, 0, 200, 200)
+
+    pixels, record = scene.remove_last(clip)
+    assert len(scene) == 0 and record.params["algorithm"] == "circle"
+    assert 0 < len(pixels) < len(full) // 100
+    assert np.array_equal(by_rows(pixels), by_rows(inside(full, clip)))
@@ -0,0 +1,114 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from polygon.fill_algorithms.boundary import BoundaryBitmap
+from polygon.fill_algorithms.points_check import find_inner_point, point_in_polygon
+from polygon.fill_algorithms.scanline_seed import fill_scanline_seed, scanline_seed_spans
+from polygon.fill_algorithms.simple_seed import fill_simple_seed, simple_seed_mask, simple_seed_spans
+from polygon.fill_algorithms.spans import mask_to_spans, span_pixel_count, spans_to_points
+from src.drawing_algorithms.lines.bresenham import bresenham_line
+
+
+class Polygon:
+    def __init__(self, vertices):
+        self.vertices = vertices
+
+
+RECTANGLE = [(0, 0), (20, 0), (20, 10), (0, 10)]
+# Буква U: выемка x 6..14, y 0..15 лежит внутри охватывающего прямоугольника, но вне многоугольника
+U_SHAPE = [(0, 0), (6, 0), (6, 15), (14, 15), (14, 0), (20, 0), (20, 25), (0, 25)]
+TRIANGLE = [(3, 2), (60, 20), (10, 45)]
+# Невыпуклые многоугольники с наклонными рёбрами; у буквы C центр масс вершин лежит вне её
+ARROW = [(0, 20), (30, 0), (60, 20), (30, 10)]
+C_SHAPE = [(0, 0), (40, 0), (40, 40), (0, 40), (0, 34), (34, 34), (34, 6), (0, 6)]
+STAR = [(50, 0), (61, 35), (98, 35), (68, 57), (79, 90), (50, 69), (21, 90), (32, 57), (2, 35), (39, 35)]
+
+# Многоугольник -> количество пикселей заливки (внутренность без растра границы)
+SHAPES = {
+    "rectangle": (RECTANGLE, 19 * 9),
+    "u_shape": (U_SHAPE, 19 * 24 - 9 * 15),
+    "triangle": (TRIANGLE, None),
+    "arrow": (ARROW, None),
+    "c_shape": (C_SHAPE, None),
+    "star": (STAR, None),
+}
+
+
+def reference_fill(vertices, seed):
+    """4-связная заливка в ширину по множеству пикселей границы, построенной скалярным Брезенхемом."""
+    boundary = set()
+    for start, end in zip(vertices, vertices[1:] + vertices[:1]):
+        boundary.update(bresenham_line(start, end))
+    xs, ys = [x for x, _ in vertices], [y for _, y in vertices]
+    filled, queue = {seed}, deque([seed])
+    while queue:
+        x, y = queue.popleft()
+        for point in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (point not in filled and point not in boundary
+                    and min(xs) <= point[0] <= max(xs) and min(ys) <= point[1] <= max(ys)):
+                filled.add(point)
+                queue.append(point)
+    return filled
+
+
+@pytest.mark.parametrize("name", sorted(SHAPES))
+def test_seed_fills_flood_the_interior(name):
+    vertices, count = SHAPES[name]
+    polygon = Polygon(vertices)
+    seed = find_inner_point(vertices, BoundaryBitmap(vertices))
+    expected = reference_fill(vertices, seed)
+
+    simple = fill_simple_seed(polygon)
+    scanline = fill_scanline_seed(polygon)
+    assert set(simple) == expected and len(simple) == len(expected)
+    assert set(scanline) == expected and len(scanline) == len(expected)
+    assert span_pixel_count(simple_seed_spans(polygon)) == len(expected)
+    assert span_pixel_count(scanline_seed_spans(polygon)) == len(expected)
+    if count is not None:
+        assert len(expected) == count
+
+    # Заливка не выходит за границу: все пиксели внутри многоугольника
+    assert all(point_in_polygon(point, vertices) for point in expected)
+
+
+def test_seed_fill_does_not_leak_into_the_notch():
+    simple = set(fill_simple_seed(Polygon(U_SHAPE)))
+    scanline = set(fill_scanline_seed(Polygon(U_SHAPE)))
+    notch = {(x, y) for x in range(6, 15) for y in range(0, 16)}
+    assert not simple & notch and not scanline & notch
+    assert {(x, y) for x in range(1, 20) for y in range(16, 25)} <= simple
+
+
+def test_simple_seed_mask_covers_the_bounding_box():
+    mask, origin = simple_seed_mask(Polygon(U_SHAPE))
+    assert mask.shape == (26, 21) and origin == (0, 0)
+    assert not mask[0].any() and not mask[:, 0].any() and not mask[-1].any() and not mask[:, -1].any()
+
+
+def test_mask_spans_round_trip():
+    rng = np.random.default_rng(0)
+    mask = rng.random((37, 53)) < 0.4
+    mask[5] = True
+    mask[6] = False
+    origin = (-7, 12)
+    spans = mask_to_spans(mask, origin)
+    rows, columns = np.nonzero(mask)
+    expected = [(int(x) + origin[0], int(y) + origin[1]) for y, x in zip(rows, columns)]
+    assert spans_to_points(spans) == expected
+    assert spans_to_points(spans, as_array=True).tolist() == [list(point) for point in expected]
+    assert span_pixel_count(spans) == int(mask.sum())
+    assert spans[spans[:, 0] == 5 + origin[1]].tolist() == [[5 + origin[1], origin[0], 52 + origin[0]]]
+
+
+def test_inner_point_when_the_centroid_is_outside():
+    cx = sum(x for x, _ in C_SHAPE) / len(C_SHAPE)
+    cy = sum(y for _, y in C_SHAPE) / len(C_SHAPE)
+    assert not point_in_polygon((cx, cy), C_SHAPE)
+
+    boundary = BoundaryBitmap(C_SHAPE)
+    seed = find_inner_point(C_SHAPE, boundary)
+    assert seed is not None
+    assert point_in_polygon(seed, C_SHAPE) and not boundary.is_boundary(*seed)
+    assert point_in_polygon(find_inner_point(C_SHAPE), C_SHAPE)
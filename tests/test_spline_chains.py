@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from src.drawing_algorithms.curves.chains import draw_spline_chain
+
+CLIPS = [(-20, -20, 40, 40), (100, 100, 140, 160), (0, 0, 1, 1), (-1000, -1000, 1000, 1000)]
+
+
+def random_chain(rng, kind):
+    count = 3 * int(rng.integers(1, 6)) + 1 if kind == "bezier" else int(rng.integers(4, 12))
+    return rng.integers(-150, 250, (count, 2)).tolist()
+
+
+@pytest.mark.parametrize("clip", CLIPS)
+@pytest.mark.parametrize("kind", ["bezier", "b-spline", "catmull-rom"])
+def test_clipped_chain_matches_clipped_full_chain(kind, clip):
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        control = random_chain(rng, kind)
+        full = draw_spline_chain(control, kind)
+        expected = [(x, y) for x, y in full if clip[0] <= x < clip[2] and clip[1] <= y < clip[3]]
+        assert draw_spline_chain(control, kind, clip=clip) == expected, control
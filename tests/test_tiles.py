@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+
+from src.raster.framebuffer import Framebuffer
+from src.raster.surface import BACKGROUND, DenseSurface
+from src.raster.tiles import TiledSurface
+
+WIDTH, HEIGHT, TILE = 100, 70, 16
+
+
+def random_pixels(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.integers(-5, WIDTH + 5, count), rng.integers(-5, HEIGHT + 5, count),
+                            rng.integers(1, 256, count)])
+
+
+def test_evicted_tiles_round_trip_through_the_spill_file():
+    pixels = random_pixels(3000)
+    dense = DenseSurface(WIDTH, HEIGHT)
+    dense.composite(pixels)
+    tiled = TiledSurface(WIDTH, HEIGHT, tile_size=TILE, max_resident=3)
+    tiled.composite(pixels)
+
+    # В памяти не больше max_resident плиток, остальные сброшены в файл
+    assert len(tiled.resident) == 3
+    assert len(tiled.spilled) == len(np.unique(pixels[:, :2].clip(0) // TILE, axis=0)) - 3
+    spill_path = tiled.spill_path
+    assert os.path.exists(spill_path)
+
+    # Повторное наложение загружает плитки из файла и снова вытесняет их
+    tiled.composite(pixels[:500])
+    dense.composite(pixels[:500])
+    assert np.array_equal(tiled.read((0, 0, WIDTH, HEIGHT)), dense.read((0, 0, WIDTH, HEIGHT)))
+    assert len(tiled.resident) == 3
+
+    tiled.close()
+    assert not os.path.exists(spill_path)
+
+
+def test_export_writes_only_the_present_tiles():
+    tiled = TiledSurface(WIDTH, HEIGHT, tile_size=TILE, max_resident=2)
+    tiled.composite([[1, 1, 255], [40, 20, 128], [99, 69, 255], [70, 5, 64]])
+    target = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+
+    tile_map = tiled.export(target)
+    assert tile_map.shape == (5, 7)
+    assert sorted(zip(*np.nonzero(tile_map))) == [(0, 0), (0, 4), (1, 2), (4, 6)]
+    # Экспорт не загружает сброшенные плитки обратно в память
+    assert len(tiled.resident) == 2
+
+    reopened = TiledSurface(WIDTH, HEIGHT, tile_size=TILE, backing=target, backing_tiles=tile_map)
+    assert np.array_equal(reopened.read((0, 0, WIDTH, HEIGHT)), tiled.read((0, 0, WIDTH, HEIGHT)))
+    # Области без плиток в target не изменяются
+    assert not target[40:, :90].any()
+    tiled.close()
+
+
+def test_copy_from_matches_the_source_in_the_rect():
+    source = TiledSurface(WIDTH, HEIGHT, tile_size=TILE, max_resident=2)
+    source.composite(random_pixels(2000, seed=1))
+    target = TiledSurface(WIDTH, HEIGHT, tile_size=TILE)
+    target.composite(random_pixels(2000, seed=2))
+    before = target.read((0, 0, WIDTH, HEIGHT))
+
+    rect = (5, 3, 61, 50)
+    target.copy_from(source, rect)
+    x0, y0, x1, y1 = rect
+    expected = before.copy()
+    expected[y0:y1, x0:x1] = source.read(rect)
+    assert np.array_equal(target.read((0, 0, WIDTH, HEIGHT)), expected)
+
+    # Плитка, отсутствующая в источнике, становится фоном
+    empty = TiledSurface(WIDTH, HEIGHT, tile_size=TILE)
+    target.copy_from(empty, (0, 0, WIDTH, HEIGHT))
+    assert (target.read((0, 0, WIDTH, HEIGHT)) == BACKGROUND).all()
+    # Целиком покрытые фоном плитки освобождаются (у края холста плитки неполные и остаются)
+    assert all(tx == WIDTH // TILE or ty == HEIGHT // TILE for tx, ty in target.resident)
+
+    # Копирование из плотной поверхности
+    dense = DenseSurface(WIDTH, HEIGHT)
+    dense.composite(random_pixels(500, seed=3))
+    target.copy_from(dense, rect)
+    assert np.array_equal(target.read(rect), dense.read(rect))
+    source.close()
+
+
+def test_framebuffer_close_removes_the_spill_files():
+    framebuffer = Framebuffer(1000, 600, tiled=True, max_resident_tiles=1)
+    framebuffer.commit(random_pixels(1000) * [10, 10, 1])
+    paths = [framebuffer.base_surface.spill_path, framebuffer.surface.spill_path]
+    assert all(os.path.exists(path) for path in paths)
+
+    framebuffer.close()
+    assert not any(os.path.exists(path) for path in paths)